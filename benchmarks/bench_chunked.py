@@ -0,0 +1,86 @@
+"""
+Benchmark: memoria maximă (RSS) pentru load_sheet + validate_file vs.
+validate_chunked cu un buget de memorie; fiecare mod rulează într-un proces
+separat, iar rapoartele sunt comparate.
+
+    python benchmarks/bench_chunked.py                       # generează 200k x 14
+    python benchmarks/bench_chunked.py catalog.xlsx --sheet Catalog --memory-mb 256
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_xlsx_stream import generate
+
+
+def child(path, sheet, mode, memory_mb, out_path):
+    from catalog_loader import CatalogLoader
+    from check_result import report_to_json
+    from chunked import validate_chunked
+    from validator import validate_file
+
+    started = time.perf_counter()
+    catalog = CatalogLoader(path)
+    if mode == "full":
+        df = catalog.load_sheet(sheet)
+        mapped = {c: c for c in df.columns}
+        report = validate_file(df, catalog, extra_id_cols=["SKU", "EAN"], mapped_props=mapped)
+        report.pop("column_cache")
+    else:
+        header = next(catalog.iter_chunks(sheet, 1))[1]
+        mapped = {c: c for c in header.columns}
+        report = validate_chunked(catalog, sheet, extra_id_cols=["SKU", "EAN"],
+                                  mapped_props=mapped, memory_mb=memory_mb)
+        print(f"{'':>10}{report.pop('memory')}")
+    report.pop("timings")
+    report.pop("url_verdicts")
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode:>8}: {time.perf_counter() - started:8.2f}s  peak RSS {peak_mb:8.1f} MB")
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(report_to_json(report))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--sheet", default="Catalog")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--memory-mb", type=int, default=256)
+    parser.add_argument("--child", choices=["full", "chunked"], help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.path, args.sheet, args.child, args.memory_mb, args.out)
+        return
+
+    path = args.path
+    if not path:
+        path = os.path.join(tempfile.gettempdir(), f"bench_catalog_{args.rows}.xlsx")
+        if not os.path.exists(path):
+            print(f"Generating {path} ({args.rows} rows)…")
+            generate(path, args.rows)
+    print(f"{path}: budget {args.memory_mb} MB")
+
+    reports = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("full", "chunked"):
+            out = os.path.join(tmp, f"{mode}.json")
+            subprocess.run([sys.executable, os.path.abspath(__file__), path, "--sheet", args.sheet,
+                            "--memory-mb", str(args.memory_mb), "--child", mode, "--out", out],
+                           check=True)
+            with open(out, encoding="utf-8") as f:
+                reports.append(json.load(f))
+    assert reports[0] == reports[1], "chunked report differs from the full one"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Benchmark: Data Format Checks (group_b) cu bucla veche, regulă cu regulă
+(pre-scan HTML + câte o trecere per regulă), vs. DataFormatScanner (o
+singură vizită per celulă) și varianta "vectorized" de mai jos (operații
+str.* pe coloană întreagă), păstrată doar aici ca referință: aceleași
+hit-uri, dar mai lentă cu pandas pe str Python.
+
+Foaia e generată direct în memorie, fără .xlsx, ca să fie măsurat doar scanarea.
+
+    python benchmarks/bench_format_scanner.py                  # 100k x 10 = 1M celule
+    python benchmarks/bench_format_scanner.py --rows 250000 --cols 8
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import pandas as pd
+from openpyxl.utils import get_column_letter
+
+from format_scanner import _PREFILTER, CHECK_NAMES, DEMO_PATTERN, HTML_PATTERN, SPECIAL_CHARS, DataFormatScanner
+
+# str.extractall cere un grup de captură
+DEMO_GROUP = re.compile(r'(' + DEMO_PATTERN.pattern + r')', re.IGNORECASE)
+HTML_GROUP = re.compile(r'(' + HTML_PATTERN.pattern + r')')
+NO_ROWS = np.empty(0, dtype=np.int64)
+
+SAMPLES = [
+    "Running shoe with breathable mesh upper",
+    "Product name 12345",
+    "https://shop.example.com/p/12345",
+    "Brand",
+    "4006381333931",
+    "Shoes > Sneakers",
+    "demo",
+    "Price in €",
+    "<b>Bold</b> description",
+    "=SUM(A1:A3)",
+    "support@example.com",
+    "",
+]
+WEIGHTS = [30, 20, 15, 10, 10, 10, 1, 1, 1, 1, 1, 5]
+
+
+class FrameCatalog:
+    """Minimul din interfața CatalogLoader de care are nevoie group_b."""
+
+    def __init__(self, df):
+        self.sheet_name = "Catalog"
+        self.df = df
+        self.header_letters = {
+            header: get_column_letter(i) for i, header in enumerate(df.columns, start=1)
+        }
+
+    def column(self, col_letter):
+        pos = list(self.header_letters.values()).index(col_letter)
+        return self.df.iloc[:, pos]
+
+    def column_values(self, col_letter):
+        return self.column(col_letter).fillna("").astype(str).tolist()
+
+
+def make_frame(rows, cols, seed=0):
+    rng = random.Random(seed)
+    data = {
+        f"Column {c}": rng.choices(SAMPLES, weights=WEIGHTS, k=rows)
+        for c in range(1, cols + 1)
+    }
+    return pd.DataFrame(data, dtype=str)
+
+
+def legacy_group_b(df, catalog):
+    """Bucla dinaintea DataFormatScanner (aceeași logică, aceleași rezultate)."""
+    checks = [
+        ("Demo Data",        re.compile(r'\bdemo(?:brand|sku|_category)?\b', re.IGNORECASE)),
+        ("Special Characters", set("©$€£¥™®@")),
+        ("Formulas",         "="),
+        ("HTML Tags",        re.compile(r'<[^>]+>|&lt;[^&]+&gt;'))
+    ]
+    header_to_letter = dict(catalog.header_letters)
+    html_pattern = re.compile(r'<[^>]+>|&lt;[^&]+&gt;')
+    html_fails = []
+    for header, col_letter in header_to_letter.items():
+        for row_num, raw in enumerate(catalog.column_values(col_letter), start=2):
+            text = raw.strip()
+            if text:
+                for tag in html_pattern.findall(text):
+                    html_fails.append((col_letter, row_num, tag))
+
+    counts = {}
+    for name, pattern in checks:
+        fails = list(html_fails) if name == "HTML Tags" else []
+        for header in df.columns:
+            col_letter = header_to_letter[header]
+            for row_num, raw in enumerate(catalog.column_values(col_letter), start=2):
+                text = raw.strip()
+                if not text:
+                    continue
+                if name == "Demo Data":
+                    for m in pattern.finditer(text):
+                        fails.append((col_letter, row_num, m.group(0)))
+                elif name == "Special Characters":
+                    for ch in pattern:
+                        for _ in range(text.count(ch)):
+                            fails.append((col_letter, row_num, ch))
+                elif name == "Formulas":
+                    if text.startswith("="):
+                        fails.append((col_letter, row_num, text))
+        counts[name] = len(fails)
+    return counts
+
+
+def scan_vectorized(catalog, col_letter):
+    """Hit-urile unei coloane ca DataFormatScanner.scan_column, cu operații .str pe coloana întreagă."""
+    text = catalog.column(col_letter).fillna("").astype(str).str.strip().reset_index(drop=True)
+
+    # 1) Formulas: textul întreg al celulelor care încep cu "="
+    is_formula = text.str.startswith("=").to_numpy(dtype=bool)
+    formulas = (np.flatnonzero(is_formula) + 2, text[is_formula].tolist())
+
+    # 2) prefiltrul, apoi extractorii exacți doar pe candidați
+    cand = text[text.str.contains(_PREFILTER).to_numpy(dtype=bool)]
+    if cand.empty:
+        return {"Demo Data": (NO_ROWS, []), "Special Characters": (NO_ROWS, []),
+                "Formulas": formulas, "HTML Tags": (NO_ROWS, [])}
+
+    # 3) Special Characters: matrice (celulă x caracter) de apariții,
+    #    desfăcută rând cu rând, în ordinea SPECIAL_CHARS
+    counts = np.column_stack([
+        cand.str.count(re.escape(ch)).to_numpy(dtype=np.int64) for ch in SPECIAL_CHARS
+    ]).ravel()
+    cand_rows = cand.index.to_numpy(dtype=np.int64) + 2
+    special = (
+        np.repeat(np.repeat(cand_rows, len(SPECIAL_CHARS)), counts),
+        np.repeat(np.tile(np.array(list(SPECIAL_CHARS)), len(cand)), counts).tolist(),
+    )
+    return {
+        "Demo Data": extract_all(cand, DEMO_GROUP),
+        "Special Characters": special,
+        "Formulas": formulas,
+        "HTML Tags": extract_all(cand, HTML_GROUP),
+    }
+
+
+def extract_all(text, pattern):
+    """(rânduri Excel, potriviri) pentru toate potrivirile lui pattern, în ordine."""
+    found = text.str.extractall(pattern)
+    if found.empty:
+        return NO_ROWS, []
+    rows = found.index.get_level_values(0).to_numpy(dtype=np.int64) + 2
+    return rows, found[0].tolist()
+
+
+def scanner_fails(catalog, letters):
+    scanner = DataFormatScanner(catalog)
+    return {name: scanner.fails(name, letters) for name in CHECK_NAMES}
+
+
+def vectorized_fails(catalog, letters):
+    """Ca DataFormatScanner.fails, pentru toate regulile, din scan_vectorized."""
+    columns = [scan_vectorized(catalog, letter) for letter in letters]
+    return {
+        name: [
+            (letter, row, snippet)
+            for letter, found in zip(letters, columns)
+            for row, snippet in zip(found[name][0].tolist(), found[name][1])
+        ]
+        for name in CHECK_NAMES
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=10)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.cols)
+    catalog = FrameCatalog(df)
+    print(f"{args.rows:,} rows x {args.cols} cols = {args.rows * args.cols:,} cells")
+
+    start = time.perf_counter()
+    legacy = legacy_group_b(df, catalog)
+    t_legacy = time.perf_counter() - start
+
+    print(f"    legacy: {t_legacy:8.2f}s  fail counts {legacy}")
+
+    letters = list(catalog.header_letters.values())
+    reference = None
+    for label, run in (("scanner", scanner_fails), ("vectorized", vectorized_fails)):
+        start = time.perf_counter()
+        hits = run(catalog, letters)
+        elapsed = time.perf_counter() - start
+
+        counts = {name: len(found) for name, found in hits.items()}
+        assert counts == legacy, (label, counts, legacy)
+        if reference is None:
+            reference = hits
+        assert hits == reference, f"{label}: hits differ"
+        print(f"{label:>10}: {elapsed:8.2f}s  ({t_legacy / elapsed:.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark: UrlReachability.probe pe un server HTTP local (stub, într-un
+proces separat), cu toate host-urile redirecționate prin resolve; a doua
+rulare trebuie să vină integral din cache-ul de pe disc.
+
+Căile stub-ului dau răspunsul așteptat, verificat la final:
+    /ok/…        200                /missing/…   404
+    /redirect/…  301 → /ok/…        /nohead/…    405 la HEAD, 206 la GET
+    /flaky/…     503 prima dată, apoi 200 (retry)
+    /slow/…      răspunde după timeout (Timeout), unul la 1000 de URL-uri
+
+    python benchmarks/bench_reachability.py                    # 100k URL-uri, 50 host-uri
+    python benchmarks/bench_reachability.py --urls 20000 --hosts 5 --per-host 20
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from url_reachability import UrlReachability
+
+KINDS = ["ok", "ok", "ok", "ok", "missing", "redirect", "nohead", "flaky"]
+EXPECTED = {
+    "ok": (True, 200), "missing": (False, 404), "redirect": (True, 200),
+    "nohead": (True, 206), "flaky": (True, 200), "slow": (False, 0),
+}
+
+
+def serve(ports, slow_seconds):
+    """Serverul stub: HTTP/1.1 cu keep-alive, un răspuns fără corp per cerere."""
+    seen = set()
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                method, target = head.decode("latin-1").split(" ", 2)[:2]
+                kind = target.split("/")[1]
+                headers = "Content-Length: 0\r\n"
+                if kind == "missing":
+                    status = "404 Not Found"
+                elif kind == "redirect":
+                    status = "301 Moved Permanently"
+                    headers += f"Location: /ok{target[len('/redirect'):]}\r\n"
+                elif kind == "nohead":
+                    status = "405 Method Not Allowed" if method == "HEAD" else "206 Partial Content"
+                elif kind == "flaky" and target not in seen:
+                    seen.add(target)
+                    status = "503 Service Unavailable"
+                else:
+                    if kind == "slow":
+                        await asyncio.sleep(slow_seconds)
+                    status = "200 OK"
+                writer.write(f"HTTP/1.1 {status}\r\n{headers}\r\n".encode("latin-1"))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def main():
+        server = await asyncio.start_server(handle, "127.0.0.1", 0, backlog=1024)
+        ports.put(server.sockets[0].getsockname()[1])
+        async with server:
+            await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--urls", type=int, default=100_000)
+    parser.add_argument("--hosts", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--per-host", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=2.0)
+    args = parser.parse_args()
+
+    ports = multiprocessing.Queue()
+    server = multiprocessing.Process(target=serve, args=(ports, args.timeout * 2), daemon=True)
+    server.start()
+    port = ports.get(timeout=30)
+
+    hosts = [f"img{h}.stub.test" for h in range(args.hosts)]
+    urls = [
+        f"http://{hosts[i % args.hosts]}/{'slow' if i % 1000 == 999 else KINDS[i % len(KINDS)]}/{i}.jpg"
+        for i in range(args.urls)
+    ]
+    # câteva URL-uri repetate / scrise diferit: deduplicate după forma canonică
+    urls += [url.replace("http://", "HTTP://") for url in urls[:1000]]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        checker = UrlReachability(
+            cache_path=os.path.join(tmp, "reachability.sqlite"),
+            concurrency=args.concurrency, per_host=args.per_host, timeout=args.timeout,
+            retries=1, resolve={host: ("127.0.0.1", port) for host in hosts},
+        )
+        for label in ("cold", "cached"):
+            started = time.perf_counter()
+            verdicts = checker.probe(urls)
+            print(f"{label:>8}: {time.perf_counter() - started:8.2f}s  {checker.report()}")
+
+    wrong = 0
+    for key, verdict in verdicts.items():
+        ok, status = EXPECTED[key.split("/")[3]]
+        wrong += (verdict.ok, verdict.status) != (ok, status)
+    server.terminate()
+    assert not wrong, f"{wrong} verdicts differ from the stub's expected answers"
+
+
+if __name__ == "__main__":
+    main()
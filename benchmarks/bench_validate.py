@@ -0,0 +1,145 @@
+"""
+Benchmark: validate_file secvențial vs. grupuri în paralel (thread pool,
+opțional grupurile grele pe process pool) și, cu --shards, pe shard-uri de
+rânduri în procese separate, cu durata fiecărui grup. Cu --triage N, și
+rularea de triaj (fiecare verificare oprită după N fail-uri), care trebuie
+să dea același rezultat (Check Outcome) pentru fiecare verificare. Cu
+--preview ROWS, și previzualizarea pe un eșantion de ROWS rânduri, cu câte
+verificări au același Check Outcome ca rularea completă (nu toate: un fail
+rar poate lipsi din eșantion). La final, pe primele rânduri, cazul cu un
+identificator secundar mapat pe altă coloană deși foaia are și coloana cu
+numele lui (header duplicat după redenumire): rularea completă, pe shard-uri
+și cu memo trebuie să dea același raport.
+
+    python benchmarks/bench_validate.py                        # generează 100k x 14
+    python benchmarks/bench_validate.py catalog.xlsx --sheet Catalog --workers 8
+    python benchmarks/bench_validate.py --workers 8 --processes
+    python benchmarks/bench_validate.py --rows 1000000 --shards 8
+    python benchmarks/bench_validate.py --rows 500000 --triage 10
+    python benchmarks/bench_validate.py --rows 500000 --preview 20000
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bench_xlsx_stream import generate
+from catalog_loader import CatalogLoader
+from preview import preview_file
+from triage import TriageScan
+from validation_memo import ValidationMemo
+from validator import HEAVY_GROUPS, validate_file
+
+DUPLICATE_ID_ROWS = 5000
+
+
+def run(catalog, df, workers, process_groups, shards=1, triage=None):
+    mapped = {c: c for c in df.columns}
+    report = validate_file(df, catalog, extra_id_cols=["SKU", "EAN"], mapped_props=mapped,
+                           workers=workers, process_groups=process_groups, shards=shards,
+                           triage=triage)
+    timings = report["timings"]
+    print(f"{timings['Mode']:>30}: total {timings['Total']:8.2f}s")
+    if "triage" in report:
+        stats = report["triage"]
+        print(f"{'':>32}{stats['Seconds']:8.2f}s  triage: {stats['Cells Read']:,} of "
+              f"{stats['Cells Total']:,} cells read, {len(stats['Lower Bound Checks'])} lower-bound checks")
+    if "Sharded" in timings:
+        print(f"{'':>32}{timings['Sharded']['Total']:8.2f}s  {timings['Sharded']['Shards']} shards")
+    for name, seconds in sorted(timings["Groups"].items(), key=lambda kv: -kv[1]):
+        print(f"{'':>32}{seconds:8.2f}s  {name}")
+    return report
+
+
+def check_duplicate_secondary_id(catalog, df):
+    """
+    "EAN" mapat pe "EAN Code" (prima coloană), cu "EAN" și în foaie: după
+    redenumire header-ul e duplicat, neadiacent (get_loc dă o mască).
+    """
+    df = df.head(DUPLICATE_ID_ROWS).copy()
+    df.insert(0, "EAN Code", ["1,2" if i % 7 == 3 else "x" for i in range(len(df))])
+    mapped = {c: c for c in df.columns if c != "EAN Code"}
+    mapped["EAN"] = "EAN Code"
+    memo = ValidationMemo()
+    reports = [
+        validate_file(df, catalog, extra_id_cols=["SKU"], mapped_props=mapped, **kwargs)
+        for kwargs in ({}, {"shards": 2}, {"memo": memo}, {"memo": memo})
+    ]
+    for report in reports:
+        for key in ("timings", "column_cache", "url_verdicts", "memo"):
+            report.pop(key, None)
+    for mode, report in zip(("sharded", "memo", "memo (reused)"), reports[1:]):
+        assert report == reports[0], f"duplicate secondary-ID header: {mode} report differs from the full run"
+    print(f"{'duplicate secondary ID':>30}: sharded / memo reports match the full run")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--sheet", default="Catalog")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--processes", action="store_true",
+                        help="trimite grupurile grele (HEAVY_GROUPS) pe un process pool")
+    parser.add_argument("--shards", type=int, default=0,
+                        help="rulează și validarea pe atâtea shard-uri de rânduri")
+    parser.add_argument("--triage", type=int, default=0, metavar="N",
+                        help="rulează și triajul, cu fiecare verificare oprită după N fail-uri")
+    parser.add_argument("--preview", type=int, default=0, metavar="ROWS",
+                        help="rulează și previzualizarea pe un eșantion de ROWS rânduri")
+    args = parser.parse_args()
+
+    path = args.path
+    if not path:
+        path = os.path.join(tempfile.gettempdir(), f"bench_catalog_{args.rows}.xlsx")
+        if not os.path.exists(path):
+            print(f"Generating {path} ({args.rows} rows)…")
+            generate(path, args.rows)
+
+    catalog = CatalogLoader(path)
+    df = catalog.load_sheet(args.sheet)
+    print(f"{path}: {df.shape[0]:,} rows x {df.shape[1]} cols, {os.cpu_count()} CPUs")
+
+    sequential = run(catalog, df, 1, ())
+    parallel = run(catalog, df, args.workers, HEAVY_GROUPS if args.processes else ())
+
+    reports = [parallel]
+    if args.shards > 1:
+        reports.append(run(catalog, df, args.workers, (), shards=args.shards))
+
+    triaged = run(catalog, df, 1, (), triage=TriageScan(args.triage)) if args.triage else None
+    preview = None
+    if args.preview:
+        preview = preview_file(df, catalog, {c: c for c in df.columns}, ["SKU", "EAN"], sample_rows=args.preview)
+        stats = preview["preview"]
+        print(f"{'preview':>30}: total {stats['Seconds']:8.2f}s  "
+              f"{stats['Sample Rows']:,} of {stats['Rows']:,} rows")
+
+    for report in [sequential] + reports:
+        report.pop("timings")
+        report.pop("column_cache")
+        report.pop("url_verdicts")
+    for report in reports:
+        assert report == sequential, "parallel report differs from the sequential one"
+    if triaged:
+        for group in sequential["validation_group_order"]:
+            outcomes = [check["Check Outcome"] for check in sequential[group]]
+            assert [check["Check Outcome"] for check in triaged[group]] == outcomes, \
+                f"triage outcomes differ from the full run in {group}"
+    if preview:
+        pairs = [
+            (full["Check Outcome"], estimated["Check Outcome"])
+            for group in preview["validation_group_order"]
+            for full, estimated in zip(sequential[group], preview[group])
+        ]
+        same = sum(full == estimated for full, estimated in pairs)
+        print(f"{'':>32}preview: {same} of {len(pairs)} check outcomes match the full run")
+
+    check_duplicate_secondary_id(catalog, df)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: citirea unei foi cu load_workbook + pd.read_excel (calea veche)
+vs. XlsxStream (citire în flux din zip).
+
+Fiecare variantă rulează într-un proces separat, ca vârful de memorie (peak RSS)
+să fie măsurat independent.
+
+    python benchmarks/bench_xlsx_stream.py                     # generează 100k x 14
+    python benchmarks/bench_xlsx_stream.py --rows 500000
+    python benchmarks/bench_xlsx_stream.py catalog.xlsx --sheet Catalog
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return float("nan")
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux raportează în KB, macOS în bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def generate(path, rows):
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Catalog")
+    ws.append([
+        "Country", "Brand", "Product ID", "Product Name (English)",
+        "Product Name (Local Language)", "Product Description (English)",
+        "Category", "Sub-Category", "Product Image URL", "Product URL",
+        "SKU", "EAN", "MAP", "MSRP",
+    ])
+    for i in range(rows):
+        ws.append([
+            "RO", "Brand", f"P{i}", f"Product name {i}", f"Nume produs {i}",
+            f"Description for product {i} " * 4, "Shoes", "Sneakers",
+            f"https://img.example.com/{i % 5000}.jpg", f"https://shop.example.com/p/{i}",
+            f"SKU-{i}", 4006381333931 + i, 19.99, 24.5,
+        ])
+    wb.save(path)
+
+
+def run_engine(engine, path, sheet):
+    start = time.perf_counter()
+    if engine == "openpyxl":
+        import pandas as pd
+        from openpyxl import load_workbook
+        wb = load_workbook(path, data_only=True)
+        df = pd.read_excel(wb, sheet_name=sheet, dtype=str, engine="openpyxl")
+        ws = wb[sheet]
+        # metadatele pe care le citeau verificările (hyperlink-uri per celulă)
+        for row in ws.iter_rows():
+            for cell in row:
+                cell.hyperlink
+        shape = df.shape
+    else:
+        from catalog_loader import CatalogLoader
+        catalog = CatalogLoader(path)
+        df = catalog.load_sheet(sheet)
+        shape = df.shape
+    elapsed = time.perf_counter() - start
+    print(f"{engine:>9}: {elapsed:8.2f}s  peak RSS {_peak_rss_mb():9.1f} MB  shape {shape}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", nargs="?")
+    parser.add_argument("--sheet", default="Catalog")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--engine", choices=["openpyxl", "stream"])
+    args = parser.parse_args()
+
+    if args.engine:
+        run_engine(args.engine, args.path, args.sheet)
+        return
+
+    path = args.path
+    if not path:
+        path = os.path.join(tempfile.gettempdir(), f"bench_catalog_{args.rows}.xlsx")
+        if not os.path.exists(path):
+            print(f"Generating {path} ({args.rows} rows)…")
+            generate(path, args.rows)
+
+    for engine in ("openpyxl", "stream"):
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), path, "--sheet", args.sheet, "--engine", engine],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
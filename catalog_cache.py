@@ -0,0 +1,228 @@
+"""
+Cache local pentru foile deja parsate, adresat după conținutul fișierului.
+
+Cheia unei intrări = sha256(conținut .xlsx) + numele foii, deci aceeași
+foaie re-validată (alt mapping, re-export, re-rulare) nu mai e parsată din
+XML: coloanele sunt mapate din blocuri .npy (np.load(mmap_mode="r")).
+
+Structura pe disc:
+    <cache_dir>/index.json              : intrări (size, last_access) + {cale: (size, mtime, sha256)}
+    <cache_dir>/<key>/data.npy          : textul UTF-8 al tuturor coloanelor, concatenat (uint8)
+    <cache_dir>/<key>/offsets.npy       : offset-uri în caractere per coloană (int64, ncols x nrows+1)
+    <cache_dir>/<key>/nulls.npy         : celule goale (bool, ncols x nrows)
+    <cache_dir>/<key>/meta.json         : coloane, header_letters, hidden rows/cols, hyperlinks
+
+Invalidare: hash-ul se recalculează doar când (size, mtime) ale fișierului se
+schimbă; dacă s-a schimbat și conținutul, intrările vechi ale acelei căi sunt
+șterse. Dimensiunea totală e plafonată (max_bytes), cu evacuare LRU.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".offline_catalog_validator", "cache")
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1 GB
+
+
+def file_sha256(path, block_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _dir_size(folder):
+    total = 0
+    for name in os.listdir(folder):
+        total += os.path.getsize(os.path.join(folder, name))
+    return total
+
+
+class CatalogCache:
+    """
+    Cache LRU pe disc pentru CatalogLoader.
+
+    Folosire:
+        cache = CatalogCache()
+        catalog = CatalogLoader(path, cache=cache)
+        catalog.load_sheet("Catalog")   # a doua oară: citit din cache
+
+    Statistici (hits / misses / evictions) în cache.stats.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._index = self._read_index()
+
+    # ── index ───────────────────────────────────────────────────────────
+    def _read_index(self):
+        try:
+            with open(self._index_path, encoding="utf-8") as fh:
+                index = json.load(fh)
+            if index.get("version") == CACHE_VERSION:
+                return index
+        except (OSError, ValueError):
+            pass
+        return {"version": CACHE_VERSION, "entries": {}, "files": {}}
+
+    def _write_index(self):
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(self._index, fh)
+        os.replace(tmp, self._index_path)
+
+    # ── chei ────────────────────────────────────────────────────────────
+    def content_hash(self, path):
+        """
+        sha256 al fișierului; recalculat doar dacă (size, mtime) s-au schimbat.
+        La schimbarea conținutului, intrările vechi ale căii sunt invalidate.
+        """
+        path = os.path.abspath(path)
+        st = os.stat(path)
+        known = self._index["files"].get(path)
+        if known and known["size"] == st.st_size and known["mtime_ns"] == st.st_mtime_ns:
+            return known["sha256"]
+
+        digest = file_sha256(path)
+        if known and known["sha256"] != digest:
+            for key, entry in list(self._index["entries"].items()):
+                if entry["sha256"] == known["sha256"]:
+                    self._remove(key)
+        self._index["files"][path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+        self._write_index()
+        return digest
+
+    @staticmethod
+    def entry_key(digest, sheet_name):
+        sheet_hash = hashlib.sha1(sheet_name.encode("utf-8")).hexdigest()[:12]
+        return f"{digest[:40]}_{sheet_hash}"
+
+    # ── citire / scriere ────────────────────────────────────────────────
+    def load(self, path, sheet_name):
+        """
+        (df, meta) pentru foaia din cache sau None la miss.
+        """
+        digest = self.content_hash(path)
+        key = self.entry_key(digest, sheet_name)
+        entry = self._index["entries"].get(key)
+        folder = os.path.join(self.cache_dir, key)
+        if entry is None or not os.path.isdir(folder):
+            self.stats["misses"] += 1
+            return None
+
+        try:
+            with open(os.path.join(folder, "meta.json"), encoding="utf-8") as fh:
+                meta = json.load(fh)
+            data = np.load(os.path.join(folder, "data.npy"), mmap_mode="r")
+            offsets = np.load(os.path.join(folder, "offsets.npy"), mmap_mode="r")
+            nulls = np.load(os.path.join(folder, "nulls.npy"), mmap_mode="r")
+            df = self._decode(meta, data, offsets, nulls)
+            del data, offsets, nulls
+        except (OSError, ValueError, KeyError):
+            self._remove(key)
+            self._write_index()
+            self.stats["misses"] += 1
+            return None
+
+        entry["last_access"] = time.time()
+        self._write_index()
+        self.stats["hits"] += 1
+        return df, meta
+
+    @staticmethod
+    def _decode(meta, data, offsets, nulls):
+        columns = {}
+        n_rows = meta["n_rows"]
+        for i, (start, end) in enumerate(meta["byte_ranges"]):
+            text = bytes(data[start:end]).decode("utf-8")
+            offs = offsets[i].tolist()
+            empty = nulls[i].tolist()
+            columns[i] = [
+                None if empty[r] else text[offs[r]:offs[r + 1]]
+                for r in range(n_rows)
+            ]
+        # coloanele pe poziție, apoi numele (header-ele strip-uite se pot repeta)
+        df = pd.DataFrame(columns, index=range(n_rows), dtype=str)
+        df.columns = pd.Index(meta["columns"], dtype=str) if columns else df.columns
+        return df
+
+    def store(self, path, sheet_name, df, meta):
+        """
+        Salvează foaia parsată; meta trebuie să fie serializabil JSON.
+        """
+        digest = self.content_hash(path)
+        key = self.entry_key(digest, sheet_name)
+        folder = os.path.join(self.cache_dir, key)
+        tmp = tempfile.mkdtemp(dir=self.cache_dir, prefix=".tmp_")
+
+        n_rows = len(df)
+        n_cols = len(df.columns)
+        offsets = np.zeros((n_cols, n_rows + 1), dtype=np.int64)
+        nulls = np.zeros((n_cols, n_rows), dtype=bool)
+        blobs = []
+        byte_ranges = []
+        pos = 0
+        for i in range(n_cols):
+            values = df.iloc[:, i].tolist()
+            empty = pd.isna(df.iloc[:, i]).to_numpy()
+            texts = ["" if e else v for v, e in zip(values, empty)]
+            nulls[i] = empty
+            offsets[i, 1:] = np.cumsum([len(t) for t in texts], dtype=np.int64)
+            blob = "".join(texts).encode("utf-8")
+            blobs.append(blob)
+            byte_ranges.append((pos, pos + len(blob)))
+            pos += len(blob)
+
+        meta = dict(meta, columns=list(df.columns), byte_ranges=byte_ranges,
+                    n_rows=n_rows, sheet_name=sheet_name, sha256=digest)
+        np.save(os.path.join(tmp, "data.npy"), np.frombuffer(b"".join(blobs), dtype=np.uint8))
+        np.save(os.path.join(tmp, "offsets.npy"), offsets)
+        np.save(os.path.join(tmp, "nulls.npy"), nulls)
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as fh:
+            json.dump(meta, fh, ensure_ascii=False)
+
+        if os.path.isdir(folder):
+            shutil.rmtree(folder, ignore_errors=True)
+        os.replace(tmp, folder)
+        self._index["entries"][key] = {
+            "sha256": digest,
+            "sheet_name": sheet_name,
+            "size": _dir_size(folder),
+            "last_access": time.time(),
+        }
+        self._evict()
+        self._write_index()
+
+    # ── evacuare ────────────────────────────────────────────────────────
+    def _remove(self, key):
+        self._index["entries"].pop(key, None)
+        shutil.rmtree(os.path.join(self.cache_dir, key), ignore_errors=True)
+
+    def _evict(self):
+        """Șterge intrările cel mai puțin recent folosite până sub max_bytes."""
+        entries = self._index["entries"]
+        total = sum(e["size"] for e in entries.values())
+        for key in sorted(entries, key=lambda k: entries[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= entries[key]["size"]
+            self._remove(key)
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        for key in list(self._index["entries"]):
+            self._remove(key)
+        self._index["files"] = {}
+        self._write_index()
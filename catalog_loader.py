@@ -0,0 +1,219 @@
+import pandas as pd
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+from xlsx_stream import HyperlinkIndex, XlsxStream, probe_sheets
+
+
+def _dedup_headers(names):
+    """Redenumește header-ele duplicate ca pandas: 'X', 'X.1', 'X.2'..."""
+    counts = {}
+    out = []
+    for name in names:
+        cur = counts.get(name, 0)
+        while cur > 0:
+            counts[name] = cur + 1
+            name = f"{name}.{cur}"
+            cur = counts.get(name, 0)
+        out.append(name)
+        counts[name] = cur + 1
+    return out
+
+
+def _column_names(header, width):
+    """Numele coloanelor 1..width ca în pd.read_excel: header-ul sau 'Unnamed: N', deduplicate."""
+    names = []
+    for col in range(1, width + 1):
+        name = header.get(col)
+        names.append(str(name) if name is not None else f"Unnamed: {col - 1}")
+    return _dedup_headers(names)
+
+
+def _header_letters(header):
+    """{header: literă coloană} din rândul 1 (prima apariție câștigă)."""
+    letters = {}
+    for col in sorted(header):
+        text = str(header[col]).strip()
+        if text and text not in letters:
+            letters[text] = get_column_letter(col)
+    return letters
+
+
+class CatalogLoader:
+    """
+    Încarcă un catalog .xlsx o singură dată pe sesiune.
+
+    La deschidere se citesc doar lista foilor și dimensiunile lor estimate
+    (xl/workbook.xml + <dimension> din fiecare foaie), iar foaia
+    selectată este parsată o singură dată, în flux (XlsxStream), fără obiecte
+    Cell openpyxl. GUI-ul, validatorul și exportul de fail report folosesc
+    același obiect, fără re-citiri de pe disc.
+
+    Expune:
+      - sheetnames      : lista foilor din workbook
+      - sheet_info      : [{"name", "dimension", "rows", "cols"}] (vezi probe_sheets)
+      - sheet_name      : foaia încărcată
+      - df              : pandas.DataFrame cu valori str (header-e strip-uite)
+      - hidden_rows     : [nr. rând Excel] pentru rândurile ascunse
+      - hidden_cols     : [literă coloană] pentru coloanele ascunse
+      - hyperlinks      : HyperlinkIndex {coloană: {rând: target}} din <hyperlinks>
+                          (+ sheetN.xml.rels) și formulele =HYPERLINK(...)
+      - header_letters  : {header: literă coloană} din rândul 1
+
+    Cu cache=CatalogCache(...), o foaie deja parsată (același conținut de
+    fișier) este citită din cache în loc să fie re-parsată.
+    """
+
+    def __init__(self, path, cache=None):
+        self.path = path
+        self.cache = cache
+        self.sheet_info = probe_sheets(path)
+        self.sheetnames = [info["name"] for info in self.sheet_info]
+
+        self.sheet_name = None
+        self.df = None
+        self.hidden_rows = []
+        self.hidden_cols = []
+        self.header_letters = {}
+        self.hyperlinks = HyperlinkIndex()
+
+    def load_sheet(self, sheet_name):
+        """
+        Parsează foaia sheet_name (o singură trecere prin XML) și
+        populează DataFrame-ul plus metadatele de celulă.
+        """
+        # 0) Foaie deja parsată pentru același conținut → direct din cache
+        if self.cache is not None:
+            cached = self.cache.load(self.path, sheet_name)
+            if cached is not None:
+                df, meta = cached
+                self._apply(sheet_name, df, meta)
+                return df
+
+        # 1) O singură trecere: header (rândul 1) + coloanele de date
+        header = {}
+        columns = {}
+        n_rows = 0
+        with XlsxStream(self.path) as xs:
+            reader = xs.sheet(sheet_name)
+            for row_number, cells in reader.rows():
+                if row_number == 1:
+                    header = dict(cells)
+                    continue
+                if not cells:
+                    continue
+                pos = row_number - 2
+                for col, text in cells:
+                    col_values = columns.get(col)
+                    if col_values is None:
+                        col_values = columns[col] = []
+                    if len(col_values) < pos:
+                        col_values.extend([None] * (pos - len(col_values)))
+                    col_values.append(text)
+                n_rows = pos + 1
+            # hyperlink-urile: <hyperlink> + rels + =HYPERLINK(), colectate în aceeași trecere
+            hyperlinks = reader.hyperlinks()
+
+        # 2) DataFrame-ul de lucru, cu aceeași formă ca pd.read_excel(dtype=str):
+        #    rândurile goale de la final sunt tăiate, coloanele încep mereu de la A
+        width = max(list(header) + list(columns), default=0)
+        data = {}
+        for col, name in enumerate(_column_names(header, width), start=1):
+            col_values = columns.pop(col, [])
+            col_values.extend([None] * (n_rows - len(col_values)))
+            data[name] = col_values
+        df = pd.DataFrame(data, dtype=str)
+        df.columns = df.columns.str.strip()
+        df.reset_index(drop=True, inplace=True)
+
+        # 3) Header -> literă coloană (prima apariție câștigă)
+        meta = {
+            "hidden_rows": reader.hidden_rows,
+            "hidden_cols": reader.hidden_cols,
+            "header_letters": _header_letters(header),
+            "hyperlinks": hyperlinks.to_dict(),
+        }
+        self._apply(sheet_name, df, meta)
+        if self.cache is not None:
+            self.cache.store(self.path, sheet_name, df, meta)
+        return df
+
+    def iter_chunks(self, sheet_name, chunk_rows=10000):
+        """
+        Ca load_sheet, dar foaia e citită în blocuri de cel mult chunk_rows
+        rânduri, fără a ține toată foaia în memorie: generator (start, df_chunk),
+        start = poziția 0-based a primului rând din bloc (rândul Excel start + 2).
+
+        Blocurile au coloanele din header (rândul 1); celulele din dreapta
+        ultimului header nu sunt incluse (load_sheet le-ar pune în coloane
+        'Unnamed: N' la final). header_letters e disponibil de la primul bloc;
+        după ultimul bloc catalogul are toate metadatele foii (hidden_rows,
+        hidden_cols, hyperlinks), iar df e doar header-ul (0 rânduri).
+        Nu folosește cache-ul de pe disc.
+        """
+        with XlsxStream(self.path) as xs:
+            reader = xs.sheet(sheet_name)
+            names = None
+            for row_numbers, columns in reader.iter_column_chunks(chunk_rows):
+                if names is None:
+                    names = _column_names(reader.header, max(reader.header, default=0))
+                    self.sheet_name = sheet_name
+                    self.header_letters = _header_letters(reader.header)
+                n = len(row_numbers)
+                data = {
+                    name: columns.get(col, [None] * n)
+                    for col, name in enumerate(names, start=1)
+                }
+                df = pd.DataFrame(data, dtype=str, index=pd.RangeIndex(row_numbers[0] - 2, row_numbers[-1] - 1))
+                df.columns = df.columns.str.strip()
+                yield row_numbers[0] - 2, df
+            hyperlinks = reader.hyperlinks()
+            header = reader.header
+
+        names = _column_names(header, max(header, default=0))
+        df = pd.DataFrame({name: [] for name in names}, dtype=str)
+        df.columns = df.columns.str.strip()
+        self._apply(sheet_name, df, {
+            "hidden_rows": reader.hidden_rows,
+            "hidden_cols": reader.hidden_cols,
+            "header_letters": _header_letters(header),
+            "hyperlinks": hyperlinks.to_dict(),
+        })
+
+    def _apply(self, sheet_name, df, meta):
+        self.sheet_name = sheet_name
+        self.df = df
+        self.hidden_rows = list(meta["hidden_rows"])
+        self.hidden_cols = list(meta["hidden_cols"])
+        self.header_letters = dict(meta["header_letters"])
+        self.hyperlinks = HyperlinkIndex.from_dict(meta["hyperlinks"])
+
+    def sheet_label(self, sheet_name):
+        """Eticheta din combobox: numele foii + dimensiunea estimată."""
+        for info in self.sheet_info:
+            if info["name"] == sheet_name and info["rows"] is not None:
+                return f"{sheet_name}  (~{info['rows']:,} rows × {info['cols']} cols)"
+        return sheet_name
+
+    def column(self, col_letter):
+        """
+        Coloana col_letter din df (pe poziție, nu după header), ca Series,
+        sau None dacă foaia nu are coloana.
+        """
+        pos = column_index_from_string(col_letter) - 1
+        if self.df is None or pos >= len(self.df.columns):
+            return None
+        return self.df.iloc[:, pos]
+
+    def column_values(self, col_letter):
+        """
+        Valorile text ale coloanei col_letter, de la rândul 2 în jos
+        (celulele goale devin "").
+        """
+        column = self.column(col_letter)
+        if column is None:
+            return []
+        return column.fillna("").astype(str).tolist()
+
+    def hyperlink(self, cell_ref):
+        """Target-ul hyperlink-ului de pe cell_ref sau None."""
+        return self.hyperlinks.get(cell_ref)
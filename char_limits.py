@@ -0,0 +1,41 @@
+"""
+Motor vectorizat pentru verificările de lungime / caractere interzise
+(group_j, group_k, group_l, group_o).
+
+O regulă = LimitSpec(coloană, lungime maximă, caractere interzise); evaluarea
+folosește lungimile și textul trim-uit din ColumnCache (str.len() + măști
+NumPy), fără buclă Python per rând, și întoarce TOATE rândurile care
+încalcă regula, cu lungimea lor reală.
+"""
+import re
+from collections import namedtuple
+
+import numpy as np
+
+# column: numele coloanei din df; forbidden: caractere interzise ("" = niciunul)
+LimitSpec = namedtuple("LimitSpec", ["column", "max_len", "forbidden"], defaults=[""])
+
+# positions: poziții 0-based în df; rows: rânduri Excel (header pe rândul 1);
+# lengths: lungimea textului trim-uit; too_long: True dacă rândul depășește max_len
+# (altfel e acolo doar pentru un caracter interzis)
+LimitResult = namedtuple("LimitResult", ["spec", "positions", "rows", "lengths", "too_long"])
+
+
+def evaluate_limit(norm, spec):
+    """Evaluează spec pe o coloană normalizată (column_cache.NormalizedColumn)."""
+    lengths = norm.lengths
+    too_long = lengths > spec.max_len
+    mask = too_long
+    if spec.forbidden:
+        pattern = "[" + re.escape(spec.forbidden) + "]"
+        mask = mask | norm.values.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+
+    positions = np.flatnonzero(mask)
+    return LimitResult(
+        spec=spec,
+        positions=positions,
+        rows=positions + 2,
+        lengths=lengths[positions],
+        too_long=too_long[positions],
+    )
+
@@ -0,0 +1,111 @@
+"""
+Motor vectorizat pentru verificarea codurilor GS1 (EAN / UPC / GTIN):
+lungime permisă + cifra de control mod 10 (group_p).
+
+Pentru fiecare lungime permisă L, valorile trim-uite de lungime L din
+ColumnCache sunt convertite într-o singură matrice de cifre (n x L, dtype
+"U<L>" văzut ca uint32, minus "0"); orice caracter non-cifră iese peste 9
+(uint32). Cifra de control se calculează pentru toate rândurile deodată:
+    suma = cifre[:, :-1] @ ponderi (3, 1, 3, ... de la dreapta la stânga)
+    cifra de control = (10 - suma % 10) % 10
+fără buclă Python per valoare. Sunt întoarse TOATE celulele care pică, cu
+motivul (lungime / caractere non-cifră / cifră de control greșită); raportul
+păstrează numărul, primul exemplu și primele MAX_CELL_RANGES intervale de
+celule (cell_ranges), iar lista completă merge în failures.FailureRows
+(all_failures / exportul tuturor fail-urilor).
+"""
+from collections import namedtuple
+
+import numpy as np
+
+# lungimile permise per proprietate (EAN-8 / EAN-13, UPC-A, GTIN-8/12/13/14)
+GTIN_LENGTHS = {
+    "EAN": (8, 13),
+    "UPC": (12,),
+    "GTIN": (8, 12, 13, 14),
+}
+INVALID_LENGTH, NON_DIGIT, INVALID_CHECK_DIGIT = 0, 1, 2
+REASONS = ("Invalid length", "Non-digit characters", "Invalid check digit")
+# câte intervale de celule intră în "Check Fail Cell References" din raport
+MAX_CELL_RANGES = 20
+
+# column: numele coloanei din df; lengths: lungimile permise
+CodeSpec = namedtuple("CodeSpec", ["column", "lengths"])
+
+# positions: poziții 0-based în df; rows: rânduri Excel (header pe rândul 1);
+# reasons: motivul per celulă (INVALID_LENGTH / NON_DIGIT / INVALID_CHECK_DIGIT);
+# expected: cifra de control corectă (doar pentru INVALID_CHECK_DIGIT, altfel -1)
+CodeResult = namedtuple("CodeResult", ["spec", "positions", "rows", "reasons", "expected"])
+
+def gs1_weights(length):
+    """Ponderile GS1 pentru primele length - 1 cifre: 3 pe cifra de lângă cea de control, apoi alternant."""
+    return np.array([3 if (length - 2 - i) % 2 == 0 else 1 for i in range(length - 1)], dtype=np.uint32)
+
+
+def digit_matrix(values):
+    """
+    Cifrele valorilor (toate de aceeași lungime L) ca matrice uint32 (n x L);
+    caracterele non-cifră dau valori > 9.
+    """
+    length = len(values[0]) if len(values) else 1
+    chars = np.asarray(values, dtype=object).astype(f"U{length}")
+    return chars.view(np.uint32).reshape(len(values), length) - np.uint32(ord("0"))
+
+
+def check_digit(digits):
+    """Cifra de control GS1 calculată din toate coloanele, mai puțin ultima."""
+    return (10 - (digits[:, :-1] @ gs1_weights(digits.shape[1])) % 10) % 10
+
+
+def evaluate_codes(norm, spec):
+    """Evaluează spec pe o coloană normalizată (column_cache.NormalizedColumn)."""
+    lengths = norm.lengths
+    filled = ~norm.blank
+    reasons = np.full(len(lengths), -1, dtype=np.int8)
+    expected = np.full(len(lengths), -1, dtype=np.int8)
+
+    # 1) Lungimea
+    length_ok = np.isin(lengths, spec.lengths)
+    reasons[filled & ~length_ok] = INVALID_LENGTH
+
+    # 2) Cifrele și cifra de control, câte o matrice per lungime permisă
+    values = np.asarray(norm.values, dtype=object)
+    for length in spec.lengths:
+        cand = np.flatnonzero(filled & (lengths == length))
+        if not len(cand):
+            continue
+        digits = digit_matrix(values[cand])
+        non_digit = (digits > 9).any(axis=1)
+        computed = check_digit(digits)
+        wrong = ~non_digit & (computed != digits[:, -1])
+        reasons[cand[non_digit]] = NON_DIGIT
+        reasons[cand[wrong]] = INVALID_CHECK_DIGIT
+        expected[cand[wrong]] = computed[wrong]
+
+    positions = np.flatnonzero(reasons >= 0)
+    return CodeResult(
+        spec=spec,
+        positions=positions,
+        rows=positions + 2,
+        reasons=reasons[positions],
+        expected=expected[positions],
+    )
+
+
+def cell_ranges(letter, rows, limit=None):
+    """
+    Rândurile crescătoare ca referințe compacte: "E2:E5, E9". limit: cel mult
+    atâtea intervale, urmate de "… (+N more ranges)".
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    if not len(rows):
+        return ""
+    breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+    starts = rows[np.concatenate(([0], breaks))]
+    stops = rows[np.concatenate((breaks - 1, [len(rows) - 1]))]
+    more = len(starts) - limit if limit is not None and len(starts) > limit else 0
+    text = ", ".join(
+        f"{letter}{start}" if start == stop else f"{letter}{start}:{letter}{stop}"
+        for start, stop in zip(starts[:len(starts) - more].tolist(), stops[:len(stops) - more].tolist())
+    )
+    return f"{text}, … (+{more} more ranges)" if more else text
@@ -0,0 +1,174 @@
+"""
+Modelul rezultatelor din raport: CheckResult (o verificare) și GroupResult
+(verificările unui grup, în ordine).
+
+Valorile sunt convertite la tipuri native Python (int / float / str / bool,
+NaN → None) o singură dată, la construcție, deci raportul nu mai e parcurs
+recursiv la final (fostul validator.sanitize). Ordinea câmpurilor e cea dată
+la construcție (GUI-ul ia coloanele tabelului din cheile primului rezultat).
+
+CheckResult se citește ca un dict (item["Check Fail Count"], item.get(...),
+keys(), items()), așa că GUI-ul și exportatoarele îl folosesc direct;
+to_dict / to_json / report_to_json dau forma serializabilă.
+"""
+import json
+
+import numpy as np
+
+PERFORMED = "Check Performed"
+OUTCOME = "Check Outcome"
+
+_PLAIN = (str, int, bool, type(None))
+
+
+def native(value):
+    """value ca tip nativ Python: scalari NumPy → .item(), NaN → None, liste / dict-uri element cu element."""
+    kind = type(value)
+    if kind in _PLAIN:
+        return value
+    if kind is float:
+        return None if value != value else value
+    if isinstance(value, np.generic):
+        return native(value.item())
+    if kind is list:
+        return [native(v) for v in value]
+    if kind is dict:
+        return {k: native(v) for k, v in value.items()}
+    return value
+
+
+class CheckResult:
+    """
+    Rezultatul unei verificări: performed ("Check Performed"), outcome
+    ("Check Outcome") și celelalte câmpuri ale raportului, în ordine (fields).
+    """
+
+    __slots__ = ("performed", "outcome", "fields")
+
+    def __init__(self, performed, outcome, **fields):
+        self.performed = performed
+        self.outcome = outcome
+        for key, value in fields.items():
+            if type(value) not in _PLAIN:
+                fields[key] = native(value)
+        self.fields = fields
+
+    # ── citire ca dict ──────────────────────────────────────────────────
+    def __getitem__(self, key):
+        if key == PERFORMED:
+            return self.performed
+        if key == OUTCOME:
+            return self.outcome
+        return self.fields[key]
+
+    def __setitem__(self, key, value):
+        value = native(value)
+        if key == PERFORMED:
+            self.performed = value
+        elif key == OUTCOME:
+            self.outcome = value
+        else:
+            self.fields[key] = value
+
+    def __contains__(self, key):
+        return key in (PERFORMED, OUTCOME) or key in self.fields
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return [PERFORMED, OUTCOME, *self.fields]
+
+    def items(self):
+        return self.to_dict().items()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return 2 + len(self.fields)
+
+    def __eq__(self, other):
+        if isinstance(other, CheckResult):
+            other = other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"CheckResult({self.to_dict()!r})"
+
+    def copy(self):
+        return CheckResult(self.performed, self.outcome, **self.fields)
+
+    # ── serializare ─────────────────────────────────────────────────────
+    def to_dict(self):
+        return {PERFORMED: self.performed, OUTCOME: self.outcome, **self.fields}
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), ensure_ascii=False, **kwargs)
+
+
+class GroupResult:
+    """Verificările unui grup de validări, în ordinea raportului; se citește ca o listă."""
+
+    __slots__ = ("name", "checks")
+
+    def __init__(self, name, checks):
+        self.name = name
+        self.checks = list(checks)
+
+    def __getitem__(self, index):
+        return self.checks[index]
+
+    def __iter__(self):
+        return iter(self.checks)
+
+    def __len__(self):
+        return len(self.checks)
+
+    def __eq__(self, other):
+        if isinstance(other, GroupResult):
+            other = other.checks
+        if isinstance(other, list):
+            return self.checks == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"GroupResult({self.name!r}, {self.checks!r})"
+
+    def to_list(self):
+        return [check.to_dict() for check in self.checks]
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_list(), ensure_ascii=False, **kwargs)
+
+
+def _encode(obj):
+    """json.dumps(default=...): CheckResult / GroupResult fără copia intermediară a raportului."""
+    if isinstance(obj, CheckResult):
+        return obj.to_dict()
+    if isinstance(obj, GroupResult):
+        return obj.checks
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def report_to_dict(report):
+    """Raportul lui validate_file doar cu dict-uri și liste (ex. pentru pickle / comparații)."""
+    return {
+        key: value.to_list() if isinstance(value, GroupResult) else value
+        for key, value in report.items()
+    }
+
+
+def report_to_json(report, **kwargs):
+    """Raportul lui validate_file ca JSON."""
+    kwargs.setdefault("ensure_ascii", False)
+    return json.dumps(report, default=_encode, **kwargs)
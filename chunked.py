@@ -0,0 +1,376 @@
+"""
+Validare out-of-core, cu memorie mărginită: validate_chunked(catalog, foaie, ...).
+
+Foaia e citită în blocuri de rânduri (CatalogLoader.iter_chunks), fără a
+încărca tot DataFrame-ul; fiecare bloc trece prin toate verificările și lasă
+în urmă doar acumulatori combinabili (aceiași ca la sharding.py): contoare,
+primul fail, valorile distincte pentru unicitate. Valorile distincte sunt
+ținute în memorie până la o limită derivată din memory_mb, apoi sunt mutate
+într-un SQLite temporar pe disc (SpillingValueCounts).
+
+Raportul are aceeași formă și aceleași rezultate ca validate_file pe foaia
+întreagă; în plus raport["memory"] descrie bugetul, blocurile și coloanele
+mutate pe disc. Indexul de hyperlink-uri și codurile de țară distincte
+rămân în memorie (sunt mici față de foaie).
+"""
+import os
+import sqlite3
+import tempfile
+import time
+from itertools import islice
+
+import numpy as np
+from openpyxl.utils import column_index_from_string, get_column_letter
+
+from sharding import ValueCounts, build_plan, finalize, merge_into, shard_partial
+from check_result import GroupResult
+from column_cache import NormalizedColumn
+from url_verdicts import URL_VERDICTS
+from validator import (
+    VALIDATION_GROUP_ORDER,
+    UrlTally,
+    group_a,
+    hyperlink_result,
+    image_url_result,
+    normalize_headers,
+    report_check,
+)
+
+DEFAULT_MEMORY_MB = 512
+# estimare pentru o celulă dintr-un bloc: str Python + slotul din listă + copia pandas
+CELL_BYTES = 160
+# estimare pentru o valoare distinctă ținută în memorie (peste lungimea textului)
+VALUE_BYTES = 200
+# din buget: un sfert pentru blocul curent, jumătate pentru valorile distincte
+CHUNK_SHARE = 0.25
+VALUES_SHARE = 0.5
+MIN_CHUNK_ROWS = 1000
+# valorile distincte ale coloanelor URL sunt verificate pe loturi de atâtea valori
+URL_BATCH = 10_000
+
+URL_PROPS = ["Product URL", "Product Video URL"]
+
+
+def chunk_rows_for(memory_mb, n_cols):
+    """Câte rânduri încap într-un bloc pentru bugetul memory_mb și n_cols coloane."""
+    budget = memory_mb * 2**20 * CHUNK_SHARE
+    return max(MIN_CHUNK_ROWS, int(budget // (max(n_cols, 1) * CELL_BYTES)))
+
+
+class SpillStore:
+    """Fișierul SQLite temporar în care acumulatorii își mută valorile distincte."""
+
+    def __init__(self, directory):
+        self.path = os.path.join(directory, "values.sqlite")
+        self._conn = None
+        self._tables = 0
+
+    @property
+    def conn(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute("PRAGMA journal_mode=OFF")
+            self._conn.execute("PRAGMA synchronous=OFF")
+        return self._conn
+
+    def new_table(self):
+        self._tables += 1
+        name = f"v{self._tables}"
+        self.conn.execute(
+            f"CREATE TABLE {name} (value TEXT PRIMARY KEY, count INTEGER, row INTEGER, raw TEXT)"
+        )
+        return name
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class SpillingValueCounts:
+    """
+    ValueCounts cu memorie mărginită: valorile distincte stau în memorie până
+    depășesc max_bytes (estimat), apoi sunt adăugate într-o tabelă SQLite
+    (apariții adunate, primul rând păstrat) și memoria e golită.
+    Aceeași interfață ca ValueCounts: merge, total, duplicates, first_seen.
+    """
+
+    def __init__(self, store, max_bytes):
+        self.store = store
+        self.max_bytes = max_bytes
+        self.memory = None
+        self.table = None
+        self._text_bytes = 0
+        self._seen = 0
+
+    @property
+    def spilled(self):
+        return self.table is not None
+
+    def merge(self, other):
+        # blocurile vin în ordinea rândurilor, deci prima apariție rămâne cea de sus
+        self.memory = other if self.memory is None else self.memory.merge(other)
+        self._text_bytes += sum(map(len, other.uniques))
+        self._seen += len(other)
+        if self._seen and len(self.memory) * (VALUE_BYTES + self._text_bytes / self._seen) > self.max_bytes:
+            self._spill()
+        return self
+
+    def _spill(self):
+        if self.memory is None:
+            return
+        if self.table is None:
+            self.table = self.store.new_table()
+        self.store.conn.executemany(
+            f"INSERT INTO {self.table} (value, count, row, raw) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(value) DO UPDATE SET count = count + excluded.count",
+            zip(self.memory.uniques.tolist(), self.memory.counts.tolist(),
+                self.memory.rows.tolist(), self.memory.raws.tolist()),
+        )
+        self.memory = None
+
+    def _empty(self):
+        return ValueCounts(*(np.empty(0, dtype=dtype) for dtype in (object, np.int64, np.int64, object)))
+
+    def total(self):
+        if not self.spilled:
+            return (self.memory or self._empty()).total()
+        self._spill()
+        return self.store.conn.execute(f"SELECT COALESCE(SUM(count), 0) FROM {self.table}").fetchone()[0]
+
+    def duplicates(self):
+        if not self.spilled:
+            return (self.memory or self._empty()).duplicates()
+        self._spill()
+        conn = self.store.conn
+        fails = conn.execute(
+            f"SELECT COALESCE(SUM(count), 0) FROM {self.table} WHERE count > 1"
+        ).fetchone()[0]
+        first = conn.execute(
+            f"SELECT row, value, raw FROM {self.table} WHERE count > 1 ORDER BY row LIMIT 1"
+        ).fetchone()
+        return fails, first
+
+    def first_seen(self):
+        if not self.spilled:
+            return (self.memory or self._empty()).first_seen()
+        self._spill()
+        return self.store.conn.execute(f"SELECT value, row FROM {self.table} ORDER BY row")
+
+
+def validate_chunked(catalog, sheet_name, extra_id_cols=None, mapped_props=None,
+                     prepare=None, memory_mb=DEFAULT_MEMORY_MB, chunk_rows=None):
+    """
+    catalog       : CatalogLoader (foaia nu trebuie încărcată)
+    sheet_name    : foaia validată
+    extra_id_cols : ca la validate_file
+    mapped_props  : ca la validate_file
+    prepare       : funcție opțională df → df aplicată fiecărui bloc înainte de
+                    validare (redenumirile / curățările făcute de GUI pe df_processed)
+    memory_mb     : bugetul de memorie; din el rezultă mărimea blocurilor (dacă
+                    chunk_rows nu e dat) și cât din valorile distincte stă în memorie
+
+    Întoarce raportul validate_file pentru foaia întreagă (fără column_cache),
+    plus raport["memory"].
+    """
+    mapped_props = mapped_props or {}
+    extra_id_cols = extra_id_cols or []
+    started = time.perf_counter()
+
+    if chunk_rows is None:
+        n_cols = next(
+            (info["cols"] for info in catalog.sheet_info
+             if info["name"] == sheet_name and info["cols"]),
+            50,
+        )
+        chunk_rows = chunk_rows_for(memory_mb, n_cols)
+
+    URL_VERDICTS.start_run()
+    with tempfile.TemporaryDirectory(prefix="catalog_spill_") as spill_dir:
+        store = SpillStore(spill_dir)
+        try:
+            run = None
+            for start, raw in catalog.iter_chunks(sheet_name, chunk_rows):
+                if run is None:
+                    run = _ChunkedRun(raw.iloc[:0], catalog, mapped_props, extra_id_cols,
+                                      prepare, store, memory_mb)
+                run.add(start, raw)
+            if run is None:
+                # foaie fără rânduri de date: doar header-ul
+                run = _ChunkedRun(catalog.df, catalog, mapped_props, extra_id_cols,
+                                  prepare, store, memory_mb)
+            output = run.report()
+        finally:
+            store.close()
+
+    output["memory"]["Chunk Rows"] = chunk_rows
+    output["url_verdicts"] = URL_VERDICTS.report()
+    output["timings"] = {
+        "Mode": f"chunked({chunk_rows} rows)",
+        "Total": round(time.perf_counter() - started, 4),
+    }
+    return output
+
+
+class _ChunkedRun:
+    """Acumulatorii unei rulări validate_chunked; add() pentru fiecare bloc, report() la final."""
+
+    def __init__(self, raw_header, catalog, mapped_props, extra_id_cols, prepare, store, memory_mb):
+        self.catalog = catalog
+        self.mapped_props = mapped_props
+        self.extra_id_cols = extra_id_cols
+        self.prepare = prepare
+        self.store = store
+        self.memory_mb = memory_mb
+
+        self.header = self._prepared(raw_header)
+        if not self.header.columns.is_unique:
+            raise ValueError("Chunked validation needs unique column headers")
+        self.plan = build_plan(self.header, catalog, mapped_props, extra_id_cols)
+
+        # group_f: Product Image URL din df-ul pregătit (inclusiv celulele goale)
+        self.image_pos = None
+        if "Product Image URL" in self.header.columns:
+            self.image_pos = self.header.columns.get_loc("Product Image URL")
+        # group_i: coloanele URL din foaia originală, redenumite ca în group_i
+        self.url_renamed = raw_header.rename(columns={
+            header: prop
+            for prop, header in mapped_props.items()
+            if header in raw_header.columns
+        })
+        self.url_pos = {}
+        for col in URL_PROPS:
+            if col in mapped_props and col in self.url_renamed.columns:
+                self.url_pos[col] = _first_position(self.url_renamed, col)
+
+        accumulators = sum("values" in kinds for kinds in self.plan["columns"].values())
+        accumulators += (self.image_pos is not None) + len(self.url_pos)
+        self.value_bytes = memory_mb * 2**20 * VALUES_SHARE / max(accumulators, 1)
+
+        self.merged = {"n": 0, "columns": {}, "formats": {}}
+        for pos, kinds in self.plan["columns"].items():
+            if "values" in kinds:
+                self.merged["columns"][pos] = {"values": self._spiller()}
+        self.image_urls = self._spiller() if self.image_pos is not None else None
+        self.urls = {col: self._spiller() for col in self.url_pos}
+        self.chunks = 0
+
+    def _spiller(self):
+        return SpillingValueCounts(self.store, self.value_bytes)
+
+    def _prepared(self, raw):
+        df = self.prepare(raw) if self.prepare else raw
+        return normalize_headers(df)
+
+    def add(self, start, raw):
+        """Trece blocul raw (rândurile start.., 0-based) prin toate verificările."""
+        df = self._prepared(raw)
+        stop = start + len(df)
+        columns = {pos: df.iloc[:, pos] for pos in self.plan["columns"]}
+        # Data Format Checks: coloanele foii, după litera lor (ca CatalogLoader.column_values)
+        letter_columns = {}
+        for letter in self.plan["letters"]:
+            pos = column_index_from_string(letter) - 1
+            letter_columns[letter] = (
+                raw.iloc[:, pos].fillna("").astype(str).tolist() if pos < len(raw.columns) else []
+            )
+        merge_into(self.merged, shard_partial(columns, letter_columns, start, stop, self.plan["columns"]))
+
+        first_row = start + 2
+        if self.image_urls is not None:
+            self.image_urls.merge(_all_values(df.iloc[:, self.image_pos], first_row))
+        for col, pos in self.url_pos.items():
+            self.urls[col].merge(_all_values(raw.iloc[:, pos], first_row))
+        self.chunks += 1
+
+    def report(self):
+        header = self.header
+        results = finalize(self.merged, header, self.catalog, self.mapped_props, self.extra_id_cols)
+        results["File Format Checks"] = group_a(self.catalog)
+        results["Mandatory Data - URL Field Checks"] = self._image_url_check()
+        results["Optional Data - URL Field Checks"] = self._url_checks()
+
+        spilled = [
+            header.columns[pos] for pos, stats in self.merged["columns"].items()
+            if isinstance(stats.get("values"), SpillingValueCounts) and stats["values"].spilled
+        ]
+        if self.image_urls is not None and self.image_urls.spilled:
+            spilled.append("Product Image URL (URL check)")
+        spilled += [f"{col} (URL check)" for col, acc in self.urls.items() if acc.spilled]
+
+        output = {
+            "validation_group_order": list(VALIDATION_GROUP_ORDER),
+            "file_summary": {"row_count": self.merged["n"]},
+        }
+        for name in VALIDATION_GROUP_ORDER:
+            output[name] = GroupResult(name, results[name])
+        output["memory"] = {
+            "Budget MB": self.memory_mb,
+            "Chunks": self.chunks,
+            "Spilled Columns": spilled,
+        }
+        return output
+
+    # ── group_f, din valorile distincte ale coloanei Product Image URL ───
+    def _image_url_check(self):
+        col_name = "Product Image URL"
+        check_name = f"{col_name} Hyperlink Check"
+        mapped = set(self.mapped_props or [])
+        skip = {"% Pass Rate": "0%", "Check Fail Count": 0, "Check Fail Example": "",
+                "Check Fail Example Cell Reference": ""}
+        if mapped and col_name not in mapped:
+            return [report_check(check_name, "⏭️ Skip", Explanation="Not mapped", **skip)]
+        if mapped and col_name not in self.header.columns:
+            return [report_check(check_name, "⏭️ Skip", Explanation="Mapped but column missing", **skip)]
+
+        col_letter = get_column_letter(self.header.columns.get_loc(col_name) + 1)
+        col_links = self.catalog.hyperlinks.column(col_letter)
+        tally = UrlTally(check_name, link_at=lambda row: (col_links.get(row) or "").strip(),
+                         header=col_name, count_blanks=True)
+        for values, rows in _batches(self.image_urls.first_seen()):
+            tally.add(values, rows)
+        return [image_url_result(check_name, col_letter, tally, self.merged["n"], 2)]
+
+    # ── group_i, din valorile distincte ale coloanelor URL din foaie ────
+    def _url_checks(self):
+        mapped = set(self.mapped_props or [])
+        skip_base = {"% Pass Rate": "0%", "Check Fail Count": 0, "Check Fail Example": "",
+                     "Check Fail Example Cell Reference": ""}
+        results = []
+        for col in URL_PROPS:
+            check_name = f"{col} Hyperlink Check"
+            if col not in mapped:
+                results.append(report_check(check_name, "⏭️ Skip", Explanation="Not mapped", **skip_base))
+                continue
+            if col not in self.url_renamed.columns:
+                results.append(report_check(check_name, "⏭️ Skip",
+                                            Explanation="Mapped but column missing", **skip_base))
+                continue
+
+            col_letter = self.catalog.header_letters.get(self.mapped_props.get(col, col)) or "A"
+            tally = UrlTally(check_name, link_at=lambda row: self.catalog.hyperlink(f"{col_letter}{row}"),
+                             header=col)
+            for values, rows in _batches(self.urls[col].first_seen()):
+                tally.add(values, rows)
+            if not tally.total:
+                results.append(report_check(check_name, "⏭️ Skip", Explanation="No data present", **skip_base))
+                continue
+            results.append(hyperlink_result(check_name, col_letter, tally))
+        return results
+
+
+def _batches(pairs, size=URL_BATCH):
+    """(valori, rânduri) pe loturi de câte size, din perechile (valoare, rând)."""
+    pairs = iter(pairs)
+    while batch := list(islice(pairs, size)):
+        values, rows = zip(*batch)
+        yield values, rows
+
+def _all_values(raw, first_row):
+    """ValueCounts pe toate celulele (inclusiv cele goale), trim-uite."""
+    return ValueCounts.from_column(NormalizedColumn(None, None, raw), raw, first_row, keep_blank=True)
+
+
+def _first_position(df, col):
+    return int(np.atleast_1d(np.arange(len(df.columns))[df.columns.get_loc(col)])[0])
+
@@ -0,0 +1,88 @@
+"""
+Cache per rulare pentru coloanele normalizate din validate_file.
+
+Fiecare coloană folosită de verificări este normalizată o singură dată, vectorizat:
+    values  : Series cu textul trim-uit (NaN → "", .str.strip())
+    blank   : np.ndarray bool, celulele goale după trim
+    lengths : np.ndarray int64, lungimea textului trim-uit (calculată la prima cerere)
+
+Echivalent cu vechiul df[col].fillna("").astype(str).map(trim_val), dar fără
+apel Python per element și fără re-normalizare în fiecare grup.
+Fiecare cerere e înregistrată în cache.log (check, coloană, hit / miss).
+"""
+import threading
+
+import numpy as np
+
+
+class NormalizedColumn:
+    """O coloană din df, normalizată (vezi docstring-ul modulului)."""
+
+    def __init__(self, name, position, raw):
+        self.name = name
+        self.position = position
+        self.values = raw.fillna("").astype(str).str.strip()
+        self.blank = (self.values == "").to_numpy(dtype=bool)
+        self._lengths = None
+
+    @property
+    def lengths(self):
+        # calcul idempotent: două thread-uri pot cel mult calcula același rezultat
+        if self._lengths is None:
+            self._lengths = self.values.str.len().to_numpy(dtype=np.int64)
+        return self._lengths
+
+
+class ColumnCache:
+    """
+    Coloanele normalizate ale unui DataFrame, cheiate după poziție.
+
+    get(col) întoarce prima coloană cu numele col (ca df.loc[:, ~duplicated]),
+    at(pos) coloana de pe poziția pos. Sigur între thread-uri (validate_file
+    cu workers > 1): o coloană e normalizată o singură dată, chiar dacă
+    două grupuri o cer simultan.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._columns = {}
+        self.stats = {"hits": 0, "misses": 0}
+        self.log = []
+        self._lock = threading.Lock()
+
+    def position(self, col):
+        """Poziția primei coloane cu numele col."""
+        loc = self.df.columns.get_loc(col)
+        if isinstance(loc, slice):
+            return loc.start
+        if isinstance(loc, np.ndarray):
+            return int(np.flatnonzero(loc)[0])
+        return loc
+
+    def is_unique(self, col):
+        """True dacă df[col] e o singură coloană (nu un DataFrame de duplicate)."""
+        return isinstance(self.df.columns.get_loc(col), int)
+
+    def get(self, col, check=None):
+        return self.at(self.position(col), check)
+
+    def at(self, pos, check=None):
+        with self._lock:
+            norm = self._columns.get(pos)
+            hit = norm is not None
+            if not hit:
+                norm = self._columns[pos] = NormalizedColumn(
+                    self.df.columns[pos], pos, self.df.iloc[:, pos]
+                )
+            self.stats["hits" if hit else "misses"] += 1
+            self.log.append({"Check": check, "Column": norm.name, "Cache": "hit" if hit else "miss"})
+        return norm
+
+    def report(self):
+        """Sumarul pentru raport: câte coloane normalizate, hits / misses, log-ul per check."""
+        return {
+            "Columns Normalized": len(self._columns),
+            "Hits": self.stats["hits"],
+            "Misses": self.stats["misses"],
+            "Checks": list(self.log),
+        }
@@ -0,0 +1,114 @@
+"""
+Indexul codurilor de țară din coloana Country, pentru verificarea
+Mandatory Data - Country Unique Count (validator.group_e și sharding.py).
+
+O singură trecere pe celulele completate: celulele cu "+" sunt despărțite
+(split + explode), pd.factorize dă codul trim-uit al fiecărei părți, iar o
+sortare stabilă după cod dă, pentru fiecare cod, rândurile Excel care îl
+folosesc, compact, ca CSR (ca în duplicates.py):
+    rows    : rândurile Excel (int32), grupate după cod, crescătoare în grup
+    offsets : codul i = rows[offsets[i]:offsets[i + 1]]
+Codurile sunt în ordinea primei apariții. Din index vin direct numărul de
+coduri, lista lor, referința primei apariții și câte rânduri folosesc
+fiecare cod, fără altă trecere (regex) pe coloană. Un rând cu același cod
+de mai multe ori ("RO+RO") e numărat o dată.
+
+CountryIndex e și statistica "parts" a rezultatelor parțiale din
+sharding.py: concat combină indexurile unor intervale consecutive de rânduri.
+"""
+import numpy as np
+import pandas as pd
+
+
+class CountryIndex:
+    """
+    codes: codurile distincte, în ordinea primei apariții;
+    rows / offsets: rândurile Excel ale fiecărui cod (vezi docstring-ul modulului).
+    """
+
+    __slots__ = ("codes", "rows", "offsets")
+
+    def __init__(self, codes, rows, offsets):
+        self.codes = codes
+        self.rows = rows
+        self.offsets = offsets
+
+    @classmethod
+    def from_column(cls, norm, first_row=2):
+        """Indexul celulelor completate din norm (column_cache.NormalizedColumn); poziția 0 e first_row."""
+        keep = np.flatnonzero(~norm.blank)
+        values = norm.values.to_numpy(dtype=object)[keep]
+        # doar celulele cu "+" sunt despărțite; celelalte (deja trim-uite) sunt chiar codul
+        plus = norm.values.str.contains("+", regex=False).to_numpy(dtype=bool)[keep]
+        parts = (
+            pd.Series(values[plus], index=keep[plus], dtype=object)
+              .str.split("+", regex=False)
+              .explode()
+              .str.strip()
+        )
+        parts = parts[(parts != "").to_numpy(dtype=bool)]
+        rows = np.concatenate([keep[~plus], parts.index.to_numpy(dtype=np.int64)])
+        # două serii crescătoare: sortarea stabilă le interclasează (ordinea rândurilor)
+        order = np.argsort(rows, kind="stable")
+        part_values = np.concatenate([values[~plus], parts.to_numpy(dtype=object)])[order]
+        codes, uniques = pd.factorize(part_values)
+        return cls._build(np.asarray(uniques, dtype=object), codes, rows[order] + first_row)
+
+    @classmethod
+    def _build(cls, uniques, codes, rows):
+        """codes[j] / rows[j]: codul și rândul Excel al fiecărei părți, cu rows crescător."""
+        # sortarea stabilă după cod păstrează rândurile crescătoare în fiecare grup
+        order = np.argsort(codes.astype(np.min_scalar_type(max(len(uniques) - 1, 0))), kind="stable")
+        codes, rows = codes[order], rows[order]
+        # același cod de mai multe ori pe un rând ("RO+RO"): o singură dată
+        first = np.ones(len(rows), dtype=bool)
+        first[1:] = (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])
+        offsets = np.zeros(len(uniques) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(codes[first], minlength=len(uniques)), out=offsets[1:])
+        return cls(uniques, rows[first].astype(np.int32), offsets)
+
+    @classmethod
+    def concat(cls, parts):
+        """Combină indexurile unor intervale de rânduri, date în ordinea rândurilor, cu un singur factorize."""
+        parts = list(parts)
+        ids, uniques = pd.factorize(np.concatenate([part.codes for part in parts]))
+        codes, start = [], 0
+        for part in parts:
+            local = ids[start:start + len(part.codes)]
+            codes.append(np.repeat(local, np.diff(part.offsets)))
+            start += len(part.codes)
+        rows = np.concatenate([part.rows for part in parts])
+        # rândurile fiecărei părți sunt crescătoare doar în grupul codului: înapoi în ordinea rândurilor
+        order = np.argsort(rows, kind="stable")
+        return cls._build(np.asarray(uniques, dtype=object), np.concatenate(codes)[order], rows[order])
+
+    def merge(self, other):
+        """Combină cu other (rânduri de după); ordinea primei apariții rămâne cea de sus."""
+        return CountryIndex.concat([self, other])
+
+    def moved(self, move):
+        """Aceleași coduri, cu rândurile move(rows) (move crescătoare: blocuri refolosite / eșantioane)."""
+        return CountryIndex(self.codes, np.asarray(move(self.rows)).astype(np.int32), self.offsets)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def counts(self):
+        """Câte rânduri folosesc fiecare cod, în ordinea codurilor."""
+        return np.diff(self.offsets)
+
+    def first_rows(self):
+        """Rândul Excel al primei apariții a fiecărui cod."""
+        return self.rows[self.offsets[:-1]]
+
+    def code_rows(self, code):
+        """Rândurile Excel (crescătoare) care folosesc code; gol dacă nu apare."""
+        found = np.flatnonzero(self.codes == code)
+        if not len(found):
+            return self.rows[:0]
+        i = found[0]
+        return self.rows[self.offsets[i]:self.offsets[i + 1]]
+
+    def usage(self):
+        """{cod: rânduri}, în ordinea primei apariții (câmpul "Rows Per Code" din raport)."""
+        return dict(zip(self.codes.tolist(), self.counts().tolist()))
@@ -1,8 +1,12 @@
 
-import re
+import numpy as np
 from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
 
+from column_cache import ColumnCache
+from duplicates import COMPOSITE_KEYS, DuplicateGroups
+from format_scanner import CHECK_NAMES, DataFormatScanner
+
 import warnings
 warnings.filterwarnings(
     "ignore",
@@ -53,97 +57,55 @@ class ReportDownloader:
 
 
 
-def export_data_format_fails(report_data, df, wb_original, mapping, save_path, sheet_name):
+def export_data_format_fails(report_data, catalog, mapping, save_path):
     """
     Exportează toate erorile (❌ Fail) din grupa "Data Format Checks" într-un fișier Excel.
 
     Parametri:
     - report_data: dict-ul complet cu raportul de validări
-    - df: pandas.DataFrame citit din Excel
-    - wb_original: openpyxl.Workbook încărcat din fișierul original
+    - catalog: CatalogLoader cu foaia selectată deja încărcată
     - mapping: dict {prop: header} folosit la group_b
     - save_path: calea completă unde se salvează fișierul .xlsx
+
+    Returnează (save_path, fail_counts), unde fail_counts = {check: nr. rânduri exportate},
+    ca apelantul să nu mai re-deschidă raportul salvat doar ca să numere rândurile.
     """
-    ws = wb_original[sheet_name]
-    checks = [
-        ("Demo Data", re.compile(r'\bdemo(?:brand|sku|_category)?\b', re.IGNORECASE)),
-        ("Special Characters", set("©$€£¥™®@")),
-        ("Formulas", "="),
-        ("HTML Tags", re.compile(r'<[^>]+>|&lt;[^&]+&gt;'))
-    ]
+    df = catalog.df
 
     # aflăm care verificări au fost cu Fail în raportul inițial
     failed = {
         it["Check Performed"]
         for it in report_data.get("Data Format Checks", [])
         if it.get("Check Outcome", "").startswith("❌")
-}
-# păstrăm ordinea originală, dar doar pe cele fail‑uite
-    checks = [
-        (name, pattern)
-        for name, pattern in [
-            ("Demo Data",           re.compile(r'\bdemo(?:brand|sku|_category)?\b', re.IGNORECASE)),
-            ("Special Characters",  set("©$€£¥™®@")),
-            ("Formulas",            "="),
-            ("HTML Tags",           re.compile(r'<[^>]+>|&lt;[^&]+&gt;'))
-        ]
-        if name in failed
-]
+    }
+    # păstrăm ordinea originală, dar doar pe cele fail‑uite
+    checks = [name for name in CHECK_NAMES if name in failed]
 
+    # literele coloanelor mapate, în ordinea din mapping
+    letters = []
+    for prop, header in mapping.items():
+        if header not in df.columns:
+            continue
+        col_letter = catalog.header_letters.get(header)
+        if col_letter:
+            letters.append(col_letter)
 
     wb_out = Workbook()
     wb_out.remove(wb_out.active)
 
+    # fiecare coloană e scanată o singură dată, pentru toate verificările
+    scanner = DataFormatScanner(catalog)
     sheet = None
-    for name, pattern in checks:
+    fail_counts = {}
+    for name in checks:
         fails_for_check = []
-        for prop, header in mapping.items():
-            if header not in df.columns:
-                continue
-            # găsește litera coloanei în wb_original
-            col_letter = None
-            for cell in ws[1]:
-                if str(cell.value).strip() == header:
-                    col_letter = cell.column_letter
-                    break
-            if not col_letter:
-                continue
-
-            for idx, raw in enumerate(ws[col_letter][1:], start=2):
-                text = str(raw.value or "").strip()
-
-                if name == "Demo Data":
-        # —> un entry pentru fiecare “demo”
-                    for m in pattern.finditer(text):
-                        fails_for_check.append((idx, m.group(0), f"{col_letter}{idx}"))
-
-                elif name == "Special Characters":
-        # păstrează cum ai deja, per‑occurrence
-                    counts = {ch: text.count(ch) for ch in pattern if text.count(ch) > 0}
-                    for ch, cnt in counts.items():
-                        for _ in range(cnt):
-                            fails_for_check.append((idx, ch, f"{col_letter}{idx}"))
-                # elif name == "Formulas":
-                # # —> un entry pentru fiecare “=” din text
-                #     eq_count = text.count("=")
-                #     for _ in range(eq_count):
-                #         fails_for_check.append((idx, "=", f"{col_letter}{idx}"))
-                elif name == "Formulas":
-    # un singur entry dacă celula începe cu “=”
-                    if text.startswith("="):
-                        fails_for_check.append((idx, "=", f"{col_letter}{idx}"))
-
-
-                elif name == "HTML Tags":
-        # —> un entry pentru fiecare tag găsit
-                    for tag in pattern.findall(text):
-                        fails_for_check.append((idx, tag, f"{col_letter}{idx}"))
-
-
-                if not fails_for_check:
-                    continue
+        for col_letter, idx, snippet in scanner.fails(name, letters):
+            # Formulas: un singur entry dacă celula începe cu “=”
+            example = "=" if name == "Formulas" else snippet
+            fails_for_check.append((idx, example, f"{col_letter}{idx}"))
 
         # creează sheet pentru acest check
+        fail_counts[name] = len(fails_for_check)
         sheet = wb_out.create_sheet(title=name[:31])
         sheet.append(["Check Performed", "Explanation", "Cell Fail Reference"])
         for _row, example, ref in fails_for_check:
@@ -156,14 +118,131 @@ def export_data_format_fails(report_data, df, wb_original, mapping, save_path, s
             sheet.append([name, explanation, ref])
 
     wb_out.save(save_path)
-    return save_path
+    return save_path, fail_counts
+
+
+
+MAX_SPANS_PER_CELL = 500
+
+# coloanele pe care rulează verificările de unicitate (group_d, group_h), în ordinea raportului
+UNIQUENESS_PROPS = [
+    "Product ID", "Product Name (English)",
+    "SKU", "EAN", "UPC", "GTIN", "CTIN", "ASIN",
+    "Product Name (Local Language)",
+    "Product Description (English)",
+    "Product Description (Local Language)",
+    "Product URL", "Product Video URL",
+    "MSRP", "MAP", "Product Image URL"
+]
+
+
+def export_duplicate_groups(df, mapping, save_path, extra_id_cols=None, composite_keys=COMPOSITE_KEYS):
+    """
+    Exportează toate grupurile de duplicate (valoare → celulele ei) într-un fișier Excel,
+    câte un sheet pentru fiecare verificare de unicitate cu duplicate.
+
+    Parametri:
+    - df: DataFrame-ul foii încărcate (header-ele originale, literele = pozițiile)
+    - mapping: dict {prop: header}
+    - save_path: calea completă unde se salvează fișierul .xlsx
+    - extra_id_cols: proprietăți suplimentare verificate de group_h
+    - composite_keys: chei compuse, ex. ("Country", "Product ID"); exportate doar
+      dacă toate proprietățile sunt mapate
+
+    Returnează (save_path, group_counts), unde group_counts = {check: nr. grupuri exportate}.
+    """
+    columns = ColumnCache(df)
+
+    # 1) Cheile: proprietățile mapate, apoi cheile compuse
+    keys = []
+    props = UNIQUENESS_PROPS + [p for p in (extra_id_cols or []) if p not in UNIQUENESS_PROPS]
+    for prop in props:
+        if mapping.get(prop) in df.columns:
+            keys.append((f"{prop} Uniqueness", [mapping[prop]]))
+    for key in composite_keys:
+        if all(mapping.get(prop) in df.columns for prop in key):
+            keys.append((f"{' + '.join(key)} Uniqueness", [mapping[prop] for prop in key]))
+
+    # 2) Un sheet per verificare cu duplicate; un rând per grup, rândurile
+    #    consecutive comprimate în intervale (ex. "D2:D9, D14")
+    wb_out = Workbook(write_only=True)
+    group_counts = {}
+    for name, headers in keys:
+        groups = DuplicateGroups.from_columns([columns.get(header, name) for header in headers])
+        if not len(groups):
+            continue
+        group_counts[name] = len(groups)
+        letters = [get_column_letter(columns.position(header) + 1) for header in headers]
+        sheet = wb_out.create_sheet(title=_sheet_title(name))
+        sheet.append(["Check Performed", "Group", "Value", "Group Size", "Cell References"])
+        for number, (key, rows) in enumerate(groups, start=1):
+            value = " | ".join(key)
+            spans = _row_spans(rows)
+            # o celulă Excel are max. 32767 caractere: grupurile mari continuă pe rândurile următoare
+            for i in range(0, len(spans), MAX_SPANS_PER_CELL):
+                refs = ", ".join(
+                    f"{letter}{start}" if start == stop else f"{letter}{start}:{letter}{stop}"
+                    for start, stop in spans[i:i + MAX_SPANS_PER_CELL]
+                    for letter in letters
+                )
+                sheet.append([name, number, value, len(rows), refs])
+
+    if not group_counts:
+        wb_out.create_sheet(title="No Duplicates")
+    wb_out.save(save_path)
+    return save_path, group_counts
+
+
+def export_all_failures(failures, save_path):
+    """
+    Exportează toate celulele care pică, înregistrate de validate_file(..., all_failures=...),
+    câte un sheet per grup de validări; referințele sunt generate abia aici, din
+    rândurile int32 (failures.FailureRows), comprimate în intervale (ex. "E2:E9, E14").
+
+    Returnează (save_path, cell_counts), unde cell_counts = {check: nr. celule care pică}.
+    """
+    wb_out = Workbook(write_only=True)
+    sheets = {}
+    cell_counts = {}
+    for group, check, cells in failures:
+        sheet = sheets.get(group)
+        if sheet is None:
+            sheet = sheets[group] = wb_out.create_sheet(title=_sheet_title(group))
+            sheet.append(["Check Performed", "Column", "Failing Cells", "Cell References"])
+        for column, letter, rows in cells:
+            cell_counts[check] = cell_counts.get(check, 0) + len(rows)
+            spans = _row_spans(rows)
+            # o celulă Excel are max. 32767 caractere: coloanele mari continuă pe rândurile următoare
+            for i in range(0, len(spans), MAX_SPANS_PER_CELL):
+                refs = ", ".join(
+                    f"{letter}{start}" if start == stop else f"{letter}{start}:{letter}{stop}"
+                    for start, stop in spans[i:i + MAX_SPANS_PER_CELL]
+                )
+                sheet.append([check, column, len(rows), refs])
+
+    if not sheets:
+        wb_out.create_sheet(title="No Failures")
+    wb_out.save(save_path)
+    return save_path, cell_counts
+
+
+def _row_spans(rows):
+    """Rândurile crescătoare ca intervale consecutive [(start, stop)]."""
+    rows = np.asarray(rows, dtype=np.int64)
+    breaks = np.flatnonzero(np.diff(rows) != 1) + 1
+    starts = rows[np.concatenate(([0], breaks))]
+    stops = rows[np.concatenate((breaks - 1, [len(rows) - 1]))]
+    return list(zip(starts.tolist(), stops.tolist()))
+
 
+def _sheet_title(name):
+    # Excel: max. 31 caractere, fără []:*?/\
+    return "".join("_" if ch in '[]:*?/\\' else ch for ch in name)[:31]
 
 
 if __name__ == '__main__':
     import sys
-    import pandas as pd
-    from openpyxl import load_workbook
+    from catalog_loader import CatalogLoader
 
     if len(sys.argv) != 6:
         # print("Usage: python export_fail_report.py <report_json> <excel_path> <mapping_json> <sheet_name> <output_path>")
@@ -177,8 +256,8 @@ if __name__ == '__main__':
     output_path = sys.argv[5]
 
     # încarcă datele
-    df = pd.read_excel(excel_file, sheet_name=sheet_name, dtype=str)
-    wb_original = load_workbook(excel_file, data_only=True)
+    catalog = CatalogLoader(excel_file)
+    catalog.load_sheet(sheet_name)
 
-    path = export_data_format_fails(report_data, df, wb_original, mapping, output_path)
+    path, _ = export_data_format_fails(report_data, catalog, mapping, output_path)
     # print(f"Fail report saved to {path}")
@@ -0,0 +1,92 @@
+"""
+Motorul de duplicate pentru verificările de unicitate (uniqueness_check,
+group_h) și pentru exportul tuturor grupurilor
+(downloadfailreport.export_duplicate_groups).
+
+O singură trecere pe coloana normalizată: pd.factorize (tabel hash) dă
+codul fiecărei celule nevide, np.bincount numărul de apariții per valoare.
+Grupurile valoare → rânduri sunt păstrate compact, ca CSR:
+    rows    : rândurile Excel ale celulelor duplicate, grupate (stabil) după valoare
+    offsets : grupul i = rows[offsets[i]:offsets[i + 1]]
+Grupurile sunt în ordinea primei apariții. Memorie: codurile celulelor,
+valorile distincte și rândurile duplicate, fără liste Python per valoare.
+
+Chei compuse (ex. ("Country", "Product ID")): codurile fiecărei coloane sunt
+combinate și re-factorizate, deci rămân sub numărul de rânduri. Celulele
+goale (după trim) nu intră în niciun grup; la cheile compuse, rândul e
+ignorat dacă oricare parte e goală.
+"""
+import numpy as np
+import pandas as pd
+
+COMPOSITE_KEYS = [("Country", "Product ID")]
+
+
+class DuplicateGroups:
+    """
+    Grupurile de duplicate pentru o cheie (una sau mai multe coloane normalizate).
+
+        groups = DuplicateGroups.from_columns([columns.get("Product ID")])
+        groups.fail_count     # celule în grupuri cu cel puțin 2 apariții
+        for key, rows in groups: ...
+    """
+
+    def __init__(self, key_values, rows, offsets, total, distinct):
+        self.key_values = key_values
+        self.rows = rows
+        self.offsets = offsets
+        self.total = total
+        self.distinct = distinct
+
+    @classmethod
+    def from_columns(cls, norms, first_row=2):
+        """norms: listă de column_cache.NormalizedColumn de aceeași lungime."""
+        # 1) Rândurile cu toate părțile cheii nevide
+        keep = ~np.logical_or.reduce([norm.blank for norm in norms])
+        idx = np.flatnonzero(keep)
+
+        # 2) Codul cheii per rând: factorize per coloană, apoi pe codurile combinate
+        codes = None
+        distinct = 0
+        for norm in norms:
+            part, uniques = pd.factorize(norm.values.to_numpy(dtype=object)[idx])
+            if codes is None:
+                codes, distinct = part, len(uniques)
+            else:
+                codes, combined = pd.factorize(codes * len(uniques) + part)
+                distinct = len(combined)
+        if codes is None:
+            codes = np.empty(0, dtype=np.int64)
+
+        # 3) Doar valorile cu cel puțin 2 apariții, grupate stabil după cod
+        counts = np.bincount(codes, minlength=distinct)
+        dup = counts[codes] > 1
+        dup_pos = idx[dup]
+        dup_codes = codes[dup]
+        order = np.argsort(dup_codes, kind="stable")
+        group_codes = np.unique(dup_codes)
+        offsets = np.zeros(len(group_codes) + 1, dtype=np.int64)
+        np.cumsum(counts[group_codes], out=offsets[1:])
+        positions = dup_pos[order]
+
+        firsts = positions[offsets[:-1]]
+        key_values = [norm.values.to_numpy(dtype=object)[firsts] for norm in norms]
+        return cls(key_values, positions + first_row, offsets, len(idx), distinct)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        """(cheia ca tuple, rândurile Excel ale grupului), în ordinea primei apariții."""
+        for i in range(len(self)):
+            key = tuple(values[i] for values in self.key_values)
+            yield key, self.rows[self.offsets[i]:self.offsets[i + 1]].tolist()
+
+    @property
+    def fail_count(self):
+        """Numărul de celule care fac parte dintr-un grup de duplicate."""
+        return len(self.rows)
+
+    def first_row(self):
+        """Primul rând Excel cu valoare duplicată sau None."""
+        return int(self.rows[0]) if len(self.rows) else None
@@ -0,0 +1,111 @@
+"""
+Modul "all failures": TOATE celulele care pică, nu doar primul exemplu.
+
+Fiecare verificare păstrează, per (grup, check, coloană), rândurile Excel care
+pică ca np.ndarray int32 crescător (4 octeți per celulă): detaliul complet pe
+o foaie de 1M de rânduri costă câțiva MB, nu sute de MB de șiruri Python.
+Referințele ("E5", "E2:E9") sunt generate doar la afișare / export
+(refs, ranges, downloadfailreport.export_all_failures).
+
+    failures = FailureRows()
+    report = validate_file(df, catalog, mapped_props=..., all_failures=failures)
+    failures.ranges("Mandatory Data - Completeness Checks", "Brand Completeness")
+"""
+import threading
+from collections import namedtuple
+
+import numpy as np
+
+from check_digits import cell_ranges
+
+# column: header-ul din df; letter: litera Excel; rows: rânduri Excel int32 crescătoare, unice
+FailedCells = namedtuple("FailedCells", ["column", "letter", "rows"])
+
+
+class GroupFailures:
+    """Vederea unui grup asupra FailureRows: grupurile înregistrează doar (check, coloană, rânduri)."""
+
+    __slots__ = ("store", "group")
+
+    def __init__(self, store, group):
+        self.store = store
+        self.group = group
+
+    def add(self, check, column, letter, rows):
+        self.store.add(self.group, check, column, letter, rows)
+
+
+class FailureRows:
+    """
+    entries[(grup, check)] = [FailedCells, ...], în ordinea coloanelor raportate.
+    Sigur între thread-uri (validate_file cu workers > 1).
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self._lock = threading.Lock()
+
+    def group(self, name):
+        return GroupFailures(self, name)
+
+    def clear(self):
+        with self._lock:
+            self.entries = {}
+
+    def add(self, group, check, column, letter, rows):
+        """Înregistrează rândurile (orice ordine, cu repetiții) care pică pe o coloană."""
+        rows = np.unique(np.asarray(rows, dtype=np.int64)).astype(np.int32)
+        if not len(rows):
+            return
+        with self._lock:
+            self.entries.setdefault((group, check), []).append(FailedCells(column, letter, rows))
+
+    def __iter__(self):
+        """(grup, check, [FailedCells]) în ordinea înregistrării."""
+        for (group, check), cells in list(self.entries.items()):
+            yield group, check, cells
+
+    def group_entries(self, group):
+        """[(check, [FailedCells])] pentru un grup, în ordinea înregistrării."""
+        return [(check, cells) for (g, check), cells in list(self.entries.items()) if g == group]
+
+    def pop_group(self, group):
+        """Ca group_entries, dar scoate grupul din store (ex. după ce a fost scris în stream)."""
+        found = self.group_entries(group)
+        with self._lock:
+            for check, _ in found:
+                self.entries.pop((group, check), None)
+        return found
+
+    def cells(self, group, check):
+        return self.entries.get((group, check), [])
+
+    def count(self, group, check):
+        """Numărul de celule care pică (o celulă cu mai multe hit-uri contează o dată)."""
+        return sum(len(c.rows) for c in self.cells(group, check))
+
+    def refs(self, group, check):
+        """Generator: referințele celulă cu celulă ("E5"), produse la cerere."""
+        for c in self.cells(group, check):
+            for row in c.rows.tolist():
+                yield f"{c.letter}{row}"
+
+    def ranges(self, group, check):
+        """Referințele comprimate în intervale consecutive: "E2:E9, E14, F3"."""
+        return ", ".join(cell_ranges(c.letter, c.rows) for c in self.cells(group, check))
+
+    @property
+    def nbytes(self):
+        return sum(c.rows.nbytes for cells in self.entries.values() for c in cells)
+
+    def report(self):
+        """Sumarul pentru raport: celulele care pică per grup / check și memoria ocupată."""
+        groups = {}
+        for group, check, cells in self:
+            groups.setdefault(group, {})[check] = sum(len(c.rows) for c in cells)
+        return {
+            "Checks": len(self.entries),
+            "Failing Cells": sum(sum(g.values()) for g in groups.values()),
+            "Bytes": self.nbytes,
+            "Groups": groups,
+        }
@@ -0,0 +1,142 @@
+"""
+Scanner pentru Data Format Checks (Demo Data, Special Characters, Formulas,
+HTML Tags).
+
+Fiecare celulă e vizitată o singură dată: un regex combinat (prefiltru)
+alege celulele care pot avea vreun hit, iar extractorii exacți ai fiecărei
+reguli rulează doar pe acestea. O variantă cu operații .str pe coloana
+întreagă dă aceleași hit-uri, dar e mai lentă cu pandas pe str Python (fără
+pyarrow); e păstrată doar ca referință în benchmarks/bench_format_scanner.py.
+
+Folosit de validator.group_b și de downloadfailreport.export_data_format_fails.
+"""
+import re
+from collections import Counter
+
+import numpy as np
+
+DEMO_PATTERN = re.compile(r'\bdemo(?:brand|sku|_category)?\b', re.IGNORECASE)
+# ordinea fixă în care sunt raportate caracterele speciale dintr-o celulă
+SPECIAL_CHARS = "©$€£¥™®@"
+HTML_PATTERN = re.compile(r'<[^>]+>|&lt;[^&]+&gt;')
+
+CHECK_NAMES = ("Demo Data", "Special Characters", "Formulas", "HTML Tags")
+
+# orice hit Demo/Special/HTML conține cel puțin unul dintre acești atomi
+_PREFILTER = re.compile(r'demo|<|&lt;|[' + re.escape(SPECIAL_CHARS) + r']', re.IGNORECASE)
+_SPECIAL_PATTERN = re.compile(r'[' + re.escape(SPECIAL_CHARS) + r']')
+
+_NO_ROWS = np.empty(0, dtype=np.int64)
+
+
+class DataFormatScanner:
+    """
+    Scanează coloanele unui CatalogLoader o singură dată și păstrează
+    hit-urile per coloană:
+
+        hits[col_letter][check] = (rows, snippets)
+
+    rows = np.ndarray cu rândurile Excel (int64), snippets = lista paralelă:
+    potrivirea regex-ului (Demo / HTML), caracterul (Special Characters) sau
+    textul întreg al celulei (Formulas).
+    Statistici în scanner.stats: celule vizitate / candidați după prefiltru.
+    """
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.hits = {}
+        self.stats = {"cells": 0, "candidates": 0}
+
+    def scan_column(self, col_letter):
+        """Hit-urile coloanei col_letter (scanată o singură dată)."""
+        found = self.hits.get(col_letter)
+        if found is None:
+            found = scan_values(self.catalog.column_values(col_letter), stats=self.stats)
+            self.hits[col_letter] = found
+        return found
+
+    # ── rezultate ───────────────────────────────────────────────────────
+    def summary(self, check, col_letters):
+        """
+        (număr total de hit-uri, primul hit ca (col_letter, rând, snippet) sau None)
+        pentru regula check, în ordinea coloanelor date.
+        """
+        total = 0
+        first = None
+        for col_letter in col_letters:
+            rows, snippets = self.scan_column(col_letter)[check]
+            if first is None and len(rows):
+                first = (col_letter, int(rows[0]), snippets[0])
+            total += len(rows)
+        return total, first
+
+    def fails(self, check, col_letters):
+        """
+        Toate hit-urile regulii check, în ordinea coloanelor date
+        (apoi rând, apoi poziția în celulă): [(col_letter, rând, snippet)].
+        """
+        out = []
+        for col_letter in col_letters:
+            rows, snippets = self.scan_column(col_letter)[check]
+            out.extend(zip([col_letter] * len(rows), rows.tolist(), snippets))
+        return out
+
+
+def scan_values(values, first_row=2, stats=None, checks=CHECK_NAMES):
+    """
+    Scanarea unei liste de valori text (celulele goale = ""):
+    {check: (rows, snippets)}, cu rândurile Excel numerotate de la first_row.
+    Folosit și pe shard-uri de rânduri (sharding.py); checks = doar aceste
+    verificări (triage.py nu mai caută hit-uri pentru cele deja decise).
+    """
+    demo, special, formulas, html = [], [], [], []
+    want_demo = "Demo Data" in checks
+    want_special = "Special Characters" in checks
+    want_html = "HTML Tags" in checks
+    prefilter = _PREFILTER.search
+    candidates = 0
+    cells = enumerate(values, start=first_row)
+    if not (want_demo or want_special or want_html):
+        # doar Formulas: fără prefiltru, iar strip() doar pe celulele care conțin "="
+        cells = ((row_num, raw) for row_num, raw in cells if "=" in raw)
+        prefilter = None
+    for row_num, raw in cells:
+        text = raw.strip()
+        if not text:
+            continue
+        if text[0] == "=":
+            formulas.append((row_num, text))
+        if prefilter is None or prefilter(text) is None:
+            continue
+
+        candidates += 1
+        if want_demo:
+            for m in DEMO_PATTERN.finditer(text):
+                demo.append((row_num, m.group(0)))
+        if want_special:
+            chars = _SPECIAL_PATTERN.findall(text)
+            if chars:
+                counts = Counter(chars)
+                for ch in SPECIAL_CHARS:
+                    special.extend([(row_num, ch)] * counts.get(ch, 0))
+        if want_html:
+            for tag in HTML_PATTERN.findall(text):
+                html.append((row_num, tag))
+
+    if stats is not None:
+        stats["cells"] += len(values)
+        stats["candidates"] += candidates
+    found = {
+        "Demo Data": demo,
+        "Special Characters": special,
+        "Formulas": formulas,
+        "HTML Tags": html,
+    }
+    return {check: _as_arrays(found[check]) for check in CHECK_NAMES if check in checks}
+
+
+def _as_arrays(hits):
+    if not hits:
+        return _NO_ROWS, []
+    rows, snippets = zip(*hits)
+    return np.array(rows, dtype=np.int64), list(snippets)
@@ -0,0 +1,299 @@
+"""
+Index local, persistent, al identificatorilor din toate cataloagele validate:
+validate_file(..., id_index=IdentifierIndex()).
+
+Același Product ID / EAN în două cataloage (ex. cataloagele pe țări ale
+aceluiași brand) e un defect pe care group_d / group_h nu îl văd, fiindcă
+lucrează pe o singură foaie.
+
+Pentru fiecare (catalog, prop) din CROSS_CATALOG_PROPS, indexul păstrează
+într-un rând SQLite valorile distincte (trim-uite, fără celule goale) ca
+amprente de 128 de biți (două pd.util.hash_array cu chei diferite), sortate,
+plus rândul Excel al primei apariții:
+    keys : uint64 (2 x n), sortat după prima amprentă
+    rows : int32 (n), aliniat cu keys
+La validare, amprentele valorilor curente sunt căutate vectorizat
+(np.searchsorted) în array-urile celorlalte cataloage; apoi rândurile
+catalogului curent sunt înlocuite, într-o singură tranzacție. Un rând per
+(catalog, prop) în loc de un rând per identificator: un catalog de 500k
+rânduri se verifică față de milioane de identificatori în sub o secundă.
+
+Un catalog = (calea absolută a fișierului, foaia): re-validarea aceluiași
+fișier îi înlocuiește intrările. O versiune nouă salvată sub alt nume apare
+ca alt catalog; forget() scoate din index un fișier vechi.
+
+Schema (SQLite):
+    catalogs(id, file, sheet, updated)              UNIQUE (file, sheet)
+    identifiers(catalog, prop, letter, count, keys, rows)   PRIMARY KEY (catalog, prop)
+"""
+import os
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+from openpyxl.utils import get_column_letter
+
+from column_cache import ColumnCache
+from validator import report_check
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".offline_catalog_validator", "identifiers.sqlite")
+CROSS_CATALOG_GROUP = "Cross-Catalog Data - Uniqueness Checks"
+CROSS_CATALOG_PROPS = ["Product ID", "EAN", "UPC", "GTIN"]
+INDEX_VERSION = 1
+
+# a doua cheie de hash (16 caractere), independentă de cea implicită din pandas
+_SECOND_HASH_KEY = "cross-catalog-id"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key     TEXT PRIMARY KEY,
+    value   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS catalogs (
+    id      INTEGER PRIMARY KEY,
+    file    TEXT NOT NULL,
+    sheet   TEXT NOT NULL,
+    updated REAL NOT NULL,
+    UNIQUE (file, sheet)
+);
+CREATE TABLE IF NOT EXISTS identifiers (
+    catalog INTEGER NOT NULL REFERENCES catalogs (id),
+    prop    TEXT NOT NULL,
+    letter  TEXT NOT NULL,
+    count   INTEGER NOT NULL,
+    keys    BLOB NOT NULL,
+    rows    BLOB NOT NULL,
+    PRIMARY KEY (catalog, prop)
+);
+"""
+
+
+def value_keys(values):
+    """Amprentele de 128 de biți ale valorilor, ca array uint64 (2 x n)."""
+    values = np.asarray(values, dtype=object)
+    return np.vstack([
+        pd.util.hash_array(values, categorize=False),
+        pd.util.hash_array(values, hash_key=_SECOND_HASH_KEY, categorize=False),
+    ])
+
+
+def find_keys(sorted_keys, keys):
+    """
+    Poziția fiecărei amprente din keys în sorted_keys (ambele 2 x n, sortate
+    după prima amprentă) sau -1 dacă lipsește.
+    """
+    found = np.full(keys.shape[1], -1, dtype=np.int64)
+    if not sorted_keys.shape[1] or not keys.shape[1]:
+        return found
+    pos = np.searchsorted(sorted_keys[0], keys[0])
+    pos = np.minimum(pos, sorted_keys.shape[1] - 1)
+    hit = (sorted_keys[0, pos] == keys[0]) & (sorted_keys[1, pos] == keys[1])
+    found[hit] = pos[hit]
+    return found
+
+
+class IdentifierIndex:
+    """
+    Indexul identificatorilor (SQLite în path). check_catalog() este grupul
+    de validare; stats: valori verificate / conflicte / durata ultimei rulări.
+    O conexiune nouă per apel, deci poate rula pe thread-ul unui grup.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.stats = {}
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executescript(_SCHEMA)
+                # alt format al amprentelor: intrările vechi nu mai pot fi comparate
+                found = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+                if found is None or found[0] != str(INDEX_VERSION):
+                    conn.execute("DELETE FROM identifiers")
+                    conn.execute("DELETE FROM catalogs")
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                        (str(INDEX_VERSION),),
+                    )
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ── grupul de validare ──────────────────────────────────────────────
+    def check_catalog(self, df, catalog, mapped_props=None, columns=None):
+        """
+        Cross-Catalog Data - Uniqueness Checks: pentru fiecare prop din
+        CROSS_CATALOG_PROPS, celulele cu valori care există deja în alte
+        cataloage din index; apoi catalogul curent e (re)scris în index.
+        """
+        started = time.perf_counter()
+        mapped = set(mapped_props or [])
+        if columns is None:
+            columns = ColumnCache(df)
+        df = df.loc[:, ~df.columns.duplicated()]
+
+        # 1) Valorile distincte per prop: valori, nr. de celule, primul rând Excel
+        present = {}
+        for prop in CROSS_CATALOG_PROPS:
+            if (mapped and prop not in mapped) or prop not in df.columns:
+                continue
+            norm = columns.get(prop, f"{prop} Cross-Catalog Uniqueness")
+            keep = np.flatnonzero(~norm.blank)
+            codes, uniques = pd.factorize(norm.values.to_numpy(dtype=object)[keep])
+            _, first = np.unique(codes, return_index=True)
+            # valorile sortate după prima amprentă: căutări searchsorted cu acces secvențial
+            keys = value_keys(uniques)
+            order = np.argsort(keys[0], kind="stable")
+            present[prop] = {
+                "letter": get_column_letter(df.columns.get_loc(prop) + 1),
+                "values": np.asarray(uniques, dtype=object)[order],
+                "counts": np.bincount(codes, minlength=len(uniques))[order],
+                "rows": (keep[first] + 2)[order],
+                "keys": np.ascontiguousarray(keys[:, order]),
+            }
+
+        # 2) Căutarea în celelalte cataloage + înlocuirea intrărilor catalogului curent
+        conn = self._connect()
+        try:
+            with conn:
+                catalog_id = self._catalog_id(conn, catalog)
+                for prop, cur in present.items():
+                    self._find_conflicts(conn, catalog_id, prop, cur)
+
+                conn.execute("DELETE FROM identifiers WHERE catalog = ?", (catalog_id,))
+                for prop, cur in present.items():
+                    conn.execute(
+                        "INSERT INTO identifiers (catalog, prop, letter, count, keys, rows)"
+                        " VALUES (?, ?, ?, ?, ?, ?)",
+                        (catalog_id, prop, cur["letter"], len(cur["rows"]),
+                         cur["keys"].tobytes(), cur["rows"].astype(np.int32).tobytes()),
+                    )
+        finally:
+            conn.close()
+
+        # 3) Rezultatele, în ordinea CROSS_CATALOG_PROPS
+        results = []
+        for prop in CROSS_CATALOG_PROPS:
+            check_name = f"{prop} Cross-Catalog Uniqueness"
+            common = {
+                "Check Fail Count": 0,
+                "Check Fail Example": "",
+                "Check Fail Example Cell Reference": ""
+            }
+            if mapped and prop not in mapped:
+                results.append(report_check(check_name, "⏭️ Skip", Explanation="Not mapped", **common))
+                continue
+            if prop not in present:
+                results.append(report_check(check_name, "⏭️ Skip", Explanation="Column missing", **common))
+                continue
+            cur = present[prop]
+            if not len(cur["values"]):
+                results.append(report_check(check_name, "⏭️ Skip", Explanation="No data present", **common))
+                continue
+
+            hits = np.flatnonzero(cur["other"] >= 0)
+            if not len(hits):
+                results.append(report_check(check_name, "✅ Pass", Explanation="", **common))
+                continue
+
+            # exemplul: prima celulă din catalogul curent cu o valoare deja indexată
+            example = hits[np.argmin(cur["rows"][hits])]
+            other_file, other_sheet, other_letter = cur["catalogs"][cur["other"][example]]
+            others = len({cur["catalogs"][i][:2] for i in np.unique(cur["other"][hits]).tolist()})
+            common["Check Fail Count"] = int(cur["counts"][hits].sum())
+            common["Check Fail Example"] = cur["values"][example]
+            common["Check Fail Example Cell Reference"] = f"{cur['letter']}{int(cur['rows'][example])}"
+            results.append(report_check(
+                check_name, "❌ Fail",
+                Explanation=(
+                    f"Also in {os.path.basename(other_file)} "
+                    f"({other_sheet}!{other_letter}{int(cur['other_rows'][example])})"
+                    + (f" and {others - 1} other catalog(s)" if others > 1 else "")
+                ),
+                **common
+            ))
+
+        self.stats = {
+            "Values": sum(len(cur["values"]) for cur in present.values()),
+            "Conflicts": sum(int((cur["other"] >= 0).sum()) for cur in present.values()),
+            "Seconds": round(time.perf_counter() - started, 4),
+        }
+        return results
+
+    @staticmethod
+    def _find_conflicts(conn, catalog_id, prop, cur):
+        """
+        Completează cur cu: other (indexul primului catalog, în ordinea
+        fișierelor, care conține valoarea, sau -1), other_rows (rândul Excel
+        acolo) și catalogs ([(file, sheet, literă)]).
+        """
+        n = len(cur["values"])
+        cur["other"] = np.full(n, -1, dtype=np.int64)
+        cur["other_rows"] = np.zeros(n, dtype=np.int64)
+        cur["catalogs"] = []
+        query = conn.execute(
+            "SELECT k.file, k.sheet, i.letter, i.keys, i.rows"
+            " FROM identifiers i JOIN catalogs k ON k.id = i.catalog"
+            " WHERE i.prop = ? AND i.catalog != ?"
+            " ORDER BY k.file, k.sheet",
+            (prop, catalog_id),
+        )
+        for other_file, other_sheet, letter, keys, rows in query:
+            sorted_keys = np.frombuffer(keys, dtype=np.uint64).reshape(2, -1)
+            found = find_keys(sorted_keys, cur["keys"])
+            new = (found >= 0) & (cur["other"] < 0)
+            if new.any():
+                cur["other"][new] = len(cur["catalogs"])
+                cur["other_rows"][new] = np.frombuffer(rows, dtype=np.int32)[found[new]]
+            cur["catalogs"].append((other_file, other_sheet, letter))
+
+    # ── administrare ────────────────────────────────────────────────────
+    def forget(self, path, sheet=None):
+        """Scoate din index fișierul path (toate foile sau doar sheet)."""
+        file = os.path.abspath(path)
+        conn = self._connect()
+        try:
+            with conn:
+                query = "SELECT id FROM catalogs WHERE file = ?"
+                params = (file,)
+                if sheet is not None:
+                    query += " AND sheet = ?"
+                    params += (sheet,)
+                for (catalog_id,) in conn.execute(query, params).fetchall():
+                    conn.execute("DELETE FROM identifiers WHERE catalog = ?", (catalog_id,))
+                    conn.execute("DELETE FROM catalogs WHERE id = ?", (catalog_id,))
+        finally:
+            conn.close()
+
+    def catalogs(self):
+        """[(file, sheet, nr. identificatori distincți)] pentru toate cataloagele din index."""
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT k.file, k.sheet, COALESCE(SUM(i.count), 0) FROM catalogs k"
+                " LEFT JOIN identifiers i ON i.catalog = k.id GROUP BY k.id ORDER BY k.file, k.sheet"
+            ).fetchall()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _catalog_id(conn, catalog):
+        file = os.path.abspath(catalog.path)
+        sheet = catalog.sheet_name or ""
+        conn.execute(
+            "INSERT INTO catalogs (file, sheet, updated) VALUES (?, ?, ?)"
+            " ON CONFLICT (file, sheet) DO UPDATE SET updated = excluded.updated",
+            (file, sheet, time.time()),
+        )
+        return conn.execute(
+            "SELECT id FROM catalogs WHERE file = ? AND sheet = ?", (file, sheet)
+        ).fetchone()[0]
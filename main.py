@@ -1,6 +1,6 @@
 # main.py
-import sys
 import argparse
+import multiprocessing
 from offline_app import main as launch_gui
 from downloadfailreport import export_data_format_fails
 
@@ -8,6 +8,54 @@ def cli_report(args):
     # aici poți prelua argumente din linia de comandă, dacă ai nevoie
     export_data_format_fails()
 
+def cli_validate(args):
+    # validare fără GUI: raportul ca NDJSON (fișier sau stdout), pentru pipeline-uri
+    import json
+    from catalog_loader import CatalogLoader
+    from report_stream import NdjsonReport
+    from triage import TriageScan
+    from validator import VALIDATION_GROUP_ORDER, validate_file
+
+    catalog = CatalogLoader(args.validate)
+    sheet = args.sheet or catalog.sheetnames[0]
+    rename = None
+    if args.mapping:
+        # {proprietate: header din fișier}, ca în tab-ul de mapping
+        with open(args.mapping, encoding="utf-8") as fh:
+            mapped_props = json.load(fh)
+        rename = {header: prop for prop, header in mapped_props.items()}
+
+    def prepare(df):
+        if rename is None:
+            return df
+        df = df.rename(columns=rename)
+        return df.loc[:, ~df.columns.duplicated()]
+
+    if args.memory_budget:
+        # foaia citită pe blocuri, cu memoria mărginită; raportul e scris la final
+        from chunked import validate_chunked
+
+        if rename is None:
+            header = next(catalog.iter_chunks(sheet, 1))[1]
+            mapped_props = {col: col for col in header.columns}
+        report = validate_chunked(catalog, sheet, extra_id_cols=args.extra_id, mapped_props=mapped_props,
+                                  prepare=prepare, memory_mb=args.memory_budget)
+        with NdjsonReport(args.output) as stream:
+            stream.start(report.pop("validation_group_order"), report.pop("file_summary"))
+            for name in VALIDATION_GROUP_ORDER:
+                stream.group(name, report.pop(name))
+            stream.end(report)
+        return
+
+    df = prepare(catalog.load_sheet(sheet))
+    if rename is None:
+        mapped_props = {col: col for col in df.columns}
+
+    triage = TriageScan(args.triage) if args.triage else None
+    with NdjsonReport(args.output, cells=args.cells) as stream:
+        validate_file(df, catalog, extra_id_cols=args.extra_id, mapped_props=mapped_props,
+                      workers=args.workers, stream=stream, triage=triage)
+
 def main():
     parser = argparse.ArgumentParser(
         description="OfflineCatalogValidator: GUI & raportare"
@@ -17,12 +65,35 @@ def main():
         action="store_true",
         help="Rulează doar raportarea de eşecuri (CLI)."
     )
+    parser.add_argument(
+        "--validate", metavar="XLSX",
+        help="Validează fișierul fără GUI și scrie raportul ca NDJSON."
+    )
+    parser.add_argument("--sheet", help="Foaia validată (implicit prima).")
+    parser.add_argument("--mapping", metavar="JSON", help="Fișier JSON {proprietate: header}.")
+    parser.add_argument("--extra-id", action="append", default=[],
+                        help="Identificator suplimentar (repetabil), ex. --extra-id SKU.")
+    parser.add_argument("--output", default="-", help="Fișierul NDJSON (implicit stdout).")
+    parser.add_argument("--cells", action="store_true",
+                        help="Și câte o înregistrare per celulă care pică.")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--triage", type=int, metavar="N",
+                        help="Triaj: fiecare verificare se oprește după N fail-uri (numărători ≥N).")
+    parser.add_argument("--memory-budget", type=int, metavar="MB",
+                        help="Validare pe blocuri de rânduri cu memoria mărginită la MB "
+                             "(valorile distincte trec pe disc peste buget).")
     args = parser.parse_args()
+    if args.memory_budget and (args.triage or args.cells):
+        parser.error("--memory-budget nu se combină cu --triage / --cells")
 
-    if args.report:
+    if args.validate:
+        cli_validate(args)
+    elif args.report:
         cli_report(args)
     else:
         launch_gui()
 
 if __name__ == "__main__":
+    # necesar în executabilul PyInstaller când validate_file folosește process pool
+    multiprocessing.freeze_support()
     main()
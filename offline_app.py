@@ -1,10 +1,22 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 # import pandas as pd
+import copy
 import json
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 # from openpyxl import load_workbook
 from validator import validate_file
-from downloadfailreport import export_data_format_fails
+from downloadfailreport import export_all_failures, export_data_format_fails, export_duplicate_groups
+from catalog_loader import CatalogLoader
+from catalog_cache import CatalogCache
+from validation_memo import ValidationMemo
+from row_diff import RowDiffState, state_path
+from id_index import IdentifierIndex
+from url_reachability import UrlReachability
+from failures import FailureRows
+from triage import DEFAULT_BUDGET, TriageScan
+from preview import PREVIEW_MIN_ROWS, preview_file
 
 APP_VERSION = "v1.0"
 
@@ -84,6 +96,12 @@ class MappingTab(ttk.Frame):
         self.on_validate_callback = on_validate_callback
         self.mapping_vars = {}
         self.codes_rows = []
+        # verificarea accesibilității URL-urilor trimite cereri în rețea: opțională
+        self.reachability_var = tk.BooleanVar(value=False)
+        # toate celulele care pică (nu doar primul exemplu), pentru export
+        self.all_failures_var = tk.BooleanVar(value=False)
+        # triaj: fiecare verificare se oprește după primele fail-uri (fișiere noi, mari)
+        self.triage_var = tk.BooleanVar(value=False)
 
         # Scrollable
         canvas = tk.Canvas(self)
@@ -140,12 +158,27 @@ class MappingTab(ttk.Frame):
             command=self._add_code
         ).grid(row=0, column=2, sticky="w")
 
-        # 3) Validate button
+        # 3) Opțiuni + Validate button
+        ttk.Checkbutton(
+            container,
+            text="Check URL reachability (sends requests to the image / product / video URLs)",
+            variable=self.reachability_var
+        ).grid(row=2, column=0, sticky="w", padx=10)
+        ttk.Checkbutton(
+            container,
+            text="Record all failing cells (Download All Failures)",
+            variable=self.all_failures_var
+        ).grid(row=3, column=0, sticky="w", padx=10)
+        ttk.Checkbutton(
+            container,
+            text=f"Triage: stop each check after {DEFAULT_BUDGET} failures (counts shown as lower bounds)",
+            variable=self.triage_var
+        ).grid(row=4, column=0, sticky="w", padx=10)
         ttk.Button(
             container,
             text="Validate with Mapping",
             command=self._on_validate
-        ).grid(row=2, column=0, pady=15)
+        ).grid(row=5, column=0, pady=15)
 
     def _add_code(self):
         i = len(self.codes_rows) + 1
@@ -279,7 +312,22 @@ class OfflineCatalogValidatorApp(tk.Tk):
         self.loaded_path = None
         self.selected_sheet = None
         self.df = None
-        self.wb = None
+        self.catalog = None
+        self.validation_memo = None
+        self.row_diff = None
+        self.mapping_tab = None
+        self.reachability = None
+        self.sheet_labels = {}
+        # cache-ul de foi parsate (re-validările aceluiași fișier nu mai re-parsează XML-ul)
+        try:
+            self.cache = CatalogCache()
+        except OSError:
+            self.cache = None
+        # indexul local al identificatorilor din toate cataloagele validate (Cross-Catalog)
+        try:
+            self.id_index = IdentifierIndex()
+        except (OSError, sqlite3.Error):
+            self.id_index = None
         self.cols = []
 
         self.title(f"Offline Catalog Validator {APP_VERSION}")
@@ -291,6 +339,11 @@ class OfflineCatalogValidatorApp(tk.Tk):
          # inițializări pentru export
         self.current_report = {}
         self.current_mapping = {}
+        self.current_extra_id_cols = []
+        self.current_failures = None
+        # validarea completă care rulează în fundal după previzualizare (fișiere mari)
+        self.validation_job = None
+        self.validation_source = None
 
         # Tab 1: Load File
         self.tab1 = ttk.Frame(self.nb)
@@ -356,6 +409,8 @@ class OfflineCatalogValidatorApp(tk.Tk):
         self.result_container.pack(fill="both", expand=True)
 
     def on_load(self):
+        if self._validation_running():
+            return
         
           # ─── RESET UI PENTRU UN NOU LOAD ───
         self.sheet_frame.pack_forget()
@@ -377,9 +432,8 @@ class OfflineCatalogValidatorApp(tk.Tk):
             return
         self.loaded_path = path
 
-        from openpyxl import load_workbook
         try:
-            wb = load_workbook(path, data_only=True)
+            self.catalog = CatalogLoader(path, cache=self.cache)
         except (PermissionError, IOError):
             messagebox.showwarning(
                 "File In Use",
@@ -387,10 +441,12 @@ class OfflineCatalogValidatorApp(tk.Tk):
                 "Please close it before selecting it in the application."
             )
             return
-        sheets = wb.sheetnames
+        sheets = self.catalog.sheetnames
         if len(sheets) > 1:
+        # etichete cu dimensiunea estimată a fiecărei foi → numele real al foii
+            self.sheet_labels = {self.catalog.sheet_label(s): s for s in sheets}
         # adaugă o opțiune goală la început, ca user‑ul să aleagă activ
-            self.sheet_cb.config(values=[""] + sheets)
+            self.sheet_cb.config(values=[""] + list(self.sheet_labels))
             self.sheet_frame.pack(pady=(0,20), fill="x")
         # NU mai facem self.sheet_var.set(sheets[0]) – lăsăm gol
             self.selected_sheet = None
@@ -403,7 +459,6 @@ class OfflineCatalogValidatorApp(tk.Tk):
 
     # încarcă datele și deschide Tab2
         self._load_dataframe()
-        self.wb = wb
 
     # ... restul codului tău de inițializare a MappingTab și navigare ...
         expected = [
@@ -416,6 +471,7 @@ class OfflineCatalogValidatorApp(tk.Tk):
             w.destroy()
         mt = MappingTab(self.tab2, self.cols, expected, self._on_validate)
         mt.pack(fill="both", expand=True)
+        self.mapping_tab = mt
 
           # ── AICI ── plasăm creditul după ce am curățat tab2
         ttk.Label(
@@ -432,25 +488,18 @@ class OfflineCatalogValidatorApp(tk.Tk):
         self.nb.select(self.tab2)
 
     def _on_sheet_selected(self, event):
+        if self._validation_running():
+            # revine la foaia validată în fundal
+            labels = {sheet: label for label, sheet in self.sheet_labels.items()}
+            self.sheet_var.set(labels.get(self.selected_sheet, ""))
+            return
     # 1) Setează sheet-ul nou
-        self.selected_sheet = self.sheet_var.get()
-    # 2) Încarcă datele (o singură citire) și normalizează ca în _load_dataframe
-        import pandas as pd
-        df = pd.read_excel(
-            self.loaded_path,
-            sheet_name=self.selected_sheet,
-            dtype=str,
-            header=0
-        )
-        df.columns = df.columns.str.strip()
-        df.reset_index(drop=True, inplace=True)
-        self.df = df
-        self.cols = list(df.columns)
+        label = self.sheet_var.get()
+        self.selected_sheet = self.sheet_labels.get(label, label)
+    # 2) Încarcă datele din catalogul deja deschis (o singură parsare a foii)
+        self._load_dataframe()
     # 3) Creează MappingTab și navighează la Tab2
     # (exact același cod pe care l-ai mutat din on_load)
-        from openpyxl import load_workbook
-        wb = load_workbook(self.loaded_path, data_only=True)
-        self.wb = wb
 
         expected = [
         "Country","Brand","Product ID",  "Product Name (Local Language)",
@@ -463,6 +512,7 @@ class OfflineCatalogValidatorApp(tk.Tk):
 
         mt = MappingTab(self.tab2, self.cols, expected, self._on_validate)
         mt.pack(fill="both", expand=True)
+        self.mapping_tab = mt
 
         ttk.Label(
             self.tab2,
@@ -477,17 +527,17 @@ class OfflineCatalogValidatorApp(tk.Tk):
         self.nb.select(self.tab2)
 
     def _load_dataframe(self):
-        import pandas as pd
-
-        if not getattr(self, "loaded_path", None):
+        if not getattr(self, "catalog", None):
             return
 
-        df = pd.read_excel(self.loaded_path, sheet_name=self.selected_sheet, dtype=str, header=0)
-        df.columns = df.columns.str.strip()
-        df.reset_index(drop=True, inplace=True)
+        df = self.catalog.load_sheet(self.selected_sheet)
 
         self.df   = df
         self.cols = list(df.columns)
+        # re-validările pe aceeași foaie (alt mapping) refolosesc verificările neschimbate
+        self.validation_memo = ValidationMemo()
+        # prima validare a foii refolosește blocurile de rânduri de la versiunea anterioară
+        self.row_diff = RowDiffState.open(state_path(self.selected_sheet, self.cols))
 
 
    
@@ -495,10 +545,11 @@ class OfflineCatalogValidatorApp(tk.Tk):
     
     def _on_validate(self, to_rename, extra_id_cols, mapped_props):
         # print("DEBUG: _on_validate a fost apelat cu:", to_rename, extra_id_cols, mapped_props)
+        if self._validation_running():
+            return
 
-    # ── Reuse DataFrame și workbook încărcate anterior (fără re‑citire de pe disc)
+    # ── Reuse DataFrame și catalog încărcate anterior (fără re‑citire de pe disc)
         df = self.df.copy()
-        wb = self.wb
 
     # ── Curățări și redenumiri
         if "Product Image URL" in df.columns and "Image" in df.columns:
@@ -509,21 +560,107 @@ class OfflineCatalogValidatorApp(tk.Tk):
             if prop not in df.columns:
                 df[prop] = ""
 
-    # ── Aici forțăm foaia selectată să devină „activă”
-        sheet_index = wb.sheetnames.index(self.selected_sheet)
-        wb.active = sheet_index
+    # ── Accesibilitatea URL-urilor doar la cerere (cache-ul de verdicte e pe disc)
+        reachability = None
+        if self.mapping_tab is not None and self.mapping_tab.reachability_var.get():
+            if self.reachability is None:
+                try:
+                    self.reachability = UrlReachability()
+                except (OSError, sqlite3.Error):
+                    self.reachability = UrlReachability(cache_path=None)
+            reachability = self.reachability
+
+    # ── Toate celulele care pică: rulare completă, fără memo / row_diff
+        failures = None
+        if self.mapping_tab is not None and self.mapping_tab.all_failures_var.get():
+            failures = FailureRows()
+
+    # ── Triaj: rulare rapidă, fără memo / row_diff (starea rămâne pentru rularea completă)
+        triage = None
+        if failures is None and self.mapping_tab is not None and self.mapping_tab.triage_var.get():
+            triage = TriageScan()
+
+    # ── Validare cu fallback pe erori: prima rulare pe foaie cu row_diff, apoi memo
+        row_diff = None
+        if failures is None and triage is None:
+            row_diff, self.row_diff = self.row_diff, None
+        kwargs = dict(
+            df_processed=df,
+            catalog=self.catalog,
+            extra_id_cols=extra_id_cols,
+            mapped_props=mapped_props,
+            memo=None if row_diff is not None else self.validation_memo,
+            row_diff=row_diff,
+            id_index=self.id_index,
+            reachability=reachability,
+            all_failures=failures,
+            triage=triage
+        )
+        context = (row_diff, df, mapped_props, extra_id_cols, failures)
+
+    # ── Fișiere mari: estimările din eșantion imediat, validarea completă în fundal
+        if triage is None and len(df) >= PREVIEW_MIN_ROWS and df.columns.is_unique:
+            preview_error = None
+            try:
+                self.display_results(preview_file(df, self.catalog, mapped_props, extra_id_cols))
+            except Exception as e:
+                preview_error = e
+            # worker-ul primește o copie a catalogului: un load nou nu-i schimbă foaia
+            kwargs["catalog"] = copy.copy(self.catalog)
+            self.validation_source = (self.catalog, self.selected_sheet)
+            pool = ThreadPoolExecutor(max_workers=1)
+            self.validation_job = pool.submit(validate_file, **kwargs)
+            pool.shutdown(wait=False)
+            self.after(200, self._poll_validation, context)
+            if preview_error is not None:
+                messagebox.showwarning(
+                    "Preview Error",
+                    f"Previzualizarea nu a putut fi calculată:\n{preview_error}\n\n"
+                    "Validarea completă continuă în fundal."
+                )
+            return
 
-    # ── Validare cu fallback pe erori (apel neschimbat)
         try:
-            report = validate_file(
-                df_processed=df,
-                wb_original=wb,
-                extra_id_cols=extra_id_cols,
-                mapped_props=mapped_props
-            )
+            report = validate_file(**kwargs)
         except Exception as e:
             messagebox.showerror("Validation Error", f"A apărut o eroare neașteptată:\n{e}")
             return
+        self._finish_validation(report, *context)
+
+    def _poll_validation(self, context):
+        """Verifică periodic validarea din fundal; la final înlocuiește previzualizarea."""
+        job = self.validation_job
+        if not job.done():
+            self.after(200, self._poll_validation, context)
+            return
+        self.validation_job = None
+        # între timp a fost încărcat alt fișier / altă foaie: rezultatul nu mai e al lor
+        if self.validation_source != (self.catalog, self.selected_sheet):
+            return
+        try:
+            report = job.result()
+        except Exception as e:
+            messagebox.showerror("Validation Error", f"A apărut o eroare neașteptată:\n{e}")
+            return
+        self._finish_validation(report, *context)
+
+    def _validation_running(self):
+        """True (cu mesaj) dacă validarea completă încă rulează în fundal."""
+        if self.validation_job is None:
+            return False
+        messagebox.showinfo(
+            "Validation running",
+            "Validarea completă a fișierului încă rulează.\n"
+            "Așteptați rezultatul înainte de a încărca alt fișier sau altă foaie."
+        )
+        return True
+
+    def _finish_validation(self, report, row_diff, df, mapped_props, extra_id_cols, failures):
+        if row_diff is not None:
+            try:
+                row_diff.save()
+            except OSError:
+                pass
         # import traceback; traceback.print_exc()
 
     # ── Fallback mapping dacă nu sunt suficiente mapping-uri
@@ -533,6 +670,8 @@ class OfflineCatalogValidatorApp(tk.Tk):
             self.current_mapping = mapped_props
 
         self.current_report = report
+        self.current_extra_id_cols = list(extra_id_cols or [])
+        self.current_failures = failures
 
     # ── Afișare rezultate
         self.display_results(report)
@@ -553,6 +692,16 @@ class OfflineCatalogValidatorApp(tk.Tk):
                font=("Arial", 14, "bold")
             ).pack(pady=(5,15), anchor="center")
 
+        # previzualizare: estimări din eșantion până termină validarea completă
+        preview = report_data.get("preview")
+        if preview:
+            ttk.Label(
+                self.result_container.scrollable_frame,
+                text=(f"Preview: estimates from {preview['Sample Rows']:,} of {preview['Rows']:,} rows "
+                      f"({preview['Confidence']:.0%} intervals) - full validation running…"),
+                font=("Arial", 10, "italic")
+            ).pack(pady=(0,10), anchor="center")
+
         numeric = ["% Data Completeness", "% Data Uniqueness", "% Match Rate",
                    "Check Fail Count", "Empty Cell Count"]
 
@@ -689,7 +838,8 @@ class OfflineCatalogValidatorApp(tk.Tk):
 
        
 
-            if group == "Data Format Checks":
+            # exporturile citesc raportul complet: nu și din previzualizare
+            if group == "Data Format Checks" and not preview:
                 btn = ttk.Button(
                 self.result_container.scrollable_frame,
                 text="Download Fail Report",
@@ -697,9 +847,25 @@ class OfflineCatalogValidatorApp(tk.Tk):
                 )
                 btn.pack(pady=(0,15))
 
+            if group in ("Mandatory Data - Uniqueness Checks", "Optional Data - Uniqueness Checks") and not preview:
+                btn = ttk.Button(
+                self.result_container.scrollable_frame,
+                text="Download Duplicate Groups",
+                command=self._on_download_duplicate_groups
+                )
+                btn.pack(pady=(0,15))
+
             self.nb.tab(self.tab3, state="normal")
             self.nb.select(self.tab3)
 
+        # toate celulele care pică, dacă rularea le-a înregistrat
+        if not preview and self.current_failures is not None and self.current_failures.entries:
+            ttk.Button(
+                self.result_container.scrollable_frame,
+                text="Download All Failures",
+                command=self._on_download_all_failures
+            ).pack(pady=(0,15))
+
    
 
 
@@ -724,10 +890,6 @@ class OfflineCatalogValidatorApp(tk.Tk):
             "Please close it before downloading the fail report."
             )
             return
-         # reîncarc workbook-ul normal, nu read_only
-        from openpyxl import load_workbook
-        wb_for_export = load_workbook(self.loaded_path, data_only=True)
-
     # dacă ai mapat <2 coloane, fallback la toate coloanele din df
         if len(self.current_mapping) < 2:
         # creează un dict {col: col} pentru fiecare coloană
@@ -736,35 +898,24 @@ class OfflineCatalogValidatorApp(tk.Tk):
             mapping = self.current_mapping
 
         try:
-            export_data_format_fails(
+            _, fail_counts = export_data_format_fails(
             report_data=self.current_report,
-            df=self.df,
-            wb_original=wb_for_export,
+            catalog=self.catalog,
             mapping=mapping,
-            save_path=path,
-            sheet_name=self.selected_sheet
+            save_path=path
             )
             
             messagebox.showinfo("Export complete", f"Saved to:\n{path}")
         
        
 
-# redeschidem raportul de fails tocmai salvat
-            from openpyxl import load_workbook
-
-# după ce ai salvat raportul și ai path 
-            wb_exp = load_workbook(path, data_only=True)
-
 # lista nodurilor de validare din raportul UI
             checks = ["Demo Data", "Special Characters", "Formulas", "HTML Tags"]
 
-# citește fiecare sheet din fișierul de export
+# numărul de rânduri exportate vine direct din export (fără a redeschide fișierul)
             for chk in checks:
-    # sheet-urile din fișier au exact același nume
-                if chk in wb_exp.sheetnames:
-                    ws = wb_exp[chk]
-        # calculează nr. de fails = nr. rânduri − 1 (header)
-                    cnt = ws.max_row - 1
+                if chk in fail_counts:
+                    cnt = fail_counts[chk]
         # injectează în self.current_report
                     for item in self.current_report["Data Format Checks"]:
                         if item["Check Performed"] == chk:
@@ -775,6 +926,67 @@ class OfflineCatalogValidatorApp(tk.Tk):
             self.display_results(self.current_report)
         except Exception as e:
             messagebox.showerror("Export error", str(e))
+
+    def _on_download_duplicate_groups(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel files","*.xlsx")],
+            title="Save Duplicate Groups"
+        )
+        if not path:
+            return
+
+    # aceeași regulă de fallback ca la fail report: <2 coloane mapate → toate coloanele
+        if len(self.current_mapping) < 2:
+            mapping = { col: col for col in self.df.columns }
+        else:
+            mapping = self.current_mapping
+
+        try:
+            _, group_counts = export_duplicate_groups(
+            df=self.df,
+            mapping=mapping,
+            save_path=path,
+            extra_id_cols=self.current_extra_id_cols
+            )
+        except PermissionError:
+            messagebox.showwarning(
+            "File Locked",
+            f"Cannot write:\n{path}\nPlease close it in Excel and try again."
+            )
+            return
+        except Exception as e:
+            messagebox.showerror("Export error", str(e))
+            return
+
+        total = sum(group_counts.values())
+        messagebox.showinfo("Export complete", f"Saved {total} duplicate groups to:\n{path}")
+
+    def _on_download_all_failures(self):
+        path = filedialog.asksaveasfilename(
+            defaultextension=".xlsx",
+            filetypes=[("Excel files","*.xlsx")],
+            title="Save All Failures"
+        )
+        if not path:
+            return
+
+        try:
+            _, cell_counts = export_all_failures(self.current_failures, path)
+        except PermissionError:
+            messagebox.showwarning(
+            "File Locked",
+            f"Cannot write:\n{path}\nPlease close it in Excel and try again."
+            )
+            return
+        except Exception as e:
+            messagebox.showerror("Export error", str(e))
+            return
+
+        total = sum(cell_counts.values())
+        messagebox.showinfo("Export complete", f"Saved {total} failing cells to:\n{path}")
+
+
 def main():
     app = OfflineCatalogValidatorApp()
     app.mainloop()
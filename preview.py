@@ -0,0 +1,189 @@
+"""
+Previzualizare pe un eșantion de rânduri, pentru fișiere mari:
+preview_file(df, catalog, mapped_props, extra_id_cols).
+
+Eșantionul e stratificat: rândurile sunt împărțite în sample_rows intervale
+egale și din fiecare e ales un rând la întâmplare (acoperă tot fișierul, nu
+doar începutul). Pe rândurile alese rulează verificările din
+sharding.SHARDED_GROUPS (rezultatele parțiale din sharding.py, cu rândurile
+Excel reale, deci exemplele și referințele sunt celule adevărate).
+
+Unicitatea nu poate fi estimată din duplicatele din eșantion (o valoare care
+apare de două ori în fișier rareori apare de două ori în eșantion): pentru
+fiecare rând ales se numără aparițiile valorii lui brute în toată coloana
+(un singur lookup pe hash, fără normalizarea coloanei). Duplicatele care
+diferă doar prin spații la capete nu sunt văzute de previzualizare.
+
+Pentru verificările cu procente, raportul arată estimarea și intervalul de
+încredere 95% (Wilson, cu corecția de populație finită), ex.
+"≈93.4% (92.9–93.8%)"; "Check Fail Count" și "Rows Per Code" devin
+estimările pe tot fișierul ("≈1200"), iar Explanation spune câte rânduri au fost eșantionate. Un ❌ Fail
+e sigur (o celulă care pică a fost găsită); un ✅ Pass înseamnă doar că
+eșantionul nu are fail-uri. Grupurile a, f, i (workbook / hyperlink-uri) nu
+fac parte din previzualizare; validarea completă înlocuiește raportul.
+"""
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from check_result import GroupResult
+from sharding import SHARDED_GROUPS, ValueCounts, build_plan, finalize, merge_partials, sample_partial, shard_partial
+from validator import VALIDATION_GROUP_ORDER, normalize_headers
+
+# sub atât, GUI-ul rulează direct validarea completă
+PREVIEW_MIN_ROWS = 100_000
+SAMPLE_ROWS = 20_000
+CONFIDENCE = 0.95
+Z_95 = 1.959963984540054
+
+_UNIQUENESS_GROUPS = ("Mandatory Data - Uniqueness Checks", "Optional Data - Uniqueness Checks")
+# raportul categoriilor are cel mult un fail: numărătoarea nu se extrapolează
+_EXACT_GROUPS = ("Optional Data - Category Length & Tag Character Checks",)
+_PERCENT_FIELDS = ("% Data Completeness", "% Data Uniqueness", "% Pass Rate")
+
+
+def sample_positions(n, size, seed=None):
+    """Pozițiile (0-based, crescătoare) eșantionului stratificat: un rând din fiecare din size intervale egale."""
+    if size >= n:
+        return np.arange(n, dtype=np.int64)
+    rng = np.random.default_rng(seed)
+    edges = np.linspace(0, n, size + 1)
+    picks = np.floor(edges[:-1] + rng.random(size) * np.diff(edges)).astype(np.int64)
+    return np.unique(np.minimum(picks, np.ceil(edges[1:]).astype(np.int64) - 1))
+
+
+def wilson_interval(successes, trials, population=None, z=Z_95):
+    """Intervalul Wilson pentru successes / trials; cu population, și corecția de populație finită."""
+    if not trials:
+        return 0.0, 1.0
+    if population and population > 1:
+        z *= math.sqrt(max(0.0, (population - trials) / (population - 1)))
+    p = successes / trials
+    denom = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def preview_file(df_processed, catalog, mapped_props=None, extra_id_cols=None,
+                 sample_rows=SAMPLE_ROWS, seed=None):
+    """
+    Raportul estimat, cu aceeași formă ca al lui validate_file (doar grupurile
+    din sharding.SHARDED_GROUPS) plus raport["preview"] (rânduri, eșantion,
+    durată). df_processed trebuie să aibă header-e unice (ca pentru shards).
+    """
+    started = time.perf_counter()
+    mapped_props = mapped_props or {}
+    extra_id_cols = extra_id_cols or []
+    if not df_processed.columns.is_unique:
+        raise ValueError("preview_file needs unique column headers")
+
+    # 1) Eșantionul, cu header-ele normalizate ca în validate_file
+    n = len(df_processed)
+    positions = sample_positions(n, sample_rows, seed)
+    k = len(positions)
+    sample = normalize_headers(df_processed.iloc[positions])
+    plan = build_plan(sample, catalog, mapped_props, extra_id_cols)
+
+    # 2) Rezultatele parțiale pe eșantion, cu rândurile Excel reale
+    columns = {pos: sample.iloc[:, pos] for pos in plan["columns"]}
+    letter_columns = {}
+    for letter in plan["letters"]:
+        column = catalog.column(letter)
+        letter_columns[letter] = [] if column is None else column.iloc[positions].fillna("").astype(str).tolist()
+    part = shard_partial(columns, letter_columns, 0, k, plan["columns"])
+    merged = merge_partials([sample_partial(part, positions + 2)])
+
+    # 3) Unicitatea: aparițiile în toată coloana ale valorilor din eșantion
+    duplicates = {}
+    for pos, kinds in plan["columns"].items():
+        if "values" in kinds:
+            merged["columns"][pos]["values"], duplicates[sample.columns[pos]] = _column_duplicates(
+                df_processed.iloc[:, pos], sample.iloc[:, pos], positions
+            )
+
+    # 4) Rapoartele pe eșantion, apoi estimările pe tot fișierul
+    results = finalize(merged, sample, catalog, mapped_props, extra_id_cols)
+    if k < n:
+        for group, checks in results.items():
+            for check in checks:
+                _estimate(group, check, duplicates, k, n)
+
+    output = {
+        "validation_group_order": [g for g in VALIDATION_GROUP_ORDER if g in SHARDED_GROUPS],
+        "file_summary": {"row_count": n},
+    }
+    for name in output["validation_group_order"]:
+        output[name] = GroupResult(name, results[name])
+    output["preview"] = {
+        "Rows": n,
+        "Sample Rows": k,
+        "Confidence": CONFIDENCE,
+        "Seconds": round(time.perf_counter() - started, 4),
+    }
+    return output
+
+
+def _column_duplicates(full, sampled, positions):
+    """
+    (ValueCounts, (rânduri duplicate, rânduri completate)) pentru eșantion.
+    ValueCounts are valorile trim-uite din eșantion, cu counts = aparițiile
+    în toată coloana (deci duplicates() vede valorile duplicate din fișier);
+    rândurile duplicate / completate sunt numărate în eșantion.
+    """
+    raw = sampled.to_numpy(dtype=object)
+    trimmed = sampled.fillna("").astype(str).str.strip().to_numpy(dtype=object)
+    keep = np.flatnonzero(trimmed != "")
+    if not len(keep):
+        empty = np.empty(0, dtype=np.int64)
+        return ValueCounts(np.empty(0, dtype=object), empty, empty, np.empty(0, dtype=object)), (0, 0)
+
+    # aparițiile fiecărei valori brute din eșantion în toată coloana
+    raw_codes, raw_uniques = pd.factorize(raw[keep])
+    found = pd.Index(raw_uniques, dtype=full.dtype).get_indexer(full)
+    raw_counts = np.bincount(found[found >= 0], minlength=len(raw_uniques))
+
+    # valorile trim-uite: suma aparițiilor variantelor brute din eșantion
+    codes, uniques = pd.factorize(trimmed[keep])
+    pairs = np.unique(codes.astype(np.int64) * len(raw_uniques) + raw_codes)
+    counts = np.bincount(
+        pairs // len(raw_uniques), weights=raw_counts[pairs % len(raw_uniques)], minlength=len(uniques)
+    ).astype(np.int64)
+    _, first = np.unique(codes, return_index=True)
+    values = ValueCounts(
+        np.asarray(uniques, dtype=object), counts,
+        positions[keep[first]] + 2, raw[keep[first]],
+    )
+    return values, (int((counts[codes] > 1).sum()), len(keep))
+
+
+def _estimate(group, check, duplicates, k, n):
+    """Înlocuiește numărătorile din eșantion cu estimările pe tot fișierul (CheckResult, pe loc)."""
+    if check.outcome == "⏭️ Skip" and check.get("Explanation") != "No data present":
+        return
+    # rândurile (sau hit-urile) din eșantion care pică și din câte
+    failed, trials = check.get("Check Fail Count"), k
+    if group in _UNIQUENESS_GROUPS:
+        prop = check.performed[:-len(" Uniqueness")]
+        if prop not in duplicates:
+            # categoriile: duplicatele sunt permise, rezultatul e exact
+            return
+        failed, trials = duplicates[prop]
+    if type(failed) is int and group not in _EXACT_GROUPS:
+        check["Check Fail Count"] = f"≈{round(failed / k * n)}"
+        for field in _PERCENT_FIELDS:
+            if check.get(field):
+                population = n if trials == k else round(trials / k * n)
+                low, high = wilson_interval(trials - failed, trials, population)
+                estimate = (trials - failed) / trials * 100 if trials else 0.0
+                # capetele rotunjite în afară: intervalul afișat îl conține pe cel calculat
+                low, high = math.floor(low * 1000) / 10, math.ceil(high * 1000) / 10
+                check[field] = f"≈{estimate:.1f}% ({low:.1f}–{high:.1f}%)"
+    if type(check.get("Count Unique")) is int:
+        check["Count Unique"] = f"≥{check['Count Unique']}"
+    if check.get("Rows Per Code"):
+        check["Rows Per Code"] = {code: f"≈{round(rows / k * n)}" for code, rows in check["Rows Per Code"].items()}
+    explanation = check.get("Explanation") or ""
+    check["Explanation"] = f"{explanation} (preview: {k:,} of {n:,} rows)".lstrip()
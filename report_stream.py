@@ -0,0 +1,94 @@
+"""
+Raportul de validare ca NDJSON (un obiect JSON pe linie), scris pe măsură ce
+grupurile se termină: validate_file(..., stream=NdjsonReport(path_sau_fișier)).
+
+Consumatorii (ex. pipeline-ul de ingestie) pot începe pe primele grupuri cât
+timp celelalte încă rulează; grupurile scrise nu mai sunt păstrate în raportul
+întors de validate_file, deci raportul complet nu e ținut în memorie.
+
+Înregistrările, în ordinea scrierii:
+    {"type": "start", "validation_group_order": [...], "file_summary": {...}}
+    {"type": "check", "group": ..., "Check Performed": ..., "Check Outcome": ..., ...}
+    {"type": "cell", "group": ..., "check": ..., "column": ..., "cell": "E5"}   (doar cu cells=True)
+    {"type": "end", "timings": {...}, "column_cache": {...}, ...}
+
+Grupurile apar în ordinea în care se termină (cu workers > 1 nu neapărat în
+ordinea raportului); "validation_group_order" din "start" dă ordinea de afișare.
+Celulele care pică vin din failures.FailureRows și sunt generate abia la
+scriere, pe loturi de BATCH_LINES linii (memorie constantă per grup).
+"""
+import json
+import os
+import sys
+
+from check_result import report_to_json
+
+# câte înregistrări "cell" sunt construite și scrise deodată
+BATCH_LINES = 4096
+
+
+class NdjsonReport:
+    """
+    target: cale de fișier, "-" (stdout) sau un obiect fișier text deschis;
+    cells=True: după verificările fiecărui grup, câte o înregistrare per celulă care pică.
+    """
+
+    def __init__(self, target, cells=False):
+        self.cells = cells
+        self.records = 0
+        self._owned = isinstance(target, (str, os.PathLike)) and target != "-"
+        if self._owned:
+            self._file = open(target, "w", encoding="utf-8")
+        else:
+            self._file = sys.stdout if target == "-" else target
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def _write(self, lines):
+        """Un lot mic de linii (cel mult BATCH_LINES), cu un singur write."""
+        self._file.write("".join(line + "\n" for line in lines))
+        self.records += len(lines)
+
+    def _flush(self):
+        # înregistrările sunt vizibile consumatorului imediat, nu la închiderea fișierului
+        self._file.flush()
+
+    def start(self, group_order, file_summary):
+        self._write([report_to_json({
+            "type": "start",
+            "validation_group_order": list(group_order),
+            "file_summary": file_summary,
+        })])
+        self._flush()
+
+    def group(self, name, checks, cells=None):
+        """
+        Verificările unui grup, apoi (cells) celulele care pică: [(check, [FailedCells])].
+        Celulele sunt scrise pe loturi de BATCH_LINES: memoria nu crește cu numărul lor.
+        """
+        self._write([report_to_json({"type": "check", "group": name, **check.to_dict()}) for check in checks])
+        for check, failed in cells or ():
+            for column, letter, rows in failed:
+                # prefixul comun e serializat o singură dată per coloană
+                prefix = json.dumps(
+                    {"type": "cell", "group": name, "check": check, "column": column},
+                    ensure_ascii=False,
+                )[:-1] + ', "cell": "'
+                for start in range(0, len(rows), BATCH_LINES):
+                    batch = rows[start:start + BATCH_LINES].tolist()
+                    self._write([f'{prefix}{letter}{row}"}}' for row in batch])
+        self._flush()
+
+    def end(self, summary):
+        self._write([report_to_json({"type": "end", **summary})])
+        self._flush()
@@ -0,0 +1,196 @@
+"""
+Validare incrementală între versiuni ale aceluiași catalog:
+validate_file(..., row_diff=RowDiffState.open(path)).
+
+Furnizorii retrimit de obicei catalogul cu câteva rânduri editate. Starea
+păstrată de la rularea anterioară:
+    - layout-ul (header-ele df-ului + planul din sharding.build_plan);
+    - rezultatele parțiale din sharding.py (blank, limit, comma, values,
+      parts, Data Format) per bloc de rânduri, cu rândurile relative la
+      începutul blocului, adresate după amprenta rândurilor din bloc.
+
+Blocurile sunt definite de conținut (content-defined chunking): un bloc se
+termină după rândul al cărui hash (mod AVG_BLOCK_ROWS) e 0, cu limite
+MIN_BLOCK_ROWS / MAX_BLOCK_ROWS. Un rând inserat, șters sau editat schimbă
+doar blocul în care cade; blocurile de după au același conținut (chiar dacă
+s-au mutat) și sunt refolosite, cu rândurile mutate la noua poziție
+(sharding.shift_partial). Doar blocurile noi sunt recalculate; rapoartele
+sunt reconstruite din părțile combinate (sharding.finalize), identic cu o
+rulare completă.
+
+Grupurile a, f, i (workbook / hyperlink-uri) rulează în continuare complet.
+"""
+import hashlib
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from sharding import build_plan, finalize, merge_partials, shard_partial, shift_partial
+
+STATE_VERSION = 1
+DEFAULT_STATE_DIR = os.path.join(os.path.expanduser("~"), ".offline_catalog_validator", "row_diff")
+
+AVG_BLOCK_ROWS = 2048
+MIN_BLOCK_ROWS = 512
+MAX_BLOCK_ROWS = 8192
+
+_HASH_PRIME = np.uint64(0x100000001B3)
+
+
+def state_path(sheet_name, headers, state_dir=DEFAULT_STATE_DIR):
+    """
+    Fișierul de stare pentru o foaie: aceeași foaie cu aceleași header-e
+    (o nouă versiune a catalogului) folosește același fișier.
+    """
+    key = "\x1f".join([sheet_name] + [str(h) for h in headers])
+    return os.path.join(state_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".pkl")
+
+
+def row_hashes(columns, n):
+    """Hash uint64 per rând, combinat din hash-urile per celulă ale coloanelor date."""
+    hashes = np.zeros(n, dtype=np.uint64)
+    for column in columns:
+        cells = pd.util.hash_array(column.to_numpy(dtype=object), categorize=False)
+        hashes = hashes * _HASH_PRIME + cells
+    return hashes
+
+
+def block_bounds(hashes):
+    """
+    Limitele blocurilor [(start, stop)], alese după conținut: tăietură după
+    rândurile cu hash % AVG_BLOCK_ROWS == 0, la cel puțin MIN_BLOCK_ROWS de
+    tăietura anterioară; blocurile mai lungi de MAX_BLOCK_ROWS sunt despărțite.
+    """
+    n = len(hashes)
+    candidates = np.flatnonzero(hashes % np.uint64(AVG_BLOCK_ROWS) == 0) + 1
+    bounds = [0]
+    for cut in candidates.tolist():
+        while cut - bounds[-1] > MAX_BLOCK_ROWS:
+            bounds.append(bounds[-1] + MAX_BLOCK_ROWS)
+        if cut - bounds[-1] >= MIN_BLOCK_ROWS and cut < n:
+            bounds.append(cut)
+    while n - bounds[-1] > MAX_BLOCK_ROWS:
+        bounds.append(bounds[-1] + MAX_BLOCK_ROWS)
+    if n > bounds[-1] or n == 0:
+        bounds.append(n)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class RowDiffState:
+    """
+    Starea rulării anterioare (layout + rezultate parțiale per bloc).
+    stats: statisticile ultimei rulări (rânduri, blocuri refolosite /
+    recalculate); save() scrie starea în path, pentru următoarea versiune.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._layout = None
+        self._blocks = {}
+        self.stats = {}
+
+    @classmethod
+    def open(cls, path):
+        """Starea salvată în path sau una goală (fișier lipsă / altă versiune / corupt)."""
+        state = cls(path)
+        try:
+            with open(path, "rb") as fh:
+                saved = pickle.load(fh)
+            if saved.get("version") == STATE_VERSION:
+                state._layout = saved["layout"]
+                state._blocks = saved["blocks"]
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, TypeError):
+            pass
+        return state
+
+    def save(self, path=None):
+        path = path or self.path
+        folder = os.path.dirname(path) or "."
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(
+                {"version": STATE_VERSION, "layout": self._layout, "blocks": self._blocks},
+                fh, protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp, path)
+
+    def clear(self):
+        self._layout = None
+        self._blocks = {}
+
+    def validate_groups(self, df, catalog, mapped_props, extra_id_cols):
+        """
+        Rezultatele pentru sharding.SHARDED_GROUPS pe df (header-e unice),
+        recalculând doar blocurile de rânduri care nu apar în starea anterioară.
+        """
+        # 1) Planul verificărilor; alt layout = nimic refolosibil
+        plan = build_plan(df, catalog, mapped_props, extra_id_cols)
+        layout = repr((
+            list(df.columns),
+            sorted((pos, sorted(map(str, kinds))) for pos, kinds in plan["columns"].items()),
+            plan["letters"],
+        ))
+        layout_changed = layout != self._layout
+        known = {} if layout_changed else self._blocks
+
+        # 2) Amprenta fiecărui rând, din coloanele de care depind verificările;
+        #    o coloană din foaie identică cu cea din df nu mai e hash-uită a doua oară
+        positions = sorted(plan["columns"])
+        sheet_columns = {letter: catalog.column(letter) for letter in plan["letters"]}
+        hashed = [df.iloc[:, pos] for pos in positions]
+        letter_pos = {
+            letter: df.columns.get_loc(header)
+            for header, letter in catalog.header_letters.items()
+            if letter in sheet_columns and header in df.columns
+        }
+        for letter, column in sheet_columns.items():
+            pos = letter_pos.get(letter)
+            if column is None or (pos in plan["columns"] and column.equals(df.iloc[:, pos])):
+                continue
+            hashed.append(column)
+        n = len(df)
+        hashes = row_hashes(hashed, n)
+
+        # 3) Blocurile: refolosite după amprentă sau recalculate (rânduri relative)
+        blocks = {}
+        partials = []
+        computed_rows = 0
+        computed = 0
+        for start, stop in block_bounds(hashes):
+            key = hashlib.blake2b(hashes[start:stop].tobytes(), digest_size=16).hexdigest()
+            part = blocks.get(key) or known.get(key)
+            if part is None:
+                columns = {pos: df.iloc[start:stop, pos] for pos in positions}
+                letter_columns = {
+                    letter: [] if column is None else column.iloc[start:stop].fillna("").astype(str).tolist()
+                    for letter, column in sheet_columns.items()
+                }
+                part = shard_partial(columns, letter_columns, 0, stop - start, plan["columns"])
+                computed_rows += stop - start
+                computed += 1
+            blocks[key] = part
+            partials.append(shift_partial(part, start))
+
+        # 4) Starea nouă = blocurile versiunii curente
+        self._layout = layout
+        self._blocks = blocks
+        self.stats = {
+            "Rows": n,
+            "Blocks": len(partials),
+            "Reused Blocks": len(partials) - computed,
+            "Computed Blocks": computed,
+            "Computed Rows": computed_rows,
+            "Layout Changed": layout_changed,
+        }
+
+        # 5) Rapoartele, din părțile combinate în ordinea rândurilor
+        merged = merge_partials(partials)
+        return finalize(merged, df, catalog, mapped_props, extra_id_cols)
+
+    def report(self):
+        """Sumarul pentru raport: rânduri / blocuri refolosite și recalculate."""
+        return dict(self.stats)
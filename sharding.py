@@ -0,0 +1,456 @@
+"""
+Validare pe shard-uri de rânduri, în procese separate, pentru cataloage de
+peste ~1M rânduri: validate_file(..., shards=N).
+
+DataFrame-ul e împărțit în N intervale contigue de rânduri. Fiecare proces
+calculează, doar pentru coloanele de care au nevoie verificările, rezultate
+parțiale mici:
+    blank   : nr. de celule goale + primul rând gol
+    limit   : nr. de celule peste o lungime / cu caractere interzise + primul fail
+    comma   : nr. de celule cu "," + primul fail
+    values  : ValueCounts – valorile distincte, cu apariții și primul rând (unicitate)
+    parts   : CountryIndex – codurile de țară, cu rândurile care le folosesc (Country)
+    codes   : CodeFails – toate celulele EAN / UPC / GTIN care pică (rând + motiv)
+    formats : hit-urile Data Format per literă de coloană (nr. + primul hit)
+
+Părțile sunt combinate în ordinea rândurilor (primul fail = primul shard cu
+fail; contoarele se adună; pentru unicitate, contoarele per valoare se adună
+și primul rând e cel mai mic), apoi rapoartele sunt construite chiar de
+grupurile din validator, prin PartialFacts. Grupurile a, f, i (workbook / hyperlink-uri)
+rulează în procesul principal.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from char_limits import LimitSpec, evaluate_limit
+from check_digits import GTIN_LENGTHS, CodeSpec, evaluate_codes
+from column_cache import NormalizedColumn
+from country_index import CountryIndex
+from format_scanner import CHECK_NAMES, scan_values
+from validator import (
+    CATEGORY_FORBIDDEN, CATEGORY_MAX_LEN, CATEGORY_PROPS, DESCRIPTION_MAX_LEN, DESCRIPTION_PROPS,
+    MANDATORY_COMPLETENESS, MANDATORY_UNIQUENESS, NAME_MAX_LEN, OPTIONAL_COMPLETENESS, OPTIONAL_UNIQUENESS,
+    _description_sources, _secondary_id_plan,
+    group_b, group_c, group_d, group_e, group_g, group_h, group_j, group_k, group_l, group_m, group_n,
+    group_o, group_p,
+)
+
+SHARDED_GROUPS = (
+    "Data Format Checks",
+    "Mandatory Data - Completeness Checks",
+    "Mandatory Data - Uniqueness Checks",
+    "Mandatory Data - Country Uniqueness Checks",
+    "Optional Data - Completeness Checks",
+    "Optional Data - Uniqueness Checks",
+    "Product Name English - Mandatory Field - Character Limit Check",
+    "Product Name Local - Optional Field - Character Limit Check",
+    "Product Descriptions - Optional Fields - Character Limit Check",
+    "Mandatory Data - Single ProductID Per Cell",
+    "Optional Data - Single Secondary Product Identifier Per Cell",
+    "Optional Data - GTIN/EAN/UPC Check Digit Checks",
+    "Optional Data - Category Length & Tag Character Checks",
+)
+
+# statisticile de lungime, ca LimitSpec(coloană, max_len, forbidden) fără coloană
+NAME_LIMIT = ("limit", NAME_MAX_LEN, "")
+DESCRIPTION_LIMIT = ("limit", DESCRIPTION_MAX_LEN, "")
+CATEGORY_LIMIT = ("limit", CATEGORY_MAX_LEN, CATEGORY_FORBIDDEN)
+
+
+# ── planul: ce statistici calculează fiecare shard ──────────────────────
+def build_plan(df, catalog, mapped_props, extra_id_cols):
+    """
+    {"columns": {poziție în df: set(tipuri)}, "letters": [litere pentru Data Format]}.
+    Poziția apare chiar cu set gol: statistica "blank" e calculată mereu.
+    """
+    columns = {}
+
+    def need(col, *kinds):
+        if col in df.columns:
+            columns.setdefault(df.columns.get_loc(col), set()).update(kinds)
+
+    for col in MANDATORY_COMPLETENESS + OPTIONAL_COMPLETENESS + list(extra_id_cols):
+        need(col)
+    for col in MANDATORY_UNIQUENESS:
+        need(col, "values")
+    for col in OPTIONAL_UNIQUENESS + list(extra_id_cols):
+        if col not in CATEGORY_PROPS:
+            need(col, "values")
+    need("Country", "parts")
+    need("Product Name (English)", NAME_LIMIT)
+    local_header = mapped_props.get("Product Name (Local Language)")
+    if local_header:
+        need(local_header, NAME_LIMIT)
+    source, _ = _description_sources(df, DESCRIPTION_PROPS, mapped_props)
+    for col in source.values():
+        need(col, DESCRIPTION_LIMIT)
+    need("Product ID", "comma")
+    renamed, _, all_props = _secondary_id_plan(df, extra_id_cols, mapped_props)
+    for prop in all_props:
+        if prop in renamed.columns:
+            columns.setdefault(_first_position(renamed, prop), set()).add("comma")
+    for col in CATEGORY_PROPS:
+        need(col, CATEGORY_LIMIT)
+    for prop, lengths in GTIN_LENGTHS.items():
+        need(prop, _codes_kind(lengths))
+
+    letters = []
+    if not df.columns.empty:
+        letters = sorted({
+            letter for header, letter in catalog.header_letters.items() if header in df.columns
+        })
+    return {"columns": columns, "letters": letters}
+
+
+def _codes_kind(lengths):
+    return ("codes", tuple(lengths))
+
+
+def _is_codes(kind):
+    return isinstance(kind, tuple) and kind[0] == "codes"
+
+
+def _first_position(df, col):
+    return int(np.atleast_1d(np.arange(len(df.columns))[df.columns.get_loc(col)])[0])
+
+
+# ── un shard (rulează în procesul worker) ───────────────────────────────
+def shard_partial(columns, letter_columns, start, stop, plan_columns, format_checks=CHECK_NAMES):
+    """
+    Rezultatele parțiale pentru rândurile start..stop-1 (0-based) ale shard-ului.
+    columns: {poziție: Series}, letter_columns: {literă: valorile text din foaia încărcată};
+    format_checks: verificările Data Format calculate (implicit toate).
+    """
+    first_row = start + 2
+    out_columns = {}
+    for pos, kinds in plan_columns.items():
+        raw = columns[pos]
+        norm = NormalizedColumn(None, pos, raw)
+        blank_pos = np.flatnonzero(norm.blank)
+        stats = {
+            "blank": len(blank_pos),
+            "first_blank": int(blank_pos[0]) + first_row if len(blank_pos) else None,
+        }
+        for kind in kinds:
+            if kind == "values":
+                stats[kind] = ValueCounts.from_column(norm, raw, first_row)
+            elif kind == "parts":
+                stats[kind] = CountryIndex.from_column(norm, first_row)
+            elif _is_codes(kind):
+                found = evaluate_codes(norm, CodeSpec(None, kind[1]))
+                stats[kind] = CodeFails.from_result(found, norm, first_row)
+            elif kind == "comma":
+                hits = np.flatnonzero(norm.values.str.contains(",", regex=False).to_numpy(dtype=bool))
+                stats[kind] = (
+                    (len(hits), int(hits[0]) + first_row, norm.values.iat[hits[0]])
+                    if len(hits) else (0, None, None)
+                )
+            else:
+                _, max_len, forbidden = kind
+                found = evaluate_limit(norm, LimitSpec(None, max_len, forbidden))
+                stats[kind] = (
+                    (len(found.positions), int(found.positions[0]) + first_row,
+                     int(found.lengths[0]), norm.values.iat[found.positions[0]])
+                    if len(found.positions) else (0, None, None, None)
+                )
+        out_columns[pos] = stats
+
+    formats = {}
+    for letter, values in letter_columns.items():
+        hits = scan_values(values, first_row=first_row, checks=format_checks)
+        formats[letter] = {
+            check: (len(rows), (int(rows[0]), snippets[0]) if len(rows) else None)
+            for check, (rows, snippets) in hits.items()
+        }
+    return {"n": stop - start, "columns": out_columns, "formats": formats}
+
+
+class ValueCounts:
+    """
+    Valorile distincte ale unei coloane, în ordinea primei apariții, ca
+    array-uri paralele: uniques, counts (apariții), rows (primul rând Excel),
+    raws (valoarea brută de pe primul rând). Acumulatorul de unicitate al
+    unui shard; merge() combină cu rândurile de după.
+    """
+
+    def __init__(self, uniques, counts, rows, raws):
+        self.uniques = uniques
+        self.counts = counts
+        self.rows = rows
+        self.raws = raws
+
+    @classmethod
+    def from_column(cls, norm, raw, first_row, keep_blank=False):
+        """Valorile trim-uite din norm (fără cele goale, dacă nu keep_blank)."""
+        keep = np.arange(len(norm.blank)) if keep_blank else np.flatnonzero(~norm.blank)
+        codes, uniques = pd.factorize(norm.values.to_numpy(dtype=object)[keep])
+        _, first = np.unique(codes, return_index=True)
+        return cls(
+            np.asarray(uniques, dtype=object),
+            np.bincount(codes, minlength=len(uniques)).astype(np.int64),
+            keep[first].astype(np.int64) + first_row,
+            raw.to_numpy(dtype=object)[keep[first]],
+        )
+
+    def __len__(self):
+        return len(self.uniques)
+
+    def merge(self, other):
+        """Combină cu other (rânduri de după); prima apariție rămâne cea de sus."""
+        return ValueCounts.concat([self, other])
+
+    @classmethod
+    def concat(cls, parts):
+        """Combină mai multe părți, date în ordinea rândurilor, cu un singur factorize."""
+        values, counts, rows, raws = (
+            np.concatenate(arrays) for arrays in zip(
+                *((part.uniques, part.counts, part.rows, part.raws) for part in parts)
+            )
+        )
+        codes, uniques = pd.factorize(values)
+        _, first = np.unique(codes, return_index=True)
+        return cls(
+            np.asarray(uniques, dtype=object),
+            np.bincount(codes, weights=counts, minlength=len(uniques)).astype(np.int64),
+            rows[first],
+            raws[first],
+        )
+
+    def moved(self, move):
+        """Aceleași valori, cu rândurile move(rows) (blocuri refolosite / eșantioane, move_partial)."""
+        return ValueCounts(self.uniques, self.counts, move(self.rows), self.raws)
+
+    def total(self):
+        return int(self.counts.sum())
+
+    def duplicates(self):
+        """(rânduri cu valori duplicate, (primul rând, valoare, brut) sau None)."""
+        dup = np.flatnonzero(self.counts > 1)
+        if not len(dup):
+            return 0, None
+        first = dup[np.argmin(self.rows[dup])]
+        return int(self.counts[dup].sum()), (int(self.rows[first]), self.uniques[first], self.raws[first])
+
+    def first_seen(self):
+        """(valoare, primul rând) în ordinea primei apariții."""
+        order = np.argsort(self.rows, kind="stable")
+        return zip(self.uniques[order].tolist(), self.rows[order].tolist())
+
+
+class CodeFails:
+    """
+    Celulele EAN / UPC / GTIN care pică într-un interval de rânduri:
+    rows (rânduri Excel crescătoare), reasons (check_digits.REASONS) și
+    prima valoare care pică (exemplul din raport).
+    """
+
+    def __init__(self, rows, reasons, example):
+        self.rows = rows
+        self.reasons = reasons
+        self.example = example
+
+    @classmethod
+    def from_result(cls, found, norm, first_row):
+        example = norm.values.iat[found.positions[0]] if len(found.positions) else None
+        return cls(found.positions + first_row, found.reasons, example)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def merge(self, other):
+        """Combină cu rezultatele rândurilor imediat următoare."""
+        return CodeFails(
+            np.concatenate([self.rows, other.rows]),
+            np.concatenate([self.reasons, other.reasons]),
+            self.example if self.example is not None else other.example,
+        )
+
+    def moved(self, move):
+        return CodeFails(move(self.rows), self.reasons, self.example)
+
+
+# statisticile cu concat: în merge_partials, combinate la final, o singură dată per coloană
+_CONCAT = {"values": ValueCounts, "parts": CountryIndex}
+
+
+# ── combinare ───────────────────────────────────────────────────────────
+def merge_partials(partials):
+    """Combină rezultatele shard-urilor, date în ordinea rândurilor."""
+    merged = {"n": 0, "columns": {}, "formats": {}}
+    # valorile distincte / codurile de țară sunt combinate la final, cu un singur factorize per coloană
+    pending = {}
+    for part in partials:
+        merge_into(merged, part, pending)
+    for (pos, kind), parts in pending.items():
+        merged["columns"][pos][kind] = _CONCAT[kind].concat(parts)
+    return merged
+
+
+def shift_partial(part, offset):
+    """Rezultatele parțiale part, cu toate rândurile Excel mutate cu offset."""
+    if not offset:
+        return part
+    return move_partial(part, lambda rows: rows + offset)
+
+
+def sample_partial(part, excel_rows):
+    """
+    Rezultatele parțiale ale unui eșantion de rânduri (shard_partial cu start=0
+    pe rândurile alese): rândul i + 2 devine excel_rows[i], rândul din foaie.
+    """
+    return move_partial(part, lambda rows: excel_rows[rows - 2])
+
+
+def move_partial(part, move):
+    """part cu fiecare rând Excel r înlocuit cu move(r) (vectorizat, crescător)."""
+    columns = {}
+    for pos, stats in part["columns"].items():
+        moved = {}
+        for kind, value in stats.items():
+            if kind == "blank":
+                moved[kind] = value
+            elif kind == "first_blank":
+                moved[kind] = None if value is None else int(move(value))
+            elif kind in ("values", "parts") or _is_codes(kind):
+                moved[kind] = value.moved(move)
+            else:
+                moved[kind] = (value[0], None if value[1] is None else int(move(value[1]))) + tuple(value[2:])
+        columns[pos] = moved
+    formats = {
+        letter: {
+            check: (count, None if first is None else (int(move(first[0])), first[1]))
+            for check, (count, first) in checks.items()
+        }
+        for letter, checks in part["formats"].items()
+    }
+    return {"n": part["n"], "columns": columns, "formats": formats}
+
+
+def merge_into(merged, part, pending=None):
+    """
+    Adaugă la merged rezultatele part (rândurile imediat următoare).
+    Cu pending ({(poziție, tip): [ValueCounts / CountryIndex]}), statisticile
+    din _CONCAT doar sunt colectate.
+    """
+    merged["n"] += part["n"]
+    for pos, stats in part["columns"].items():
+        acc = merged["columns"].setdefault(pos, {})
+        for kind, value in stats.items():
+            if kind == "blank":
+                acc[kind] = acc.get(kind, 0) + value
+            elif kind == "first_blank":
+                if acc.get(kind) is None:
+                    acc[kind] = value
+            elif kind in _CONCAT and pending is not None:
+                pending.setdefault((pos, kind), []).append(value)
+            elif kind in _CONCAT or _is_codes(kind):
+                prev = acc.get(kind)
+                acc[kind] = value if prev is None else prev.merge(value)
+            else:
+                # (count, primul rând, ...) – primul fail rămâne al primului shard cu fail
+                prev = acc.get(kind)
+                if prev is None:
+                    acc[kind] = value
+                else:
+                    first = prev[1:] if prev[1] is not None else value[1:]
+                    acc[kind] = (prev[0] + value[0],) + tuple(first)
+    for letter, checks in part["formats"].items():
+        acc = merged["formats"].setdefault(letter, {})
+        for check, (count, first) in checks.items():
+            prev_count, prev_first = acc.get(check, (0, None))
+            acc[check] = (prev_count + count, prev_first if prev_first is not None else first)
+
+
+def run_sharded(df, catalog, mapped_props=None, extra_id_cols=None, shards=2, workers=None):
+    """
+    Rulează SHARDED_GROUPS pe shards intervale de rânduri, în procese separate;
+    întoarce {nume grup: rezultate}, identic cu rularea pe tot df-ul.
+    """
+    mapped_props = mapped_props or {}
+    extra_id_cols = extra_id_cols or []
+    plan = build_plan(df, catalog, mapped_props, extra_id_cols)
+
+    letter_values = {letter: catalog.column_values(letter) for letter in plan["letters"]}
+    bounds = [int(b) for b in np.linspace(0, len(df), shards + 1)]
+    with ProcessPoolExecutor(max_workers=workers or shards) as pool:
+        jobs = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            columns = {pos: df.iloc[start:stop, pos] for pos in plan["columns"]}
+            letter_columns = {letter: values[start:stop] for letter, values in letter_values.items()}
+            jobs.append(pool.submit(shard_partial, columns, letter_columns, start, stop, plan["columns"]))
+        partials = [job.result() for job in jobs]
+
+    merged = merge_partials(partials)
+    return finalize(merged, df, catalog, mapped_props, extra_id_cols)
+
+
+# ── rapoartele, din rezultatele combinate ───────────────────────────────
+class PartialFacts:
+    """
+    Statisticile verificărilor din rezultatele combinate (merged), cu aceleași
+    metode ca validator.ColumnFacts: rapoartele sunt construite chiar de
+    grupurile din validator. Rândurile care pică nu sunt păstrate pe shard-uri
+    (ultimul element al rezultatelor e None), în afară de codurile GS1.
+    """
+
+    def __init__(self, merged, df):
+        self.merged = merged
+        self.df = df
+        self.n = merged["n"]
+
+    def _stats(self, col):
+        pos = col if isinstance(col, (int, np.integer)) else _first_position(self.df, col)
+        return self.merged["columns"][int(pos)]
+
+    def blank(self, col, check=None, every_duplicate=False):
+        stats = self._stats(col)
+        return stats["blank"], stats["first_blank"], None
+
+    def duplicates(self, col, check=None):
+        values = self._stats(col)["values"]
+        fails, first = values.duplicates()
+        return values.total(), fails, first, None
+
+    def country(self, col, check=None):
+        return self._stats(col)["parts"]
+
+    def limit(self, col, spec, check=None):
+        return self._stats(col)[("limit", spec.max_len, spec.forbidden)] + (None,)
+
+    def comma(self, col, check=None):
+        return self._stats(col)["comma"] + (None,)
+
+    def codes(self, col, lengths, check=None):
+        fails = self._stats(col)[_codes_kind(lengths)]
+        return fails.rows, fails.reasons, fails.example
+
+    def formats(self, check, letters):
+        count, first = 0, None
+        for letter in letters:
+            hits, hit = self.merged["formats"][letter][check]
+            if first is None and hit is not None:
+                first = (letter,) + tuple(hit)
+            count += hits
+        return count, first, None
+
+
+def finalize(merged, df, catalog, mapped_props, extra_id_cols):
+    """Rapoartele SHARDED_GROUPS din rezultatele combinate, cu grupurile din validator."""
+    facts = PartialFacts(merged, df)
+    return {
+        "Data Format Checks": group_b(df, catalog, facts=facts),
+        "Mandatory Data - Completeness Checks": group_c(df, mapped_props, facts=facts),
+        "Mandatory Data - Uniqueness Checks": group_d(df, mapped_props, facts=facts),
+        "Mandatory Data - Country Uniqueness Checks": group_e(df, mapped_props, facts=facts),
+        "Optional Data - Completeness Checks": group_g(df, mapped_props, extra_id_cols, facts=facts),
+        "Optional Data - Uniqueness Checks": group_h(df, mapped_props, extra_id_cols, facts=facts),
+        "Product Name English - Mandatory Field - Character Limit Check": group_j(df, mapped_props, facts=facts),
+        "Product Name Local - Optional Field - Character Limit Check": group_k(df, mapped_props, facts=facts),
+        "Product Descriptions - Optional Fields - Character Limit Check": group_l(df, mapped_props, facts=facts),
+        "Mandatory Data - Single ProductID Per Cell": group_m(df, mapped_props, facts=facts),
+        "Optional Data - Single Secondary Product Identifier Per Cell": group_n(df, extra_id_cols, mapped_props, facts=facts),
+        "Optional Data - GTIN/EAN/UPC Check Digit Checks": group_p(df, mapped_props, facts=facts),
+        "Optional Data - Category Length & Tag Character Checks": group_o(df, mapped_props, facts=facts),
+    }
@@ -0,0 +1,215 @@
+"""
+Triaj pentru prima trecere pe un fișier nou de la furnizor:
+validate_file(..., triage=TriageScan(budget=N)).
+
+Pentru triaj contează doar dacă fiecare verificare pică, nu câte celule pică.
+Rândurile sunt parcurse în blocuri din ce în ce mai mari (FIRST_BLOCK_ROWS,
+dublat la fiecare bloc), cu rezultatele parțiale din sharding.py. După
+fiecare bloc, statisticile deja decise nu mai sunt calculate:
+    blank   : după budget celule goale (și cel puțin una completată, ca
+              "No data present" să rămână exact)
+    values  : după budget rânduri cu valori duplicate
+    parts   : la a doua țară (sau la primul Country gol)
+    comma / limit / codes : după budget celule care pică (categoriile la
+              prima: raportul păstrează oricum doar prima eroare)
+    formats : fiecare verificare Data Format, după budget hit-uri în total
+O coloană nu mai e citită deloc când toate statisticile ei sunt decise.
+O verificare care trece rămâne exactă: trece doar dacă nu pică pe niciun
+rând, deci coloanele ei sunt parcurse complet.
+
+Verificările oprite înainte de ultimul rând sunt marcate în raport: "Check
+Fail Count" / "Count Unique" / "Rows Per Code" devin limite inferioare
+("≥10"), procentele limite superioare ("≤97%"), iar Explanation spune după
+câte rânduri s-a oprit verificarea. Grupurile a, f, i (workbook / hyperlink-uri) rulează complet.
+"""
+import time
+
+from check_digits import GTIN_LENGTHS
+from format_scanner import CHECK_NAMES
+from sharding import (
+    CATEGORY_LIMIT, DESCRIPTION_LIMIT, NAME_LIMIT, _codes_kind, _first_position, _is_codes,
+    build_plan, finalize, merge_into, shard_partial,
+)
+from validator import (
+    DESCRIPTION_PROPS, MANDATORY_COMPLETENESS, MANDATORY_UNIQUENESS, OPTIONAL_COMPLETENESS, OPTIONAL_UNIQUENESS,
+    _description_sources, _secondary_id_plan,
+)
+
+DEFAULT_BUDGET = 10
+FIRST_BLOCK_ROWS = 4096
+
+LOWER_BOUND = "≥"
+UPPER_BOUND = "≤"
+_PERCENT_FIELDS = ("% Data Completeness", "% Data Uniqueness", "% Pass Rate")
+
+
+class TriageScan:
+    """
+    budget: după câte fail-uri se oprește fiecare verificare (1 = doar dacă pică).
+    stats: statisticile ultimei rulări (blocuri, celule citite, verificări oprite).
+    """
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        if budget < 1:
+            raise ValueError(f"Triage budget must be at least 1, got {budget!r}")
+        self.budget = budget
+        self.stats = {}
+
+    def validate_groups(self, df, catalog, mapped_props, extra_id_cols):
+        """
+        Rezultatele pentru sharding.SHARDED_GROUPS pe df (header-e unice),
+        cu fiecare verificare oprită după budget fail-uri.
+        """
+        started = time.perf_counter()
+        budget = self.budget
+        n = len(df)
+
+        # 1) Ce mai e de calculat: statisticile per coloană și verificările Data Format
+        plan = build_plan(df, catalog, mapped_props, extra_id_cols)
+        pending = {pos: set(kinds) for pos, kinds in plan["columns"].items()}
+        open_checks = list(CHECK_NAMES) if plan["letters"] else []
+        letter_values = {letter: catalog.column_values(letter) for letter in plan["letters"]}
+
+        # 2) Blocuri din ce în ce mai mari, până la ultimul rând sau până e totul decis
+        merged = {"n": 0, "columns": {}, "formats": {}}
+        stopped = {}    # (poziție, tip) / ("formats", check) → rândurile citite
+        start, size, blocks, cells = 0, FIRST_BLOCK_ROWS, 0, 0
+        while True:
+            stop = min(n, start + size)
+            columns = {pos: df.iloc[start:stop, pos] for pos in pending}
+            letter_columns = {}
+            if open_checks:
+                letter_columns = {letter: values[start:stop] for letter, values in letter_values.items()}
+            merge_into(merged, shard_partial(
+                columns, letter_columns, start, stop, pending, tuple(open_checks)
+            ))
+            blocks += 1
+            cells += (len(columns) + len(letter_columns)) * (stop - start)
+            if stop >= n:
+                break
+
+            for pos in list(pending):
+                stats = merged["columns"][pos]
+                for kind in list(pending[pos]):
+                    if _decided(kind, stats, budget):
+                        pending[pos].discard(kind)
+                        stopped[(pos, kind)] = stop
+                if not pending[pos] and budget <= stats["blank"] < stop:
+                    del pending[pos]
+                    stopped[(pos, "blank")] = stop
+            for check in list(open_checks):
+                if sum(merged["formats"][letter][check][0] for letter in plan["letters"]) >= budget:
+                    open_checks.remove(check)
+                    stopped[("formats", check)] = stop
+            if not pending and not open_checks:
+                break
+            start, size = stop, size * 2
+
+        # 3) Rapoartele, cu totalul de rânduri al foii (procente, "No data present")
+        merged["n"] = n
+        results = finalize(merged, df, catalog, mapped_props, extra_id_cols)
+
+        # 4) Verificările care pică și au fost oprite: numărătorile sunt limite inferioare
+        lower = {}
+        inputs = _check_inputs(df, mapped_props, extra_id_cols)
+        for group, checks in results.items():
+            for check in checks:
+                rows = [stopped[key] for key in inputs.get((group, check.performed), ()) if key in stopped]
+                if rows and check.outcome == "❌ Fail" and _mark_lower_bound(check, min(rows), n):
+                    lower[f"{group}: {check.performed}"] = min(rows)
+
+        self.stats = {
+            "Budget": budget,
+            "Rows": n,
+            "Blocks": blocks,
+            "Cells Read": cells,
+            "Cells Total": (len(plan["columns"]) + len(plan["letters"])) * n,
+            "Lower Bound Checks": lower,
+            "Seconds": round(time.perf_counter() - started, 4),
+        }
+        return results
+
+    def report(self):
+        """Sumarul pentru raport: celule citite din total și verificările oprite (rânduri citite)."""
+        return dict(self.stats)
+
+
+def _decided(kind, stats, budget):
+    """True dacă statistica kind nu mai poate schimba rezultatul verificării (vezi docstring-ul modulului)."""
+    value = stats[kind]
+    if kind == "values":
+        return value.duplicates()[0] >= budget
+    if kind == "parts":
+        return len(value) > 1 or stats["blank"] > 0
+    if _is_codes(kind):
+        return len(value) >= budget
+    if kind == CATEGORY_LIMIT:
+        return value[0] > 0
+    # comma / limit: (count, primul rând, ...)
+    return value[0] >= budget
+
+
+def _mark_lower_bound(check, rows, n):
+    """Marchează check (CheckResult) ca oprit după rows rânduri; False dacă nu are numărători."""
+    count = check.get("Check Fail Count")
+    unique = check.get("Count Unique")
+    if type(count) is not int and type(unique) is not int:
+        return False
+    if type(count) is int:
+        check["Check Fail Count"] = f"{LOWER_BOUND}{count}"
+        for field in _PERCENT_FIELDS:
+            if check.get(field):
+                check[field] = f"{UPPER_BOUND}{int((n - count) / n * 100)}%"
+    if type(unique) is int:
+        check["Count Unique"] = f"{LOWER_BOUND}{unique}"
+    if check.get("Rows Per Code"):
+        check["Rows Per Code"] = {code: f"{LOWER_BOUND}{rows}" for code, rows in check["Rows Per Code"].items()}
+    explanation = check.get("Explanation") or ""
+    check["Explanation"] = f"{explanation} (triage: stopped after {rows} rows)".lstrip()
+    return True
+
+
+def _check_inputs(df, mapped_props, extra_id_cols):
+    """
+    {(grup, check): [(poziție, tip) sau ("formats", check)]}: statisticile din
+    care sharding.finalize construiește numărătorile fiecărei verificări.
+    Categoriile lipsesc: raportul lor are oricum cel mult un fail.
+    """
+    inputs = {("Data Format Checks", name): [("formats", name)] for name in CHECK_NAMES}
+
+    def add(group, check, col, kind):
+        if col in df.columns:
+            inputs.setdefault((group, check), []).append((df.columns.get_loc(col), kind))
+
+    for col in MANDATORY_COMPLETENESS:
+        add("Mandatory Data - Completeness Checks", f"{col} Completeness", col, "blank")
+    for col in MANDATORY_UNIQUENESS:
+        add("Mandatory Data - Uniqueness Checks", f"{col} Uniqueness", col, "values")
+    add("Mandatory Data - Country Uniqueness Checks", "Country Unique Count", "Country", "parts")
+    for prop in OPTIONAL_COMPLETENESS + list(extra_id_cols):
+        add("Optional Data - Completeness Checks", f"{prop} Completeness", prop, "blank")
+    for prop in OPTIONAL_UNIQUENESS + list(extra_id_cols):
+        add("Optional Data - Uniqueness Checks", f"{prop} Uniqueness", prop, "values")
+
+    add("Product Name English - Mandatory Field - Character Limit Check",
+        "Product Name (English) Character Limit Check", "Product Name (English)", NAME_LIMIT)
+    local_header = (mapped_props or {}).get("Product Name (Local Language)")
+    if local_header:
+        add("Product Name Local - Optional Field - Character Limit Check",
+            "Product Name (Local Language) Character Limit Check", local_header, NAME_LIMIT)
+    source, _ = _description_sources(df, DESCRIPTION_PROPS, mapped_props)
+    for prop, col in source.items():
+        add("Product Descriptions - Optional Fields - Character Limit Check",
+            f"{prop} Character Limit Check", col, DESCRIPTION_LIMIT)
+
+    add("Mandatory Data - Single ProductID Per Cell", "Single ProductID Per Cell", "Product ID", "comma")
+    renamed, _, all_props = _secondary_id_plan(df, extra_id_cols, mapped_props)
+    for prop in all_props:
+        if prop in renamed.columns:
+            inputs[("Optional Data - Single Secondary Product Identifier Per Cell",
+                    f"{prop} Single Secondary Product Identifier Per Cell")] = [
+                (_first_position(renamed, prop), "comma")
+            ]
+    for prop, lengths in GTIN_LENGTHS.items():
+        add("Optional Data - GTIN/EAN/UPC Check Digit Checks", f"{prop} Check Digit", prop, _codes_kind(lengths))
+    return inputs
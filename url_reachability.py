@@ -0,0 +1,467 @@
+"""
+Verificarea accesibilității URL-urilor (Product Image URL, Product URL,
+Product Video URL), opțională: validate_file(..., reachability=UrlReachability()).
+
+group_f / group_i verifică doar sintaxa; feed-urile sunt respinse pentru
+link-urile de imagine moarte. Pentru fiecare celulă cu un URL valid (textul
+sau, ca fallback, hyperlink-ul atașat) se trimite o cerere HEAD (GET cu
+Range: bytes=0-0 dacă serverul nu acceptă HEAD), cu urmărirea redirect-urilor.
+
+Rularea e organizată pe asyncio, iar cererile folosesc http.client din
+biblioteca standard (fără dependențe externe), pe un pool de thread-uri:
+    - URL-urile sunt deduplicate după forma canonică (URL_VERDICTS.canonical)
+      și ordonate round-robin pe host-uri;
+    - concurrency workeri în total, cel mult per_host cereri simultane per
+      host, pe conexiuni keep-alive refolosite (un pool per host, cu DNS-ul
+      rezolvat o singură dată);
+    - timeout per conectare / citire, retries cu backoff exponențial pentru
+      erorile tranzitorii (timeout, conexiune, HTTP 429 / 5xx).
+probe() poate fi apelat și dintr-un event loop deja pornit (rulează pe un
+thread separat); codul async folosește direct await probe_async().
+
+Verdictele sunt păstrate pe disc (SQLite, DEFAULT_CACHE_PATH) cu un TTL:
+re-validările din aceeași zi nu mai trimit nicio cerere. resolve
+({host: (adresă, port)}, ca curl --resolve) trimite cererile către alt
+server, ex. un server HTTP local de test (vezi benchmarks/bench_reachability.py).
+"""
+import asyncio
+import http.client
+import os
+import socket
+import sqlite3
+import ssl
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from urllib.parse import quote, urljoin, urlsplit
+
+import numpy as np
+from openpyxl.utils import get_column_letter
+
+from column_cache import ColumnCache
+from url_verdicts import URL_VERDICTS
+from validator import report_check
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".offline_catalog_validator", "url_reachability.sqlite")
+REACHABILITY_GROUP = "URL Reachability Checks"
+URL_PROPS = ["Product Image URL", "Product URL", "Product Video URL"]
+
+DEFAULT_TTL = 24 * 3600
+DEFAULT_CONCURRENCY = 100
+DEFAULT_PER_HOST = 10
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_RETRIES = 2
+BACKOFF = 0.5
+MAX_REDIRECTS = 5
+USER_AGENT = "OfflineCatalogValidator/1.0"
+
+# caracterele lăsate neschimbate în path / query (restul, ex. spații și non-ASCII, sunt encodate)
+_SAFE_PATH = "/%:@!$&'()*+,;=-._~"
+_SAFE_QUERY = _SAFE_PATH + "?"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verdicts (
+    url     TEXT PRIMARY KEY,
+    ok      INTEGER NOT NULL,
+    status  INTEGER NOT NULL,
+    reason  TEXT NOT NULL,
+    checked REAL NOT NULL
+);
+"""
+
+# ok: URL-ul răspunde cu 2xx (după redirect-uri); status: ultimul cod HTTP sau 0
+# (eroare de rețea); reason: "" sau motivul ("HTTP 404", "Timeout", "DNS error", ...)
+Verdict = namedtuple("Verdict", ["ok", "status", "reason"])
+
+
+def _transient(verdict):
+    """Erorile pentru care merită încă o încercare."""
+    if verdict.ok:
+        return False
+    if verdict.status:
+        return verdict.status == 429 or verdict.status >= 500
+    return verdict.reason in ("Timeout", "Connection error")
+
+
+class _HostPool:
+    """Conexiunile keep-alive libere către un (schemă, host, port) + limita per host."""
+
+    def __init__(self, per_host):
+        self.idle = []
+        self.slots = asyncio.Semaphore(per_host)
+        self.address = None
+
+
+class _Prober:
+    """
+    Clientul unei rulări: cozile și limitele pe event loop, cererile (http.client,
+    blocant) pe un ThreadPoolExecutor cu concurrency thread-uri.
+    stats: cereri, conexiuni, retries.
+    """
+
+    def __init__(self, concurrency, per_host, timeout, retries, resolve):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.resolve = resolve or {}
+        self.pools = {}
+        self.ssl_context = ssl.create_default_context()
+        self.stats = Counter()
+
+    async def run(self, urls):
+        """{url: Verdict} pentru urls (distincte), cu concurrency workeri."""
+        # round-robin pe host-uri: un host cu multe URL-uri nu ține ocupați toți workerii
+        by_host = {}
+        for url in urls:
+            by_host.setdefault(urlsplit(url).hostname, []).append(url)
+        queue = [url for batch in zip_longest(*by_host.values()) for url in batch if url is not None]
+        queue.reverse()
+
+        verdicts = {}
+
+        async def worker():
+            while queue:
+                url = queue.pop()
+                verdicts[url] = await self.probe(url)
+
+        self.executor = ThreadPoolExecutor(max(1, min(self.concurrency, len(queue))))
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(queue)))))
+        finally:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            for pool in self.pools.values():
+                for conn in pool.idle:
+                    conn.close()
+        return verdicts
+
+    async def probe(self, url):
+        """Verdictul pentru url, cu retries și backoff pentru erorile tranzitorii."""
+        for attempt in range(self.retries + 1):
+            verdict = await self._follow(url)
+            if not _transient(verdict) or attempt == self.retries:
+                return verdict
+            self.stats["retries"] += 1
+            await asyncio.sleep(BACKOFF * 2 ** attempt)
+        return verdict
+
+    async def _follow(self, url):
+        # HEAD, apoi GET dacă HEAD nu e acceptat; redirect-urile sunt urmărite
+        method = "HEAD"
+        status = 0
+        for _ in range(MAX_REDIRECTS + 2):
+            try:
+                status, location = await self._request(method, url)
+            except TimeoutError:
+                return Verdict(False, 0, "Timeout")
+            except socket.gaierror:
+                return Verdict(False, 0, "DNS error")
+            except ssl.SSLError:
+                return Verdict(False, 0, "SSL error")
+            except (UnicodeError, ValueError):
+                return Verdict(False, 0, "Invalid URL")
+            except (OSError, http.client.HTTPException):
+                return Verdict(False, 0, "Connection error")
+            if method == "HEAD" and status in (405, 501):
+                method = "GET"
+                continue
+            if 300 <= status < 400 and location:
+                url = urljoin(url, location)
+                continue
+            ok = 200 <= status < 300
+            return Verdict(ok, status, "" if ok else f"HTTP {status}")
+        return Verdict(False, status, "Too many redirects")
+
+    async def _request(self, method, url):
+        """(status, Location) pentru o cerere, pe o conexiune din pool-ul host-ului."""
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(url)
+        host = parts.hostname.encode("idna").decode("ascii")
+        port = parts.port or (443 if scheme == "https" else 80)
+        target = quote(parts.path or "/", safe=_SAFE_PATH)
+        if parts.query:
+            target += "?" + quote(parts.query, safe=_SAFE_QUERY)
+
+        pool = self.pools.get((scheme, host, port))
+        if pool is None:
+            pool = self.pools[(scheme, host, port)] = _HostPool(self.per_host)
+        async with pool.slots:
+            if pool.address is None:
+                # DNS-ul o singură dată per host (și eșecul, pentru toate URL-urile host-ului)
+                pool.address = asyncio.ensure_future(self._address(host, port))
+            address = await asyncio.shield(pool.address)
+            conn = pool.idle.pop() if pool.idle else None
+            status, location, conn, opened, reused = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self._exchange, conn, scheme, host, port, address, method, target
+            )
+            if conn is not None:
+                pool.idle.append(conn)
+        self.stats["requests"] += 1
+        self.stats["connections"] += opened
+        self.stats["reused"] += reused
+        return status, location
+
+    def _exchange(self, conn, scheme, host, port, address, method, target):
+        """
+        Cererea, pe un thread al executorului: pe conn (keep-alive) dacă e dată,
+        altfel pe o conexiune nouă. Întoarce (status, Location, conexiunea de
+        păstrat în pool sau None, conexiuni deschise, dacă a fost refolosită).
+        """
+        headers = {"User-Agent": USER_AGENT, "Accept": "*/*"}
+        if method == "GET":
+            # doar începutul corpului; conexiunea nu e refolosită
+            headers["Range"] = "bytes=0-0"
+        opened = 0
+        while True:
+            reused = conn is not None
+            if conn is None:
+                conn = self._open(scheme, host, port, address)
+                opened += 1
+            try:
+                conn.request(method, target, headers=headers)
+                response = conn.getresponse()
+            except BaseException as exc:
+                conn.close()
+                if reused and isinstance(exc, (OSError, http.client.HTTPException)) and not isinstance(exc, TimeoutError):
+                    # conexiunea keep-alive fusese închisă de server: încă o dată, pe una nouă
+                    conn = None
+                    continue
+                raise
+            location = response.getheader("Location")
+            if method == "HEAD" and not response.will_close:
+                response.read()
+                return response.status, location, conn, opened, reused
+            conn.close()
+            return response.status, location, None, opened, reused
+
+    def _open(self, scheme, host, port, address):
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self.ssl_context)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        # socket-ul merge la adresa deja rezolvată; Host și SNI rămân host-ul din URL
+        conn._create_connection = lambda _, timeout, source: socket.create_connection(address, timeout, source)
+        return conn
+
+    async def _address(self, host, port):
+        if host in self.resolve:
+            return self.resolve[host]
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        return infos[0][4][0], port
+
+
+class UrlReachability:
+    """
+    Verificarea accesibilității URL-urilor, cu verdictele păstrate în
+    cache_path (SQLite; None = fără cache pe disc) timp de ttl secunde.
+    check_catalog() este grupul de validare, probe() / probe_async() verifică o listă de URL-uri.
+    stats: URL-uri / din cache / verificate / durata ultimei rulări.
+    O conexiune SQLite nouă per apel, deci poate rula pe thread-ul unui grup.
+    """
+
+    def __init__(self, cache_path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, concurrency=DEFAULT_CONCURRENCY,
+                 per_host=DEFAULT_PER_HOST, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES, resolve=None):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.resolve = resolve
+        self.stats = {}
+        if cache_path:
+            folder = os.path.dirname(cache_path)
+            if folder:
+                os.makedirs(folder, exist_ok=True)
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.executescript(_SCHEMA)
+                    conn.execute("DELETE FROM verdicts WHERE checked < ?", (time.time() - ttl,))
+            finally:
+                conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.cache_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    # ── verificarea unei liste de URL-uri ───────────────────────────────
+    def probe(self, urls):
+        """{formă canonică: Verdict} pentru urls; fiecare URL distinct e verificat o singură dată."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.probe_async(urls))
+        # apelat dintr-un event loop pornit, unde asyncio.run nu poate rula:
+        # rularea primește loop-ul ei, pe un thread separat
+        with ThreadPoolExecutor(1) as executor:
+            return executor.submit(asyncio.run, self.probe_async(urls)).result()
+
+    async def probe_async(self, urls):
+        """probe() pentru codul care rulează deja într-un event loop."""
+        started = time.perf_counter()
+        # 1) Deduplicare după forma canonică; se trimite prima scriere întâlnită
+        targets = {}
+        for url in urls:
+            targets.setdefault(URL_VERDICTS.canonical(url), url)
+
+        # 2) Verdictele încă valabile din cache
+        verdicts = self._cached(list(targets))
+        missing = {key: url for key, url in targets.items() if key not in verdicts}
+
+        # 3) Restul, în paralel
+        prober = _Prober(self.concurrency, self.per_host, self.timeout, self.retries, self.resolve)
+        if missing:
+            fresh = await prober.run(list(set(missing.values())))
+            fresh = {key: fresh[url] for key, url in missing.items()}
+            verdicts.update(fresh)
+            self._store(fresh)
+
+        self.stats = {
+            "URLs": len(urls),
+            "Distinct": len(targets),
+            "Cached": len(targets) - len(missing),
+            "Probed": len(missing),
+            "Unreachable": sum(not verdict.ok for verdict in verdicts.values()),
+            "Requests": prober.stats["requests"],
+            "Connections": prober.stats["connections"],
+            "Reused Connections": prober.stats["reused"],
+            "Retries": prober.stats["retries"],
+            "Seconds": round(time.perf_counter() - started, 4),
+        }
+        return verdicts
+
+    def _cached(self, keys):
+        if not self.cache_path or not keys:
+            return {}
+        found = {}
+        since = time.time() - self.ttl
+        conn = self._connect()
+        try:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                query = conn.execute(
+                    "SELECT url, ok, status, reason FROM verdicts"
+                    f" WHERE checked >= ? AND url IN ({','.join('?' * len(batch))})",
+                    [since] + batch,
+                )
+                for url, ok, status, reason in query:
+                    found[url] = Verdict(bool(ok), status, reason)
+        finally:
+            conn.close()
+        return found
+
+    def _store(self, verdicts):
+        if not self.cache_path or not verdicts:
+            return
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO verdicts (url, ok, status, reason, checked) VALUES (?, ?, ?, ?, ?)",
+                    [(url, int(v.ok), v.status, v.reason, now) for url, v in verdicts.items()],
+                )
+        finally:
+            conn.close()
+
+    def clear(self):
+        """Golește cache-ul de pe disc."""
+        if self.cache_path:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM verdicts")
+            finally:
+                conn.close()
+
+    # ── grupul de validare ──────────────────────────────────────────────
+    def check_catalog(self, df, catalog, mapped_props=None, columns=None):
+        """
+        URL Reachability Checks: pentru fiecare prop din URL_PROPS, celulele
+        al căror URL (textul sau hyperlink-ul atașat) nu răspunde cu 2xx.
+        """
+        mapped = set(mapped_props or [])
+        if columns is None:
+            columns = ColumnCache(df)
+        df = df.loc[:, ~df.columns.duplicated()]
+
+        # 1) URL-ul de verificat per celulă nevidă: textul, altfel hyperlink-ul valid
+        present = {}
+        for prop in URL_PROPS:
+            if (mapped and prop not in mapped) or prop not in df.columns:
+                continue
+            check_name = f"{prop} Reachability Check"
+            norm = columns.get(prop, check_name)
+            letter = (
+                catalog.header_letters.get((mapped_props or {}).get(prop, prop))
+                or get_column_letter(df.columns.get_loc(prop) + 1)
+            )
+            filled = np.flatnonzero(~norm.blank)
+            urls = norm.values.to_numpy(dtype=object)[filled]
+            text_ok = URL_VERDICTS.valid_mask(urls, check_name)
+            links = catalog.hyperlinks.column(letter)
+            for i in np.flatnonzero(~text_ok).tolist():
+                link = (links.get(int(filled[i]) + 2) or "").strip()
+                urls[i] = link if link and URL_VERDICTS.is_valid(link) else None
+            keep = np.array([url is not None for url in urls], dtype=bool)
+            present[prop] = {
+                "letter": letter,
+                "filled": len(filled),
+                "rows": filled[keep] + 2,
+                "urls": urls[keep].tolist(),
+            }
+
+        # 2) Toate URL-urile, o singură rundă de cereri (deduplicate și între coloane)
+        verdicts = self.probe([url for cur in present.values() for url in cur["urls"]])
+
+        # 3) Rezultatele, în ordinea URL_PROPS
+        results = []
+        for prop in URL_PROPS:
+            check_name = f"{prop} Reachability Check"
+            common = {
+                "% Reachable": "0%",
+                "Check Fail Count": 0,
+                "Check Fail Example": "",
+                "Check Fail Example Cell Reference": ""
+            }
+            if mapped and prop not in mapped:
+                results.append(report_check(check_name, "⏭️ Skip", Explanation="Not mapped", **common))
+                continue
+            if prop not in present:
+                results.append(report_check(check_name, "⏭️ Skip", Explanation="Column missing", **common))
+                continue
+            cur = present[prop]
+            if not cur["urls"]:
+                explanation = "No valid URLs to check" if cur["filled"] else "No data present"
+                results.append(report_check(check_name, "⏭️ Skip", Explanation=explanation, **common))
+                continue
+
+            found = [verdicts[URL_VERDICTS.canonical(url)] for url in cur["urls"]]
+            fails = [i for i, verdict in enumerate(found) if not verdict.ok]
+            total = len(found)
+            common["% Reachable"] = f"{int((total - len(fails)) / total * 100)}%"
+            if not fails:
+                results.append(report_check(check_name, "✅ Pass", Explanation="", **common))
+                continue
+
+            # explicația: câte celule pică din fiecare motiv, cele mai dese primele
+            reasons = Counter(found[i].reason for i in fails)
+            common["Check Fail Count"] = len(fails)
+            common["Check Fail Example"] = cur["urls"][fails[0]]
+            common["Check Fail Example Cell Reference"] = f"{cur['letter']}{int(cur['rows'][fails[0]])}"
+            results.append(report_check(
+                check_name, "❌ Fail",
+                Explanation="; ".join(f"{reason}: {count}" for reason, count in reasons.most_common()),
+                **common
+            ))
+        return results
+
+    def report(self):
+        """Sumarul pentru raport: URL-uri distincte / din cache / verificate, cereri și conexiuni."""
+        return dict(self.stats)
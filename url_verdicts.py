@@ -0,0 +1,164 @@
+"""
+Verdictele de format pentru URL-uri, memoizate: un singur serviciu folosit de
+toate verificările de URL (group_f, group_i / hyperlink_check,
+hyperlink_target_check, chunked.py).
+
+Aceleași URL-uri de imagine se repetă la toate variantele unui produs, iar
+coloanele și rulările succesive (re-validare după schimbarea mapping-ului)
+văd din nou aceleași valori. Fiecare apel valid_mask deduplică valorile
+(pd.factorize), iar VALID_URL_REGEX rulează o singură dată per URL distinct;
+verdictele stau într-un LRU mărginit (max_entries), comun coloanelor și
+rulărilor din același proces.
+
+LRU-ul e aproximat cu două generații de dict-uri simple (recent / older):
+o intrare găsită în older e mutată în recent; când recent ajunge la
+max_entries / 2, older e aruncat și recent devine older. Căutarea și
+inserarea se fac pe loturi (toate valorile distincte ale unui apel), fără
+lista înlănțuită a unui OrderedDict.
+
+Cheia e textul exact al URL-ului: regex-ul e sensibil la schema scrisă cu
+majuscule și la spații, deci verdictul pe forma canonică ar schimba
+rezultatele. Forma canonică (normalize_url: percent-decoding, schema și
+host-ul în lowercase) e memoizată separat, cu aceeași limită, la prima
+cerere (canonical), pentru deduplicarea URL-urilor scrise diferit.
+"""
+import re
+import threading
+from urllib.parse import unquote, urlparse, urlunparse
+
+import numpy as np
+import pandas as pd
+
+VALID_URL_REGEX = re.compile(r'^(https?://)[A-Za-z0-9\.-]+\.[A-Za-z]{2,}.*$')
+
+DEFAULT_MAX_ENTRIES = 500_000
+
+
+def normalize_url(raw: str) -> str:
+    """
+    Decodifică percent-encoding, strip-uiește whitespace,
+    și pune scheme și host în lowercase.
+    """
+    if not raw:
+        return ""
+    p = urlparse(raw.strip())
+    path  = unquote(p.path)
+    query = unquote(p.query)
+    return urlunparse((
+        p.scheme.lower(),
+        p.netloc.lower(),
+        path,
+        p.params,
+        query,
+        ""
+    ))
+
+
+class UrlVerdicts:
+    """
+    LRU URL → verdict regex (+ URL → formă canonică), sigur între thread-uri
+    (validate_file cu workers > 1 rulează group_f și group_i în paralel).
+    stats: hits / misses (per URL distinct) din rularea curentă, vezi
+    start_run(); log: (check, celule, distincte, hits, misses) per apel.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._recent = {}
+        self._older = {}
+        self._canonical = {}
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.stats = {"hits": 0, "misses": 0}
+        self.log = []
+
+    def start_run(self):
+        """Resetează statisticile rulării; verdictele rămân."""
+        with self._lock:
+            self.stats = {"hits": 0, "misses": 0}
+            self.log = []
+
+    def clear(self):
+        with self._lock:
+            self._recent = {}
+            self._older = {}
+            self._canonical = {}
+            self.evictions = 0
+
+    def __len__(self):
+        return len(self._recent) + len(self._older)
+
+    def _lookup(self, urls):
+        """
+        Verdictele pentru urls (distincte), cu lock-ul luat: intrările din older
+        trec în recent, miss-urile sunt evaluate și inserate; întoarce (verdicte, hits).
+        """
+        found = list(map(self._recent.get, urls))
+        missing = [url for url, verdict in zip(urls, found) if verdict is None]
+        if not missing:
+            return found, len(urls)
+        older = {}
+        if self._older:
+            older = {url: self._older.pop(url) for url in missing if url in self._older}
+            missing = [url for url in missing if url not in older]
+        computed = dict(zip(missing, map(bool, map(VALID_URL_REGEX.match, missing))))
+        self._recent.update(older)
+        self._recent.update(computed)
+        found = [self._recent[url] if verdict is None else verdict for url, verdict in zip(urls, found)]
+        if len(self._recent) >= self.max_entries // 2:
+            self.evictions += len(self._older)
+            self._older, self._recent = self._recent, {}
+        return found, len(urls) - len(computed)
+
+    def is_valid(self, url):
+        """Verdictul pentru un singur URL (text exact), fără intrare în log."""
+        with self._lock:
+            (verdict,), hits = self._lookup([url])
+            self.stats["hits" if hits else "misses"] += 1
+        return verdict
+
+    def valid_mask(self, values, check=None):
+        """
+        np.ndarray bool: VALID_URL_REGEX.match pe fiecare valoare, evaluat o
+        singură dată per valoare distinctă. Valorile lipsă (None / NaN) sunt invalide.
+        """
+        codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+        verdicts = np.zeros(len(uniques) + 1, dtype=bool)
+        with self._lock:
+            found, hits = self._lookup([str(url) for url in uniques])
+            verdicts[:len(uniques)] = found
+            self.stats["hits"] += hits
+            self.stats["misses"] += len(uniques) - hits
+            self.log.append({
+                "Check": check, "Cells": len(codes), "Distinct": len(uniques),
+                "Hits": hits, "Misses": len(uniques) - hits,
+            })
+        # codul -1 (valoare lipsă) cade pe ultimul element, False
+        return verdicts[codes]
+
+    def canonical(self, url):
+        """Forma canonică (normalize_url), memoizată (golită la max_entries)."""
+        with self._lock:
+            canonical = self._canonical.get(url)
+            if canonical is None:
+                if len(self._canonical) >= self.max_entries:
+                    self._canonical = {}
+                canonical = self._canonical[url] = normalize_url(url)
+            return canonical
+
+    def report(self):
+        """Sumarul pentru raport: hits / misses și rata de hit a rulării, intrările din LRU."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "Hits": self.stats["hits"],
+            "Misses": self.stats["misses"],
+            "Hit Rate": f"{self.stats['hits'] / lookups:.1%}" if lookups else "0.0%",
+            "Entries": len(self),
+            "Max Entries": self.max_entries,
+            "Evictions": self.evictions,
+            "Checks": list(self.log),
+        }
+
+
+# serviciul comun tuturor rulărilor din proces (ex. GUI-ul, între re-validări)
+URL_VERDICTS = UrlVerdicts()
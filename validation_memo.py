@@ -0,0 +1,176 @@
+"""
+Memoizare pentru re-validări în aceeași sesiune: validate_file(..., memo=ValidationMemo()).
+
+Când utilizatorul schimbă doar mapping-ul și validează din nou, coloanele
+din foaie sunt aceleași. Rezultatele parțiale din sharding.py (blank,
+limit, comma, values, parts, Data Format per literă) depind doar de
+conținutul coloanei și de parametrii verificării, așa că sunt păstrate cu
+cheia (amprenta conținutului coloanei, verificare + parametri). La o nouă
+rulare se calculează doar perechile noi; rapoartele grupurilor sunt
+reconstruite din rezultatele parțiale (sharding.finalize), identic cu o
+rulare completă.
+
+Grupurile de URL (f, i) depind și de hyperlink-urile foii: sunt păstrate
+întregi, cu cheia formată din intrările lor (amprenta coloanei, poziția,
+litera, starea mapping-ului), cât timp foaia încărcată rămâne aceeași.
+"""
+import hashlib
+
+import pandas as pd
+
+from sharding import build_plan, finalize, shard_partial
+from format_scanner import scan_values
+from validator import group_f, group_i
+
+URL_GROUPS = ("Mandatory Data - URL Field Checks", "Optional Data - URL Field Checks")
+
+
+def fingerprint(column):
+    """Amprenta conținutului unei coloane (valori + lungime), independentă de index și header."""
+    if column is None:
+        return "none"
+    # hash per element direct pe obiecte (fără factorize, ca hash_pandas_object pe str)
+    hashes = pd.util.hash_array(column.to_numpy(dtype=object), categorize=False)
+    return f"{len(column)}:{hashlib.blake2b(hashes.tobytes(), digest_size=16).hexdigest()}"
+
+
+class ValidationMemo:
+    """
+    Rezultatele parțiale ale verificărilor, păstrate între rulările
+    validate_file din aceeași sesiune. stats: hits / misses din ultima
+    rulare; log: (check, coloană, hit / miss) din ultima rulare.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._groups = {}
+        self._sheet = None
+        self._sheet_fingerprints = {}
+        self.stats = {"hits": 0, "misses": 0}
+        self.log = []
+
+    def clear(self):
+        self._entries.clear()
+        self._groups.clear()
+        self._sheet = None
+        self._sheet_fingerprints.clear()
+
+    def validate_groups(self, df, catalog, mapped_props, extra_id_cols):
+        """
+        Rezultatele pentru sharding.SHARDED_GROUPS + URL_GROUPS pe df
+        (header-e unice), calculând doar ce nu e deja în memo.
+        """
+        self.stats = {"hits": 0, "misses": 0}
+        self.log = []
+        if self._sheet is not catalog.df:
+            # altă foaie încărcată: hyperlink-urile și coloanele foii s-au schimbat
+            self._groups.clear()
+            self._sheet_fingerprints.clear()
+            self._sheet = catalog.df
+
+        plan = build_plan(df, catalog, mapped_props, extra_id_cols)
+        merged = {"n": len(df), "columns": {}, "formats": {}}
+        for pos, kinds in plan["columns"].items():
+            merged["columns"][pos] = self._column_stats(df.columns[pos], df.iloc[:, pos], kinds)
+        for letter in plan["letters"]:
+            merged["formats"][letter] = self._format_stats(letter, catalog.column)
+
+        results = finalize(merged, df, catalog, mapped_props, extra_id_cols)
+        results[URL_GROUPS[0]] = self._group(
+            URL_GROUPS[0], self._image_url_key(df, mapped_props),
+            group_f, (catalog, df), {"mapped_props": mapped_props},
+        )
+        results[URL_GROUPS[1]] = self._group(
+            URL_GROUPS[1], self._url_key(catalog, mapped_props),
+            group_i, (catalog,), {"mapped_props": mapped_props},
+        )
+        return results
+
+    def report(self):
+        """Sumarul pentru raport: hits / misses, intrări păstrate, log-ul per check."""
+        return {
+            "Hits": self.stats["hits"],
+            "Misses": self.stats["misses"],
+            "Entries": len(self._entries) + len(self._groups),
+            "Checks": list(self.log),
+        }
+
+    # ── rezultate parțiale per coloană ──────────────────────────────────
+    def _lookup(self, key, check, column):
+        found = key in self._entries
+        self.stats["hits" if found else "misses"] += 1
+        self.log.append({"Check": check, "Column": column, "Cache": "hit" if found else "miss"})
+        return found
+
+    def _column_stats(self, name, column, kinds):
+        fp = fingerprint(column)
+        kinds = ["blank"] + sorted(kinds, key=str)
+        missing = [kind for kind in kinds if not self._lookup((fp, kind), str(kind), name)]
+        if missing:
+            part = shard_partial(
+                {0: column}, {}, 0, len(column),
+                {0: {kind for kind in missing if kind != "blank"}},
+            )["columns"][0]
+            self._entries[(fp, "blank")] = (part["blank"], part["first_blank"])
+            for kind in missing:
+                if kind != "blank":
+                    self._entries[(fp, kind)] = part[kind]
+
+        stats = {}
+        stats["blank"], stats["first_blank"] = self._entries[(fp, "blank")]
+        for kind in kinds[1:]:
+            stats[kind] = self._entries[(fp, kind)]
+        return stats
+
+    def _format_stats(self, letter, sheet_column):
+        # coloanele foii nu se schimbă între rulări: amprenta e calculată o singură dată
+        fp = self._sheet_fingerprints.get(letter)
+        if fp is None:
+            fp = self._sheet_fingerprints[letter] = fingerprint(sheet_column(letter))
+        key = (fp, "formats")
+        if not self._lookup(key, "Data Format Checks", letter):
+            column = sheet_column(letter)
+            values = [] if column is None else column.fillna("").astype(str).tolist()
+            self._entries[key] = {
+                check: (len(rows), (int(rows[0]), snippets[0]) if len(rows) else None)
+                for check, (rows, snippets) in scan_values(values).items()
+            }
+        return self._entries[key]
+
+    # ── grupurile de URL, păstrate întregi ──────────────────────────────
+    def _group(self, name, key, func, args, kwargs):
+        found = key in self._groups
+        self.stats["hits" if found else "misses"] += 1
+        self.log.append({"Check": name, "Column": None, "Cache": "hit" if found else "miss"})
+        if not found:
+            self._groups[key] = func(*args, **kwargs)
+        # copii: raportul (ex. GUI-ul) poate modifica rezultatele
+        return [check.copy() for check in self._groups[key]]
+
+    @staticmethod
+    def _image_url_key(df, mapped_props):
+        col = "Product Image URL"
+        mapped = set(mapped_props or [])
+        if col not in df.columns:
+            return (bool(mapped), col in mapped, None, None)
+        pos = df.columns.get_loc(col)
+        return (bool(mapped), col in mapped, pos, fingerprint(df.iloc[:, pos]))
+
+    @staticmethod
+    def _url_key(catalog, mapped_props):
+        # group_i lucrează pe foaia încărcată, cu header-ele redenumite după mapping
+        rename_map = {
+            header: prop
+            for prop, header in (mapped_props or {}).items()
+            if header in catalog.df.columns
+        }
+        renamed = [rename_map.get(name, name) for name in catalog.df.columns]
+        key = []
+        for col in ("Product URL", "Product Video URL"):
+            positions = [i for i, name in enumerate(renamed) if name == col]
+            key.append((
+                col in (mapped_props or {}),
+                positions[0] if positions else None,
+                catalog.header_letters.get((mapped_props or {}).get(col, col)),
+            ))
+        return tuple(key)
@@ -10,6 +10,14 @@ from openpyxl.worksheet.worksheet import Worksheet
 
 from urllib.parse import urlparse
 
+from char_limits import LimitSpec, evaluate_limit
+from check_digits import GTIN_LENGTHS, MAX_CELL_RANGES, REASONS, CodeSpec, cell_ranges, evaluate_codes
+from check_result import CheckResult, GroupResult
+from column_cache import ColumnCache
+from country_index import CountryIndex
+from duplicates import DuplicateGroups
+from url_verdicts import URL_VERDICTS
+
 
 # import builtins
 
@@ -40,22 +48,143 @@ def trim_val(val):
 
 
 def report_check(performed, outcome, **kwargs):
-    result = {"Check Performed": performed, "Check Outcome": outcome}
-    result.update(kwargs)
-    return result
+    """Rezultatul unei verificări (check_result.CheckResult), cu câmpurile în ordinea dată."""
+    return CheckResult(performed, outcome, **kwargs)
+
+
+# proprietățile verificate de grupurile pe coloane (aceleași și în sharding.build_plan)
+MANDATORY_COMPLETENESS = ["Country", "Brand", "Product ID", "Product Name (English)", "Product Image URL"]
+MANDATORY_UNIQUENESS = ["Product ID", "Product Name (English)"]
+OPTIONAL_COMPLETENESS = [
+    "SKU", "EAN", "UPC", "GTIN", "CTIN", "ASIN",
+    "Product Name (Local Language)",
+    "Product Description (English)",
+    "Product Description (Local Language)",
+    "Category", "Sub-Category",
+    "Product URL", "Product Video URL",
+    "MAP", "MSRP"
+]
+OPTIONAL_UNIQUENESS = [
+    "SKU", "EAN", "UPC", "GTIN", "CTIN", "ASIN",
+    "Product Name (Local Language)",
+    "Product Description (English)",
+    "Product Description (Local Language)",
+    "Category", "Sub-Category",
+    "Product URL", "Product Video URL",
+    "MSRP", "MAP", "Product Image URL"
+]
+DESCRIPTION_PROPS = ["Product Description (English)", "Product Description (Local Language)"]
+CATEGORY_PROPS = ["Category", "Sub-Category"]
+NAME_MAX_LEN = 750
+DESCRIPTION_MAX_LEN = 4000
+CATEGORY_MAX_LEN = 75
+CATEGORY_FORBIDDEN = "<>"
+
+
+class ColumnFacts:
+    """
+    Statisticile din care grupurile b–p construiesc rapoartele, calculate pe
+    tot df-ul (rularea obișnuită). sharding.PartialFacts are aceleași metode,
+    cu valorile din rezultatele parțiale combinate (shards, memo, row-diff,
+    triaj, chunked, preview), așa că fiecare raport e construit într-un singur
+    loc, indiferent de mod.
+
+    col: header-ul (prima coloană cu acest nume) sau poziția în df.
+    Ultimul element al fiecărui rezultat: toate rândurile Excel care pică,
+    pentru failures (None în sharding.PartialFacts, unde nu există failures).
+    """
 
-def group_a(wb, sheet_name=None):
+    def __init__(self, df, columns=None, catalog=None):
+        if columns is None or columns.df is not df:
+            columns = ColumnCache(df)
+        self.df = df
+        self.columns = columns
+        self.catalog = catalog
+        self.n = len(df)
+        self._scanner = None
+
+    def _norm(self, col, check):
+        if isinstance(col, (int, np.integer)):
+            return self.columns.at(int(col), check)
+        return self.columns.get(col, check)
+
+    def blank(self, col, check=None, every_duplicate=False):
+        """
+        (celule goale, primul rând gol sau None, rândurile goale).
+        every_duplicate: la header-e duplicate, celula e goală doar dacă e goală
+        în toate coloanele cu acest header (group_c).
+        """
+        if every_duplicate and not isinstance(col, (int, np.integer)) and not self.columns.is_unique(col):
+            blank = ~self.df[col].fillna("").map(trim_val).astype(bool).any(axis=1).to_numpy()
+        else:
+            blank = self._norm(col, check).blank
+        rows = np.flatnonzero(blank) + 2
+        return len(rows), (int(rows[0]) if len(rows) else None), rows
+
+    def duplicates(self, col, check=None):
+        """
+        (celule completate, celule cu valori duplicate, (primul rând, valoarea
+        trim-uită, valoarea brută) sau None, rândurile duplicate).
+        """
+        norm = self._norm(col, check)
+        groups = DuplicateGroups.from_columns([norm])
+        first = None
+        if groups.fail_count:
+            row = groups.first_row()
+            first = (row, norm.values.iat[row - 2], self.df.iat[row - 2, norm.position])
+        return groups.total, groups.fail_count, first, groups.rows
+
+    def country(self, col, check=None):
+        """Codurile de țară ale coloanei (country_index.CountryIndex)."""
+        return CountryIndex.from_column(self._norm(col, check))
+
+    def limit(self, col, spec, check=None):
+        """(celule care încalcă spec, primul rând, lungimea și textul lui, toate rândurile)."""
+        norm = self._norm(col, check)
+        found = evaluate_limit(norm, spec)
+        if not len(found.positions):
+            return 0, None, None, None, found.rows
+        first = found.positions[0]
+        return len(found.positions), int(found.rows[0]), int(found.lengths[0]), norm.values.iat[first], found.rows
+
+    def comma(self, col, check=None):
+        """(celule cu ",", primul rând, valoarea lui trim-uită, toate rândurile)."""
+        norm = self._norm(col, check)
+        positions = np.flatnonzero(norm.values.str.contains(",", regex=False).to_numpy(dtype=bool))
+        if not len(positions):
+            return 0, None, None, positions + 2
+        return len(positions), int(positions[0]) + 2, norm.values.iat[positions[0]], positions + 2
+
+    def codes(self, col, lengths, check=None):
+        """(rândurile codurilor GS1 care pică, motivul per rând, prima valoare care pică)."""
+        norm = self._norm(col, check)
+        found = evaluate_codes(norm, CodeSpec(norm.name, lengths))
+        example = norm.values.iat[found.positions[0]] if len(found.positions) else None
+        return found.rows, found.reasons, example
+
+    def formats(self, check, letters):
+        """
+        (hit-uri Data Format ale regulii check pe coloanele letters, primul hit ca
+        (literă, rând, snippet) sau None, {literă: rândurile hit-urilor}).
+        """
+        if self._scanner is None:
+            self._scanner = DataFormatScanner(self.catalog)
+        count, first = self._scanner.summary(check, letters)
+        rows = {letter: self._scanner.scan_column(letter)[check][0] for letter in letters}
+        return count, first, rows
+
+def group_a(catalog):
     """
     File Format Checks – Single Worksheet & Hidden Rows/Cols
     – Single Worksheet: verifică dacă există exact o foaie.
-    – Hidden Rows/Hidden Columns: se aplică doar pe sheet_name (dacă există în wb),
-      altfel pe wb.active.
+    – Hidden Rows/Hidden Columns: se aplică pe foaia încărcată în catalog
+      (CatalogLoader.sheet_name).
     – Nu se mai raportează “Check Fail Example Cell Reference”.
     """
     results = []
 
     # --- 1) Single Worksheet (global) ---
-    sheets = wb.sheetnames
+    sheets = catalog.sheetnames
     outcome_sw = '✅ Pass' if len(sheets) == 1 else '❌ Fail'
     results.append(report_check(
         "Single Worksheet",
@@ -63,15 +192,11 @@ def group_a(wb, sheet_name=None):
         Explanation=f"{len(sheets)} sheets: {sheets}"
     ))
 
-    # --- 2) Alegem foaia pe care lucrăm pentru hidden rows/cols ---
-    if sheet_name and sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-    else:
-        ws = wb.active
-    title = ws.title
+    # --- 2) Foaia pe care lucrăm pentru hidden rows/cols ---
+    title = catalog.sheet_name
 
     # --- 3) Hidden Rows ---
-    hidden_rows = [i for i, dim in ws.row_dimensions.items() if dim.hidden]
+    hidden_rows = list(catalog.hidden_rows)
     outcome_hr = '❌ Fail' if hidden_rows else '✅ Pass'
     # doar Count și Example (fără Cell Reference)
     hr_kwargs = {
@@ -86,7 +211,7 @@ def group_a(wb, sheet_name=None):
     ))
 
     # --- 4) Hidden Columns ---
-    hidden_cols = [c for c, dim in ws.column_dimensions.items() if dim.hidden]
+    hidden_cols = list(catalog.hidden_cols)
     outcome_hc = '❌ Fail' if hidden_cols else '✅ Pass'
     hc_kwargs = {
         "Check Fail Count": len(hidden_cols),
@@ -107,30 +232,28 @@ def group_a(wb, sheet_name=None):
 from openpyxl.utils import get_column_letter
 import re
 
+from format_scanner import CHECK_NAMES, DataFormatScanner
 
-def group_b(df, wb, mapped_props=None):
+
+def group_b(df, catalog, mapped_props=None, failures=None, facts=None):
     """
     Data Format Checks (Demo Data, Special Characters, Formulas, HTML Tags)
-    – rulează **numai** pe foaia activă (wb.active), nu pe toate foile.
+    – rulează **numai** pe foaia încărcată în catalog, nu pe toate foile.
     – fiecare fail e raportat sub forma SheetName!ColLetterRow.
+    – failures (failures.GroupFailures): primește toate celulele cu hit-uri.
+    – facts: sursa hit-urilor (ColumnFacts / sharding.PartialFacts).
     (Optimizare fără schimbare de funcționalitate sau UI:
      - evită recăutarea literei coloanei pentru fiecare regulă
-     - accesează valorile cu iter_rows(values_only=True) în loc de indexări celulă‑cu‑celulă)
+     - citește valorile coloanelor din CatalogLoader, fără re-parsarea foii
+     - fiecare coloană e scanată o singură dată, vectorizat (DataFormatScanner))
     """
-    checks = [
-        ("Demo Data",        re.compile(r'\bdemo(?:brand|sku|_category)?\b', re.IGNORECASE)),
-        ("Special Characters", set("©$€£¥™®@")),
-        ("Formulas",         "="),
-        ("HTML Tags",        re.compile(r'<[^>]+>|&lt;[^&]+&gt;'))
-    ]
     results = []
 
-    ws = wb.active
-    sheet_name = ws.title
+    sheet_name = catalog.sheet_name
 
     # Dacă nu avem coloane în DataFrame, păstrăm exact același comportament
     if df.columns.empty:
-        for name, _ in checks:
+        for name in CHECK_NAMES:
             results.append(report_check(
                 name, "⏭️ Skip", Explanation="No columns in DataFrame",
                 **{"Check Fail Count": 0,
@@ -140,149 +263,30 @@ def group_b(df, wb, mapped_props=None):
         return results
 
     # mapăm header-ele din rândul 1 -> literă de coloană
-    header_to_letter = {}
-    for cell in ws[1]:
-        header = str(cell.value).strip() if cell.value is not None else ""
-        if header in df.columns:
-            header_to_letter[header] = cell.column_letter
-
-    # PRE-SCAN HTML (ordinea și logica rămân identice)
-    html_pattern = re.compile(r'<[^>]+>|&lt;[^&]+&gt;')
-    html_fails = []
-    for header, col_letter in header_to_letter.items():
-        # obținem toată coloana ca valori simple, în ordinea rândurilor
-        from openpyxl.utils import column_index_from_string
-        col_idx = column_index_from_string(col_letter)
-        vals_iter = ws.iter_rows(min_col=col_idx, max_col=col_idx, min_row=2, values_only=True)
-        row_num = 2
-        for (raw,) in vals_iter:
-            text = str(raw or "").strip()
-            if text:
-                for tag in html_pattern.findall(text):
-                    html_fails.append((sheet_name, col_letter, row_num, tag))
-            row_num += 1
-
-    # Bucla inițială per regulă -> per coloană -> per rând (păstrăm aceeași ordine)
-    for name, pattern in checks:
-        fails = list(html_fails) if name == "HTML Tags" else []
-
-        for header in df.columns:
-            col_letter = header_to_letter.get(header)
-            if not col_letter:
-                continue
-
-            from openpyxl.utils import column_index_from_string
-            col_idx = column_index_from_string(col_letter)
-            vals_iter = ws.iter_rows(min_col=col_idx, max_col=col_idx, min_row=2, values_only=True)
-
-            row_num = 2
-            for (raw,) in vals_iter:
-                text = str(raw or "").strip()
-                if not text:
-                    row_num += 1
-                    continue
-
-                if name == "Demo Data":
-                    for m in pattern.finditer(text):
-                        fails.append((sheet_name, col_letter, row_num, m.group(0)))
-
-                elif name == "Special Characters":
-                    for ch in pattern:
-                        for _ in range(text.count(ch)):
-                            fails.append((sheet_name, col_letter, row_num, ch))
-
-                elif name == "Formulas":
-                    # păstrăm EXACT logica inițială bazată pe text
-                    if text.startswith("="):
-                        fails.append((sheet_name, col_letter, row_num, text))
-
-                row_num += 1
-
-        outcome = "❌ Fail" if fails else "✅ Pass"
-        if fails:
-            _, col, row, snippet = fails[0]
-            example_ref = f"{sheet_name}!{col}{row}"
-        else:
-            snippet = example_ref = ""
-
-        results.append(report_check(
-            name,
-            outcome,
-            Explanation="",
-            **{
-                "Check Fail Count": len(fails),
-                "Check Fail Example": snippet,
-                "Check Fail Example Cell Reference": example_ref
-            }
-        ))
+    header_to_letter = {
+        header: letter
+        for header, letter in catalog.header_letters.items()
+        if header in df.columns
+    }
 
-    return results
-      # mapăm fiecare header din df la litera de coloană Excel
-    header_to_letter = {}
-    for cell in ws[1]:
-        header = str(cell.value).strip() if cell.value is not None else ""
-        if header in df.columns:
-            header_to_letter[header] = cell.column_letter
-      # ——— PRE-SCAN PENTRU HTML TAGS ———
-       # ——— PRE-SCAN PENTRU HTML TAGS (doar pe coloanele din df) ———
-    html_pattern = re.compile(r'<[^>]+>|&lt;[^&]+&gt;')
-    html_fails = []
-    for header, col_letter in header_to_letter.items():
-        for row in range(2, ws.max_row + 1):
-            raw = ws[f"{col_letter}{row}"].value
-            text = str(raw or "").strip()
-            if not text:
-                continue
-            for tag in html_pattern.findall(text):
-                html_fails.append((sheet_name, col_letter, row, tag))
-    # ————————————————————————————————————————————————
-    # Pentru fiecare regulă, scanăm coloanele din df pe foaia activă
-    for name, pattern in checks:
-        # fails = []
-        if name == "HTML Tags":
-            fails = list(html_fails)
-        else:
-            fails = []
-        
-        for header in df.columns:
-            # găsim litera coloanei în Excel după header
-            col_letter = None
-            for cell in ws[1]:
-                if cell.value and str(cell.value).strip() == str(header).strip():
-                    col_letter = cell.column_letter
-                    break
-            if not col_letter:
-                continue
-
-            # iterăm rândurile din acea coloană
-            for row in range(2, ws.max_row + 1):
-                raw = ws[f"{col_letter}{row}"].value
-                text = str(raw or "").strip()
-                if not text:
-                    continue
-
-                if name == "Demo Data":
-                    for m in pattern.finditer(text):
-                        fails.append((sheet_name, col_letter, row, m.group(0)))
-
-                elif name == "Special Characters":
-                    for ch in pattern:
-                        for _ in range(text.count(ch)):
-                            fails.append((sheet_name, col_letter, row, ch))
-
-                elif name == "Formulas":
-                    if text.startswith("="):
-                        fails.append((sheet_name, col_letter, row, text))
-
-                # elif name == "HTML Tags":
-                #     for tag in pattern.findall(text):
-                #         fails.append((sheet_name, col_letter, row, tag))
-                
-
-        # Construim raportul
-        outcome = "❌ Fail" if fails else "✅ Pass"
-        if fails:
-            _, col, row, snippet = fails[0]
+    # HTML Tags: ordinea coloanelor din foaie (ca la vechiul pre-scan);
+    # celelalte reguli: ordinea coloanelor din df
+    sheet_letters = list(header_to_letter.values())
+    df_letters = [header_to_letter[h] for h in df.columns if h in header_to_letter]
+
+    if facts is None:
+        facts = ColumnFacts(df, catalog=catalog)
+    for name in CHECK_NAMES:
+        letters = sheet_letters if name == "HTML Tags" else df_letters
+        fail_count, first, rows = facts.formats(name, letters)
+        if failures is not None and fail_count:
+            letter_to_header = {letter: header for header, letter in header_to_letter.items()}
+            for letter in letters:
+                failures.add(name, letter_to_header[letter], letter, rows[letter])
+
+        outcome = "❌ Fail" if fail_count else "✅ Pass"
+        if first:
+            col, row, snippet = first
             example_ref = f"{sheet_name}!{col}{row}"
         else:
             snippet = example_ref = ""
@@ -290,10 +294,9 @@ def group_b(df, wb, mapped_props=None):
         results.append(report_check(
             name,
             outcome,
-            # Explanation=(f"{len(fails)} issue(s) found" if fails else "")
             Explanation="",
             **{
-                "Check Fail Count": len(fails),
+                "Check Fail Count": fail_count,
                 "Check Fail Example": snippet,
                 "Check Fail Example Cell Reference": example_ref
             }
@@ -307,52 +310,26 @@ from openpyxl.utils import get_column_letter
 import pandas as pd
 
 
-def completeness_check(df, col):
-    total = len(df)
+def completeness_check(df, col, columns=None, failures=None, facts=None):
+    if facts is None:
+        facts = ColumnFacts(df, columns)
+    total = facts.n
 
-    # 1) Obținem datele
-    raw = df[col].fillna("").map(trim_val)
-    mask = raw.astype(bool)
-    if isinstance(mask, pd.DataFrame):
-        mask = mask.any(axis=1)
+    # 1) Celulele goale (la header-e duplicate: goale în toate coloanele)
+    fails, first_row, rows = facts.blank(col, f"{col} Completeness", every_duplicate=True)
 
     # 2) Calculăm pct
-    non_empty = int(mask.sum())
+    non_empty = total - fails
     pct       = f"{int(non_empty/total*100)}%" if total else "0%"
 
-    # 3) Câte lipsesc
-    fails = total - non_empty
-
+    # 3) Exemplul și referința A1 a primei celule goale
     example, ref = "", ""
     if fails > 0:
-        first_blank_idx = mask[~mask].index[0]
-        cell_val = df.at[first_blank_idx, col]
-
-        # ─── Tratem Series separat ────────────────────────────────────────
-        if isinstance(cell_val, pd.Series):
-            # aplicăm trim_val pe fiecare coloană duplicată,
-            # apoi luăm primul non-blank
-            trimmed = (
-                cell_val
-                .map(lambda x: trim_val(x) if isinstance(x, str) else "")
-                .loc[lambda s: s != ""]
-            )
-            example = trimmed.iloc[0] if not trimmed.empty else "<blank>"
-
-        else:
-            # ─── Acum e scalar ───────────────────────────────────────────────
-            if pd.isna(cell_val):
-                example = "<blank>"
-            elif isinstance(cell_val, str):
-                t = trim_val(cell_val)
-                example = "<blank>" if t == "" else t
-            else:
-                example = str(cell_val)
-
-        # ─── Construim referința A1 ───────────────────────────────────────
-        col_idx    = list(df.columns).index(col) + 1
-        col_letter = get_column_letter(col_idx)
-        ref        = f"{col_letter}{first_blank_idx+2}"
+        example = "<blank>"
+        col_letter = get_column_letter(_position(df, col) + 1)
+        ref        = f"{col_letter}{first_row}"
+        if failures is not None:
+            failures.add(f"{col} Completeness", col, col_letter, rows)
 
     return report_check(
         f"{col} Completeness",
@@ -368,23 +345,21 @@ def completeness_check(df, col):
 
 
 
-def uniqueness_check(df, col):
-    vals = df[col].fillna("").map(trim_val)
-    non_empty = vals[vals != ""]
-
-    dup = non_empty[non_empty.duplicated(keep=False)]
-    total = len(non_empty)
-    fails = len(dup)
+def uniqueness_check(df, col, columns=None, failures=None, facts=None):
+    if facts is None:
+        facts = ColumnFacts(df, columns)
+    total, fails, first, rows = facts.duplicates(col, f"{col} Uniqueness")
     pct = f"{int((total - fails) / total * 100)}%" if total else "100%"
 
     example, ref = "", ""
     if fails:
-        idx = dup.index[0]
-        example = df.at[idx, col]
+        # exemplul: valoarea brută din celulă
+        row, _, example = first
         # afișăm referința celulei folosind get_column_letter
-        col_idx    = list(df.columns).index(col) + 1
-        col_letter = get_column_letter(col_idx)
-        ref        = f"{col_letter}{idx+2}"
+        col_letter = get_column_letter(_position(df, col) + 1)
+        ref        = f"{col_letter}{row}"
+        if failures is not None:
+            failures.add(f"{col} Uniqueness", col, col_letter, rows)
 
     return report_check(
         f"{col} Uniqueness",
@@ -399,22 +374,22 @@ def uniqueness_check(df, col):
     )
 
 
-def group_c(df, mapped_props=None):
+def _position(df, col):
+    """Poziția primei coloane cu header-ul col (și la header-e duplicate)."""
+    return int(np.atleast_1d(np.arange(len(df.columns))[df.columns.get_loc(col)])[0])
+
+
+def group_c(df, mapped_props=None, columns=None, failures=None, facts=None):
     """
     Mandatory Data - Completeness Checks
     Verifică completitudinea coloanelor obligatorii doar dacă au fost mapate.
     """
-    mandatory = [
-        "Country",
-        "Brand",
-        "Product ID",
-        "Product Name (English)",
-        "Product Image URL"
-    ]
     results = []
     mapped = set(mapped_props or [])
+    if facts is None:
+        facts = ColumnFacts(df, columns)
 
-    for col in mandatory:
+    for col in MANDATORY_COMPLETENESS:
         check_name = f"{col} Completeness"
 
         # 1) Dacă mapped_props există și câmpul nu e printre ele → Skip
@@ -443,13 +418,13 @@ def group_c(df, mapped_props=None):
 
         # 3) Altfel, aplicăm completeness_check
         else:
-            results.append(completeness_check(df, col))
+            results.append(completeness_check(df, col, failures=failures, facts=facts))
 
     return results
 
 
 
-def group_d(df, mapped_props=None):
+def group_d(df, mapped_props=None, columns=None, failures=None, facts=None):
     """
     Mandatory Data - Uniqueness Checks
     Verifică unicitatea pe câmpurile obligatorii doar dacă au fost mapate.
@@ -457,14 +432,12 @@ def group_d(df, mapped_props=None):
     Dacă sunt mapate, dar coloana nu există în df: ⏭️ Skip (Mapped but column missing)
     Altfel: uniqueness_check.
     """
-    mandatory = [
-        "Product ID",
-        "Product Name (English)"
-    ]
     results = []
     mapped = set(mapped_props or [])
+    if facts is None:
+        facts = ColumnFacts(df, columns)
 
-    for col in mandatory:
+    for col in MANDATORY_UNIQUENESS:
         check_name = f"{col} Uniqueness"
         # 1) dacă există mapped_props dar col nu e în ele → Skip
         if mapped and col not in mapped:
@@ -494,7 +467,7 @@ def group_d(df, mapped_props=None):
             ))
         # 3) Altfel, rulăm verificarea de unicitate
         else:
-            results.append(uniqueness_check(df, col))
+            results.append(uniqueness_check(df, col, failures=failures, facts=facts))
 
     return results
 
@@ -505,11 +478,15 @@ from openpyxl.utils import get_column_letter
 from openpyxl import Workbook
 
 
-def group_e(df, mapped_props=None):
+def group_e(df, mapped_props=None, columns=None, failures=None, facts=None):
     """
     Mandatory Data - Country Unique Count
     Verifică că există exact o singură valoare nenulă unică în coloana Country,
     doar dacă Country a fost mapat. Altfel: ⏭️ Skip.
+    Codurile, prima apariție și "Rows Per Code" (câte rânduri folosesc
+    fiecare cod) vin din country_index.CountryIndex, într-o singură trecere.
+    failures primește celulele goale (Fail "Missing"); la Fail cu mai multe
+    coduri de țară verificarea e pe întreaga coloană, fără celule anume.
     """
     col = "Country"
     check_name = "Country Unique Count"
@@ -524,6 +501,7 @@ def group_e(df, mapped_props=None):
             **{
                 "Count Unique": 0,
                 "List Unique Values": "",
+                "Rows Per Code": {},
                 "Check Fail Example": "",
                 "Check Fail Example Cell Reference": ""
             }
@@ -538,18 +516,22 @@ def group_e(df, mapped_props=None):
             **{
                 "Count Unique": 0,
                 "List Unique Values": [],
+                "Rows Per Code": {},
                 "Check Fail Example": "",
                 "Check Fail Example Cell Reference": ""
             }
         )]
     
+    if facts is None:
+        facts = ColumnFacts(df, columns)
+
     # ─── 2.1) FAIL dacă avem rânduri blank în Country ───
-    blank_mask = df[col].isna() | df[col].astype(str).map(trim_val).eq("")
-    if blank_mask.any():
+    blank_count, excel_row, blank_rows = facts.blank(col, check_name)
+    if blank_count:
     # prima linie blank
-        first_idx = df.index[blank_mask][0]
-        excel_row = first_idx + 2
-        col_letter = get_column_letter(df.columns.get_loc(col) + 1)
+        col_letter = get_column_letter(_position(df, col) + 1)
+        if failures is not None:
+            failures.add(check_name, col, col_letter, blank_rows)
         return [report_check(
             check_name,
             "❌ Fail",
@@ -557,6 +539,7 @@ def group_e(df, mapped_props=None):
             **{
             "Count Unique": "",
             "List Unique Values": "",
+            "Rows Per Code": {},
             "Check Fail Example": "<blank>",
             "Check Fail Example Cell Reference": f"{col_letter}{excel_row}"
         }
@@ -578,18 +561,13 @@ def group_e(df, mapped_props=None):
     common = {
         "Count Unique": 0,
         "List Unique Values": [],
+        "Rows Per Code": {},
         "Check Fail Example": "",
         "Check Fail Example Cell Reference": ""
     }
 
-    raw = df[col].dropna().map(str).map(trim_val).loc[lambda s: s != ""]
-    parts = (
-        raw.str.split(r"\+")
-           .explode()
-           .map(trim_val)
-           .loc[lambda s: s != ""]
-    )
-    vals = parts.unique().tolist()
+    index = facts.country(col, check_name)
+    vals = index.codes.tolist()
     # If Country column has no data, skip this check
     if not vals:
         return [report_check(
@@ -599,6 +577,7 @@ def group_e(df, mapped_props=None):
             **{
                 "Count Unique": 0,
                 "List Unique Values": "",
+                "Rows Per Code": {},
                 "Check Fail Example": "",
                 "Check Fail Example Cell Reference": ""
             }
@@ -606,18 +585,16 @@ def group_e(df, mapped_props=None):
     list_display = ", ".join(vals) if vals else ""
     common["Count Unique"] = len(vals)
     common["List Unique Values"] = list_display
+    common["Rows Per Code"] = index.usage()
 
     if len(vals) == 1:
         outcome, explanation = "✅ Pass", ""
     else:
         outcome, explanation = "❌ Fail", f"Found {len(vals)} country codes"
-        example = vals[0]
-        common["Check Fail Example"] = example
-        mask = raw.str.contains(fr"(?:^|(?<=\+))\s*{re.escape(example)}\s*(?=(?:\+|$))",regex=True)
-        first_idx = df.index[mask][0]
-        excel_row = first_idx + 2
-        col_letter = get_column_letter(df.columns.get_loc(col) + 1)
-        common["Check Fail Example Cell Reference"] = f"{col_letter}{excel_row}"
+        # primul cod apare primul în foaie: referința vine direct din index
+        common["Check Fail Example"] = vals[0]
+        col_letter = get_column_letter(_position(df, col) + 1)
+        common["Check Fail Example Cell Reference"] = f"{col_letter}{index.first_rows()[0]}"
 
     row = report_check(
         check_name,
@@ -628,37 +605,127 @@ def group_e(df, mapped_props=None):
     return [row]
 
 
-from urllib.parse import urlparse, urlunparse, unquote
 from openpyxl.utils import get_column_letter
+import numpy as np
+import pandas as pd
 
-def normalize_url(raw: str) -> str:
+# ── verificările de URL: group_f, group_i / hyperlink_check, chunked.py ──
+class UrlTally:
     """
-    Decodifică percent-encoding, strip-uiește whitespace,
-    și pune scheme și host în lowercase.
+    Clasificarea valorilor unei coloane URL, pe loturi (add, în ordinea
+    rândurilor): o valoare trece dacă textul e URL sau, altfel, dacă target-ul
+    hyperlink-ului atașat celulei (link_at(rând)) e URL.
+    - header: ecoul header-ului, ignorat
+    - count_blanks: celulele goale intră în total (group_f) sau sunt sărite (group_i)
+    - keep_rows: păstrează rândurile tuturor valorilor care pică (failures)
     """
-    if not raw:
-        return ""
-    p = urlparse(raw.strip())
-    path  = unquote(p.path)
-    query = unquote(p.query)
-    return urlunparse((
-        p.scheme.lower(),
-        p.netloc.lower(),
-        path,
-        p.params,
-        query,
-        ""
-    ))
 
-from urllib.parse import urlparse
-from openpyxl.utils import get_column_letter
-import numpy as np
-import pandas as pd
-import re
+    def __init__(self, check_name, link_at=None, header=None, count_blanks=False, keep_rows=False):
+        self.check_name = check_name
+        self.link_at = link_at
+        self.header = header
+        self.count_blanks = count_blanks
+        self.total = 0
+        self.blanks = 0
+        self.fails = 0
+        self.first = None          # (valoare, rând, link) pentru primul fail
+        self.rows = [] if keep_rows else None
+
+    def add(self, values, rows):
+        values = list(values)
+        rows = np.asarray(rows, dtype=np.int64)
+        if self.header is not None:
+            keep = [i for i, val in enumerate(values) if val != self.header]
+            if len(keep) < len(values):
+                values, rows = [values[i] for i in keep], rows[keep]
+        filled = np.fromiter(map(bool, values), dtype=bool, count=len(values))
+        counted = np.ones(len(values), dtype=bool) if self.count_blanks else filled
+        self.blanks += len(values) - int(filled.sum())
+        self.total += int(counted.sum())
+
+        # 1) textul, o dată per URL distinct; 2) hyperlink-ul, doar unde textul pică
+        suspect = np.flatnonzero(counted & ~URL_VERDICTS.valid_mask(values, self.check_name))
+        links = [""] * suspect.size
+        if self.link_at is not None and suspect.size:
+            links = [self.link_at(row) or "" for row in rows[suspect].tolist()]
+            failing = ~URL_VERDICTS.valid_mask(links, f"{self.check_name} (hyperlinks)")
+            suspect = suspect[failing]
+            links = [link for link, bad in zip(links, failing) if bad]
+
+        self.fails += int(suspect.size)
+        if self.first is None and suspect.size:
+            i = suspect[0]
+            self.first = (values[i], int(rows[i]), links[0])
+        if self.rows is not None:
+            self.rows.extend(rows[suspect].tolist())
+        return self
+
+    def pass_rate(self):
+        return f"{int((self.total - self.fails) / self.total * 100)}%" if self.total else "0%"
+
+
+def image_url_result(check_name, col_letter, tally, n, first_row):
+    """
+    Rezultatul group_f din UrlTally: Fail "Missing" dacă toate valorile sunt
+    goale (n celule, referință pe first_row), altfel motivul primului fail.
+    """
+    if tally.total == tally.blanks:
+        return report_check(
+            check_name, "❌ Fail", Explanation="Missing",
+            **{
+              "% Pass Rate": "0%",
+              "Check Fail Count": n,
+              "Check Fail Example": "<blank>",
+              "Check Fail Example Cell Reference": f"{col_letter}{first_row}"
+            }
+        )
+
+    details = {"% Pass Rate": tally.pass_rate(), "Check Fail Count": tally.fails}
+    if tally.first:
+        val, row, link = tally.first
+        col_ref = f"{col_letter}{row}"
+        details["Check Fail Example"]               = "<blank>" if val == "" else val
+        details["Check Fail Example Cell Reference"] = col_ref
+        if link:
+            # text invalid, iar hyperlink-ul atașat nu e nici el URL
+            explanation = f"Text not URL but hyperlink used at {col_ref}"
+        else:
+            explanation = f"No hyperlink attached at {col_ref}"
+    else:
+        explanation = "All cells have a valid URL or hyperlink target."
+    return report_check(
+        check_name,
+        "✅ Pass" if tally.fails == 0 else "❌ Fail",
+        Explanation=explanation,
+        **details
+    )
 
-VALID_URL_REGEX = re.compile(r'^(https?://)[A-Za-z0-9\.-]+\.[A-Za-z]{2,}.*$')
 
-def group_f(wb, df, mapped_props=None):
+def hyperlink_result(check_name, col_letter, tally):
+    """Rezultatul hyperlink_check (group_i) din UrlTally."""
+    explanation = example = fail_cell_ref = ""
+    if tally.first:
+        example, row, link = tally.first
+        fail_cell_ref = f"{col_letter}{row}"
+        if tally.link_at is None:
+            explanation = "Invalid URL format"
+        else:
+            explanation = "Invalid hyperlink target" if link else "No hyperlink attached"
+
+    return report_check(
+        check_name,
+        "✅ Pass" if tally.fails == 0 else "❌ Fail",
+        Explanation=explanation,
+        **{
+            "% Pass Rate":                         tally.pass_rate(),
+            "Check Fail Count":                    tally.fails,
+            "Check Fail Example":                  example,
+            "Check Fail Example Cell Reference":   fail_cell_ref
+        }
+    )
+
+
+def group_f(catalog, df, mapped_props=None, failures=None):
     """
     Mandatory Data - URL Field Checks for Product Image URL,
     cu fallback pe hyperlink-ul atașat în Excel dacă textul nu e URL.
@@ -680,239 +747,399 @@ def group_f(wb, df, mapped_props=None):
             **{"% Pass Rate":"0%","Check Fail Count":0,"Check Fail Example":"","Check Fail Example Cell Reference": ""}
         )]
 
-    # C) Extragem și curățăm valorile
+    # C) Extragem și curățăm valorile; păstrăm prima apariție a fiecăreia
     raw = df[col_name]
     if isinstance(raw, pd.DataFrame):
         raw = raw.iloc[:,0]
     vals = raw.fillna("").astype(str).str.strip()
-    # eliminăm echo-ul header-ului și duplicatele
-    vals = vals.loc[(vals != col_name) & ~vals.duplicated()]
-
-    # D) Fail “Missing” dacă nu rămâne niciun URL
-    if vals.eq("").all():
-        idx0 = df.index[0] + 2
-        col_idx   = list(df.columns).index(col_name) + 1
-        col_letter= get_column_letter(col_idx)
-        return [report_check(
-            check_name, "❌ Fail", Explanation="Missing",
-            **{
-              "% Pass Rate":"0%",
-              "Check Fail Count": len(df),
-              "Check Fail Example": "<blank>",
-              "Check Fail Example Cell Reference": f"{col_letter}{idx0}"
-            }
-        )]
-
-    # E) Validare combinată: text‑based + fallback hyperlink
-    ws = wb.active
-       # alegem foaia pe care a selectat-o user-ul (fallback la primul dacă nu există)
-   
-    # map ref → hyperlink.target
-    hmap = {hl.ref: hl.target.strip() if hl.target else "" for hl in ws._hyperlinks}
-
-    # litera coloanei
-    col_idx    = list(df.columns).index(col_name) + 1
-    col_letter = get_column_letter(col_idx)
-
-    # 1) Text‑based URL check (regex strict)
-    mask_text_valid = vals.str.match(VALID_URL_REGEX).to_numpy()
-
-    # 2) Hyperlink‑based check
-    coords = [f"{col_letter}{i+2}" for i in vals.index]
-    links_series   = pd.Series({c: hmap.get(c, "") for c in coords})
-    mask_link_valid = links_series.str.match(VALID_URL_REGEX).to_numpy()
-
-    # 3) Unificăm: valid dacă
-    mask_valid = mask_text_valid | mask_link_valid
-
-    total     = mask_valid.size
-    match_cnt = int(mask_valid.sum())
-    fails_idx = np.where(~mask_valid)[0]
-
-    pct     = f"{int(match_cnt/total*100)}%" if total else "0%"
-    outcome = "✅ Pass" if fails_idx.size == 0 else "❌ Fail"
-    details = {"% Pass Rate": pct, "Check Fail Count": len(fails_idx)}
-
-    if fails_idx.size:
-        i       = fails_idx[0]
-        row     = vals.index[i] + 2
-        val     = vals.iat[i]
-        link    = links_series.iat[i]
-        col_ref = f"{col_letter}{row}"
-
-        details["Check Fail Example"]               = "<blank>" if val == "" else val
-        details["Check Fail Example Cell Reference"] = col_ref
-
-        # motiv detaliat în Explanation
-        if mask_text_valid[i]:
-            # text e ok → hyperlink invalid
-            explanation = f"Invalid hyperlink target ({link}) at {col_ref}"
-        elif link:
-            # text invalid, dar hyperlink atașat e ok
-            explanation = f"Text not URL but hyperlink used at {col_ref}"
-        else:
-            # nici text, nici hyperlink
-            explanation = f"No hyperlink attached at {col_ref}"
-    else:
-        explanation = "All cells have a valid URL or hyperlink target."
+    vals = vals.loc[~vals.duplicated()]
 
-    return [report_check(
+    # D) Text‑based + fallback pe hyperlink-ul coloanei (indexul de hyperlink-uri al foii)
+    col_letter = get_column_letter(list(df.columns).index(col_name) + 1)
+    col_links  = catalog.hyperlinks.column(col_letter)
+    tally = UrlTally(
         check_name,
-        outcome,
-        Explanation=explanation,
-        **details
-    )]
-
-
-import math
-def sanitize(obj):
-    """
-    Recursively sanitize the output:
-    - Convert numpy integers to Python ints
-    - Convert numpy floats to Python floats, mapping NaN to None
-    - Convert NaN floats to None
-    """
-    if isinstance(obj, dict):
-        return {k: sanitize(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [sanitize(v) for v in obj]
-    # numpy integer
-    if isinstance(obj, np.integer):
-        return int(obj)
-    # numpy floating or Python float
-    if isinstance(obj, (np.floating, float)):
-        val = float(obj)
-        if math.isnan(val):
-            return None
-        return val
-    return obj
-
+        link_at=lambda row: (col_links.get(row) or "").strip(),
+        header=col_name,
+        count_blanks=True,
+        keep_rows=failures is not None,
+    ).add(vals.tolist(), vals.index.to_numpy() + 2)
+
+    # E) Fail “Missing” dacă nu rămâne niciun URL: pică toate celulele
+    first_row = df.index[0] + 2 if len(df) else 2
+    if failures is not None:
+        rows = df.index.to_numpy() + 2 if tally.total == tally.blanks else tally.rows
+        if len(rows):
+            failures.add(check_name, col_name, col_letter, rows)
+    return [image_url_result(check_name, col_letter, tally, len(df), first_row)]
 
 from openpyxl import Workbook
 from openpyxl import load_workbook
 import pandas as pd
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+
+# ordinea grupurilor în raport (și în GUI)
+VALIDATION_GROUP_ORDER = [
+    "File Format Checks",
+    "Data Format Checks",
+    "Mandatory Data - Completeness Checks",
+    "Mandatory Data - Uniqueness Checks",
+    "Mandatory Data - Country Uniqueness Checks",
+    "Mandatory Data - URL Field Checks",
+    "Optional Data - Completeness Checks",
+    "Optional Data - Uniqueness Checks",
+    "Optional Data - URL Field Checks",
+    "Product Name English - Mandatory Field - Character Limit Check",
+    "Product Name Local - Optional Field - Character Limit Check",
+    "Product Descriptions - Optional Fields - Character Limit Check",
+    "Mandatory Data - Single ProductID Per Cell",
+    "Optional Data - Single Secondary Product Identifier Per Cell",
+    "Optional Data - GTIN/EAN/UPC Check Digit Checks",
+    "Optional Data - Category Length & Tag Character Checks"
+]
+
+# grupurile care pot înregistra toate celulele care pică (kwarg failures, vezi failures.py)
+FAILURE_GROUPS = tuple(
+    name for name in VALIDATION_GROUP_ORDER if name != "File Format Checks"
+)
+
+# grupurile cu regex-uri grele, candidate pentru process pool (ocolesc GIL-ul)
+HEAVY_GROUPS = (
+    "Data Format Checks",
+    "Mandatory Data - URL Field Checks",
+    "Optional Data - URL Field Checks",
+)
+
+
+def normalize_headers(df):
+    """Copie a lui df cu header-ele normalizate (spații) și variantele cunoscute redenumite."""
+    df = df.copy()
+    df.columns = df.columns.str.strip().str.replace(r'\s+', ' ', regex=True)
+    df.rename(columns={
+        'Product  ID': 'Product ID',
+        'Product ID ': 'Product ID',
+        'Product Name(Local Language)': 'Product Name (Local)',
+        'Product Name(English)': 'Product Name (English)',
+        'Image': 'Product Image URL',
+    }, inplace=True)
+    return df
 
-def validate_file(df_processed, wb_original, extra_id_cols=None, mapped_props=None):
+
+def _timed(func, args, kwargs):
+    """Rulează un grup și întoarce (rezultat, durată în secunde); picklable pentru procese."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def validate_file(df_processed, catalog, extra_id_cols=None, mapped_props=None,
+                  workers=1, process_groups=(), shards=1, memo=None, row_diff=None,
+                  id_index=None, reachability=None, all_failures=None, stream=None, triage=None):
     """
     df_processed   : pandas.DataFrame citit și redenumit conform mapping-ului
-    wb_original    : openpyxl.Workbook încărcat din .xlsx-ul original
+    catalog        : CatalogLoader cu foaia selectată deja încărcată
     extra_id_cols  : listă de proprietăți suplimentare pentru identificatori
     mapped_props   : dict {proprietate_canonicală: nume_coloană_în_df}
-
+    workers        : 1 = grupurile rulează secvențial; >1 = în paralel, pe un
+                     thread pool cu atâția workeri
+    process_groups : numele grupurilor trimise pe un process pool (ex. HEAVY_GROUPS);
+                     folosit doar cu workers > 1
+    shards         : >1 = grupurile din sharding.SHARDED_GROUPS rulează pe atâtea
+                     intervale de rânduri, în procese separate (cataloage mari);
+                     ignorat dacă df-ul are header-e duplicate
+    memo           : validation_memo.ValidationMemo păstrat între rulări (ex. în GUI,
+                     la re-validare după schimbarea mapping-ului): verificările pe
+                     coloane neschimbate sunt refolosite; are prioritate față de shards
+    row_diff       : row_diff.RowDiffState de la versiunea anterioară a catalogului:
+                     doar blocurile de rânduri noi / modificate sunt re-evaluate;
+                     folosit când nu e dat memo, are prioritate față de shards
+    id_index       : id_index.IdentifierIndex: adaugă grupul Cross-Catalog Data -
+                     Uniqueness Checks (identificatori care apar și în alte cataloage
+                     validate) și scrie identificatorii catalogului în index
+    reachability   : url_reachability.UrlReachability: adaugă grupul URL Reachability
+                     Checks (cereri HEAD / GET către URL-urile de imagine, produs și
+                     video; verdictele sunt păstrate pe disc cu un TTL)
+    all_failures   : failures.FailureRows: golit și completat cu TOATE celulele care
+                     pică (rânduri int32 per check și coloană), nu doar primul
+                     exemplu; memo, row_diff și shards sunt ignorate (păstrează doar
+                     primul fail), iar grupurile din process_groups rulează pe thread-uri
+    stream         : report_stream.NdjsonReport: fiecare grup e scris (NDJSON) imediat ce
+                     se termină și nu mai e păstrat în raportul întors (care rămâne doar
+                     cu sumarul: ordinea grupurilor, timings etc.); cu stream.cells,
+                     și câte o înregistrare per celulă care pică
+    triage         : triage.TriageScan: prima trecere pe un fișier nou – verificările pe
+                     coloane se opresc după triage.budget fail-uri (sau când rezultatul
+                     e decis), numărătorile oprite sunt marcate ca limite inferioare
+                     ("≥10"); are prioritate față de memo, row_diff și shards și e
+                     ignorat cu all_failures
+
+    Raportul păstrează ordinea din validation_group_order indiferent de modul de
+    rulare; durata fiecărui grup și totalul sunt în raport["timings"].
+    Fiecare grup e un check_result.GroupResult de CheckResult-uri cu valori native
+    (check_result.report_to_json pentru serializare).
     """
 
     if mapped_props is None:
         mapped_props = {}
     if extra_id_cols is None:
         extra_id_cols = []
+    started = time.perf_counter()
 
-    # 1) Workbook și DataFrame preluate din argumente
-    wb = wb_original
-    df = df_processed.copy()
-
+    # 1) Catalogul și DataFrame-ul preluate din argumente
     # 2) Normalizează și redenumește header-ele
-    df.columns = df.columns.str.strip().str.replace(r'\s+', ' ', regex=True)
-    df.rename(columns={
-        'Product  ID': 'Product ID',
-        'Product ID ': 'Product ID',
-        'Product Name(Local Language)': 'Product Name (Local)',
-        'Product Name(English)': 'Product Name (English)',
-        'Image': 'Product Image URL',
-    }, inplace=True)
+    df = normalize_headers(df_processed)
 
     df_processed = df_processed.loc[:, ~df_processed.columns.duplicated()]
 
-    # 3) Rulează grupurile de validări
-    output = {
-        "validation_group_order": [
-            "File Format Checks",
-            "Data Format Checks",
-            "Mandatory Data - Completeness Checks",
-            "Mandatory Data - Uniqueness Checks",
-            "Mandatory Data - Country Uniqueness Checks",
-            "Mandatory Data - URL Field Checks",
-            "Optional Data - Completeness Checks",
-            "Optional Data - Uniqueness Checks",
-            "Optional Data - URL Field Checks",
-            "Product Name English - Mandatory Field - Character Limit Check",
-            "Product Name Local - Optional Field - Character Limit Check",
-            "Product Descriptions - Optional Fields - Character Limit Check",
-            "Mandatory Data - Single ProductID Per Cell",
-            "Optional Data - Single Secondary Product Identifier Per Cell",
-            "Optional Data - Category Length & Tag Character Checks"
-        ],
-        "file_summary": {"row_count": len(df)},
+    # Coloanele normalizate (trim, blank mask, lungimi) o singură dată per rulare
+    columns = ColumnCache(df)
+    # verdictele URL rămân între rulări; statisticile sunt per rulare
+    URL_VERDICTS.start_run()
 
+    # 3) Grupurile de validări: (nume, funcție, args, kwargs), în ordinea raportului
+    tasks = [
         # 1) Verificări pe workbook complet
-        "File Format Checks":                          group_a(wb),
+        ("File Format Checks",                          group_a, (catalog,), {}),
 
         # 2) Data‐format pe df + mapped_props
-        "Data Format Checks":                          group_b(df, wb, mapped_props=None),
+        ("Data Format Checks",                          group_b, (df, catalog), {"mapped_props": None}),
 
         # 3) Mandatory completeness & uniqueness
-        "Mandatory Data - Completeness Checks":        group_c(df, mapped_props=mapped_props),
-        "Mandatory Data - Uniqueness Checks":          group_d(df, mapped_props=mapped_props),
+        ("Mandatory Data - Completeness Checks",        group_c, (df,), {"mapped_props": mapped_props, "columns": columns}),
+        ("Mandatory Data - Uniqueness Checks",          group_d, (df,), {"mapped_props": mapped_props, "columns": columns}),
 
         # 4) Max Allowable (country unique)
-        "Mandatory Data - Country Uniqueness Checks":       group_e(df, mapped_props=mapped_props),
+        ("Mandatory Data - Country Uniqueness Checks",  group_e, (df,), {"mapped_props": mapped_props, "columns": columns}),
 
         # 5) URL Field Checks (imagine)
-        "Mandatory Data - URL Field Checks":           group_f(wb, df, mapped_props=mapped_props),
+        ("Mandatory Data - URL Field Checks",           group_f, (catalog, df), {"mapped_props": mapped_props}),
 
         # 6) Optional data (completeness, uniqueness, URL)
-        "Optional Data - Completeness Checks":         group_g(df,extra_id_cols=extra_id_cols, mapped_props=mapped_props),
-        "Optional Data - Uniqueness Checks":           group_h(df,extra_id_cols=extra_id_cols, mapped_props=mapped_props),
-        "Optional Data - URL Field Checks":            group_i(wb, mapped_props=mapped_props),
+        ("Optional Data - Completeness Checks",         group_g, (df,), {"extra_id_cols": extra_id_cols, "mapped_props": mapped_props, "columns": columns}),
+        ("Optional Data - Uniqueness Checks",           group_h, (df,), {"extra_id_cols": extra_id_cols, "mapped_props": mapped_props, "columns": columns}),
+        ("Optional Data - URL Field Checks",            group_i, (catalog,), {"mapped_props": mapped_props}),
 
         # 7) Character‐limit checks
-        "Product Name English - Mandatory Field - Character Limit Check":
-                                                      group_j(df, mapped_props=mapped_props),
-        "Product Name Local - Optional Field - Character Limit Check":
-                                                      group_k(df, mapped_props=mapped_props),
-        "Product Descriptions - Optional Fields - Character Limit Check":
-                                                      group_l(df, mapped_props=mapped_props),
+        ("Product Name English - Mandatory Field - Character Limit Check",
+                                                        group_j, (df,), {"mapped_props": mapped_props, "columns": columns}),
+        ("Product Name Local - Optional Field - Character Limit Check",
+                                                        group_k, (df,), {"mapped_props": mapped_props, "columns": columns}),
+        ("Product Descriptions - Optional Fields - Character Limit Check",
+                                                        group_l, (df,), {"mapped_props": mapped_props, "columns": columns}),
 
         # 8) Single‐ID checks
-        "Mandatory Data - Single ProductID Per Cell":  group_m(df, mapped_props=mapped_props),
-        "Optional Data - Single Secondary Product Identifier Per Cell":
-                                                      group_n(df, extra_id_cols, mapped_props=mapped_props),
+        ("Mandatory Data - Single ProductID Per Cell",  group_m, (df,), {"mapped_props": mapped_props, "columns": columns}),
+        ("Optional Data - Single Secondary Product Identifier Per Cell",
+                                                        group_n, (df, extra_id_cols), {"mapped_props": mapped_props, "columns": columns}),
 
-        # 9) Category data
-        "Optional Data - Category Length & Tag Character Checks":        group_o(df, mapped_props=mapped_props)
-    }
-
-    return sanitize(output)
+        ("Optional Data - GTIN/EAN/UPC Check Digit Checks",
+                                                        group_p, (df,), {"mapped_props": mapped_props, "columns": columns}),
 
+        # 9) Category data
+        ("Optional Data - Category Length & Tag Character Checks",
+                                                        group_o, (df,), {"mapped_props": mapped_props, "columns": columns}),
+    ]
 
+    # 3a) Opțional: toate celulele care pică, per grup (și pentru stream.cells;
+    #     store-ul propriu e golit după scrierea fiecărui grup)
+    own_failures = stream is not None and stream.cells and all_failures is None
+    if own_failures:
+        from failures import FailureRows
+
+        all_failures = FailureRows()
+    if all_failures is not None:
+        all_failures.clear()
+        tasks = [
+            (name, func, args, {**kwargs, "failures": all_failures.group(name)})
+            if name in FAILURE_GROUPS else (name, func, args, kwargs)
+            for name, func, args, kwargs in tasks
+        ]
+        memo = row_diff = triage = None
+        shards = 1
+
+    # 3b) Opțional: unicitatea față de celelalte cataloage din indexul local
+    group_order = list(VALIDATION_GROUP_ORDER)
+    if id_index is not None:
+        from id_index import CROSS_CATALOG_GROUP
+
+        tasks.append((CROSS_CATALOG_GROUP, id_index.check_catalog, (df, catalog),
+                      {"mapped_props": mapped_props, "columns": columns}))
+        group_order.append(CROSS_CATALOG_GROUP)
+    # 3c) Opțional: accesibilitatea URL-urilor (rețea)
+    if reachability is not None:
+        from url_reachability import REACHABILITY_GROUP
+
+        tasks.append((REACHABILITY_GROUP, reachability.check_catalog, (df, catalog),
+                      {"mapped_props": mapped_props, "columns": columns}))
+        group_order.append(REACHABILITY_GROUP)
+
+    # 4) Opțional: grupurile pe coloane rulează pe shard-uri de rânduri
+    results = {}
+    timings = {}
+    file_summary = {"row_count": len(df)}
+    if stream is not None:
+        stream.start(group_order, file_summary)
+
+    def finish(name, result):
+        """Rezultatul unui grup: păstrat în raport sau scris direct în stream."""
+        if stream is None:
+            results[name] = result
+            return
+        cells = None
+        if stream.cells:
+            cells = all_failures.pop_group(name) if own_failures else all_failures.group_entries(name)
+        stream.group(name, GroupResult(name, result), cells)
+
+    sharded = None
+    all_tasks = tasks
+    if triage is not None and df.columns.is_unique:
+        from sharding import SHARDED_GROUPS
+
+        triage_start = time.perf_counter()
+        for name, result in triage.validate_groups(df, catalog, mapped_props, extra_id_cols).items():
+            finish(name, result)
+        sharded = {"Triage": round(time.perf_counter() - triage_start, 4)}
+        tasks = [t for t in tasks if t[0] not in SHARDED_GROUPS]
+    elif memo is not None and df.columns.is_unique:
+        from sharding import SHARDED_GROUPS
+        from validation_memo import URL_GROUPS
+
+        memo_start = time.perf_counter()
+        for name, result in memo.validate_groups(df, catalog, mapped_props, extra_id_cols).items():
+            finish(name, result)
+        sharded = {"Memo": round(time.perf_counter() - memo_start, 4)}
+        tasks = [t for t in tasks if t[0] not in SHARDED_GROUPS + URL_GROUPS]
+    elif row_diff is not None and df.columns.is_unique:
+        from sharding import SHARDED_GROUPS
+
+        diff_start = time.perf_counter()
+        for name, result in row_diff.validate_groups(df, catalog, mapped_props, extra_id_cols).items():
+            finish(name, result)
+        sharded = {"Row Diff": round(time.perf_counter() - diff_start, 4)}
+        tasks = [t for t in tasks if t[0] not in SHARDED_GROUPS]
+    elif shards > 1 and df.columns.is_unique:
+        from sharding import SHARDED_GROUPS, run_sharded
+
+        shard_start = time.perf_counter()
+        for name, result in run_sharded(df, catalog, mapped_props, extra_id_cols, shards=shards).items():
+            finish(name, result)
+        sharded = {"Shards": shards, "Total": round(time.perf_counter() - shard_start, 4)}
+        tasks = [t for t in tasks if t[0] not in SHARDED_GROUPS]
+
+    # 5) Rulează grupurile: secvențial sau pe thread pool / process pool
+    if workers <= 1:
+        mode = "sequential"
+        for name, func, args, kwargs in tasks:
+            result, timings[name] = _timed(func, args, kwargs)
+            finish(name, result)
+    else:
+        # rândurile înregistrate într-un proces separat s-ar pierde
+        in_processes = [t for t in tasks if t[0] in process_groups and "failures" not in t[3]]
+        mode = f"threads({workers})"
+        if in_processes:
+            mode += f" + processes({min(workers, len(in_processes))})"
+        with ExitStack() as stack:
+            threads = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+            procs = None
+            if in_processes:
+                procs = stack.enter_context(
+                    ProcessPoolExecutor(max_workers=min(workers, len(in_processes)))
+                )
+            futures = {}
+            # grupurile din procese pornesc primele, ca să se suprapună cu restul
+            for name, func, args, kwargs in in_processes:
+                futures[name] = procs.submit(_timed, func, args, kwargs)
+            for name, func, args, kwargs in tasks:
+                if name not in futures:
+                    futures[name] = threads.submit(_timed, func, args, kwargs)
+            # în ordinea în care se termină (stream-ul le scrie imediat)
+            names = {future: name for name, future in futures.items()}
+            for future in as_completed(names):
+                result, timings[names[future]] = future.result()
+                finish(names[future], result)
 
-def completeness_with_locations(df, col):
+    output = {
+        "validation_group_order": group_order,
+        "file_summary": file_summary,
+    }
+    if stream is None:
+        for name, _, _, _ in all_tasks:
+            output[name] = GroupResult(name, results[name])
+
+    # câte coloane au fost normalizate și ce check a lovit cache-ul (nu e afișat în GUI)
+    output["column_cache"] = columns.report()
+    # câte URL-uri distincte au venit din cache-ul de verdicte (nu e afișat în GUI)
+    output["url_verdicts"] = URL_VERDICTS.report()
+    # durata fiecărui grup (wall time) lângă total (nu e afișat în GUI)
+    output["timings"] = {
+        "Mode": mode,
+        "Total": round(time.perf_counter() - started, 4),
+        "Groups": {name: round(timings[name], 4) for name, _, _, _ in tasks},
+    }
+    if sharded and "Triage" in sharded:
+        output["timings"]["Mode"] = f"triage + {mode}"
+        output["timings"]["Triage"] = sharded["Triage"]
+        # câte celule au fost citite și ce verificări s-au oprit devreme
+        output["triage"] = triage.report()
+    elif sharded and "Memo" in sharded:
+        output["timings"]["Mode"] = f"memo + {mode}"
+        output["timings"]["Memo"] = sharded["Memo"]
+        # ce verificări au fost refolosite din rulările anterioare (nu e afișat în GUI)
+        output["memo"] = memo.report()
+    elif sharded and "Row Diff" in sharded:
+        output["timings"]["Mode"] = f"row-diff + {mode}"
+        output["timings"]["Row Diff"] = sharded["Row Diff"]
+        # câte blocuri de rânduri au fost refolosite de la versiunea anterioară
+        output["row_diff"] = row_diff.report()
+    elif sharded:
+        output["timings"]["Mode"] = f"shards({shards}) + {mode}"
+        output["timings"]["Sharded"] = sharded
+    if reachability is not None:
+        # câte URL-uri au venit din cache-ul de pe disc și câte cereri s-au trimis
+        output["reachability"] = reachability.report()
+    if all_failures is not None and not own_failures:
+        # câte celule pică per check și memoria ocupată de rânduri (nu e afișat în GUI)
+        output["all_failures"] = all_failures.report()
+    if stream is not None:
+        # sumarul (tot ce nu e grup) încheie stream-ul
+        stream.end({k: v for k, v in output.items() if k not in ("validation_group_order", "file_summary")})
+        output["stream"] = {"Records": stream.records}
+
+    return output
+
+
+
+def completeness_with_locations(df, col, failures=None):
     """
     Variantează completeness_check pentru a include și toate referințele
-    celulelor goale (ex: G2, G5, ...).
+    celulelor goale, comprimate în intervale (ex: G2:G4, G9).
+    Rândurile goale sunt păstrate ca np.int32 (și în failures, dacă e dat);
+    șirul de referințe e construit o singură dată, din intervale.
     """
     total = len(df)
     # 1) Gasim care sunt goale (după strip)
     trim = df[col].fillna("").map(trim_val)
-    blank_mask = trim == ""
-    blank_idxs = blank_mask[blank_mask].index.tolist()  # index zero-based
+    blank_pos = np.flatnonzero((trim == "").to_numpy()).astype(np.int32)
+    count = len(blank_pos)
 
     # 2) Calcul procent
-    non_empty = total - len(blank_idxs)
+    non_empty = total - count
     pct = int(non_empty / total * 100) if total else 100
 
-    # 3) Construim lista de referinte Excel
-    col_letter = chr(65 + df.columns.get_loc(col))
-    refs = [f"{col_letter}{i+2}" for i in blank_idxs]
+    # 3) Rândurile Excel și litera coloanei
+    col_letter = get_column_letter(df.columns.get_loc(col) + 1)
+    rows = blank_pos + 2
+    if failures is not None:
+        failures.add(f"{col} Completeness", col, col_letter, rows)
 
-    # 4) Pregatim dict-ul
-    result = {
-        "Check Performed": f"{col} Completeness",
-        "% Data Completeness": f"{pct}%",
-    }
-    if blank_idxs:
+    # 4) Pregatim rezultatul
+    fields = {"% Data Completeness": f"{pct}%"}
+    if count:
          # grab first blank cell
-        first_idx = blank_idxs[0]
-        first_ref = refs[0]
+        first_idx = df.index[blank_pos[0]]
+        first_ref = f"{col_letter}{int(rows[0])}"
         raw_example = df.at[first_idx, col]
         # Dacă e NaN, None sau șir gol/spații → "<blank>"
         if pd.isna(raw_example) or raw_example is None or str(raw_example).strip() == "":
@@ -921,59 +1148,47 @@ def completeness_with_locations(df, col):
             example_val = raw_example
             # Explanation singular/plural
 
-        count = len(blank_idxs)
         if count == 1:
-            result["Explanation"] = "1 empty cell"
+            fields["Explanation"] = "1 empty cell"
         else:
-            result["Explanation"] = f"{count} empty cells"
+            fields["Explanation"] = f"{count} empty cells"
 
-        result.update({
-            "Check Outcome": "❌ Fail",
-            "Empty Cell Count": len(blank_idxs),
-            "Empty Cell References": ", ".join(refs),
+        outcome = "❌ Fail"
+        fields.update({
+            "Empty Cell Count": count,
+            "Empty Cell References": cell_ranges(col_letter, rows),
             "Check Fail Example": example_val,
             "Check Fail Example Cell Reference": first_ref
         })
     else:
-        result["Explanation"] = "All cells populated"
-        result.update({
-            "Check Outcome": "✅ Pass",
+        fields["Explanation"] = "All cells populated"
+        outcome = "✅ Pass"
+        fields.update({
             "Empty Cell Count": 0,
             "Empty Cell References": "",
             "Check Fail Example": "",
             "Check Fail Example Cell Reference": ""
         })
 
-    return result
+    return report_check(f"{col} Completeness", outcome, **fields)
 
-def group_g(df, mapped_props=None, extra_id_cols=None):
+def group_g(df, mapped_props=None, extra_id_cols=None, columns=None, failures=None, facts=None):
     """
     Optional Data - Completeness Checks
     Verifică completitudinea coloanelor opționale (inclusiv “Other” sau orice cod suplimentar)
     și raportează pentru fiecare atât % completeness,
     cât și numărul și locațiile celulelor goale.
     """
-    import pandas as _pd
-
     mapped_props  = mapped_props or {}
     extra_id_cols = extra_id_cols or []
+    if facts is None:
+        facts = ColumnFacts(df, columns)
 
-    # 1) Lista standard de proprietăți opționale
-    optional_cols = [
-        "SKU", "EAN", "UPC", "GTIN", "CTIN", "ASIN",
-        "Product Name (Local Language)",
-        "Product Description (English)",
-        "Product Description (Local Language)",
-        "Category", "Sub-Category",
-        "Product URL", "Product Video URL",
-        "MAP", "MSRP"
-    ]
-
-    # 2) Construim lista finală de prop_name:
-    #    a) coloanele standard care au fost mapate
+    # 1) Lista finală de prop_name:
+    #    a) coloanele standard (OPTIONAL_COMPLETENESS) care au fost mapate
     #    b) plus orice cod suplimentar (din extra_id_cols), inclusiv “Other”
-    all_props = [p for p in optional_cols   if p in mapped_props] + \
-                [p for p in extra_id_cols    if p not in optional_cols]
+    all_props = [p for p in OPTIONAL_COMPLETENESS if p in mapped_props] + \
+                [p for p in extra_id_cols         if p not in OPTIONAL_COMPLETENESS]
 
     results = []
     for prop in all_props:
@@ -985,66 +1200,47 @@ def group_g(df, mapped_props=None, extra_id_cols=None):
             "Check Fail Example":           "",
             "Check Fail Example Cell Reference": ""
         }
-        # --- DEBUG (opțional) ---
-        # print(f"DEBUG group_g: prop={prop!r}, mapped_props={mapped_props}, extra_id_cols={extra_id_cols}")
 
         # a) Not mapped → Skip
         if prop not in mapped_props:
-            results.append({
-                "Check Performed": check_name,
-                "Check Outcome":    "⏭️ Skip",
-                "% Data Completeness": common["% Data Completeness"],
-                "Explanation":       "Not mapped",
-                **common
-            })
+            results.append(report_check(
+                check_name, "⏭️ Skip",
+                **{"% Data Completeness": common["% Data Completeness"], "Explanation": "Not mapped", **common}
+            ))
             continue
 
         # b) Column missing → Skip
         col = prop
         if col not in df.columns:
-            results.append({
-                "Check Performed": check_name,
-                "Check Outcome":    "⏭️ Skip",
-                "% Data Completeness": common["% Data Completeness"],
-                "Explanation":       "Column missing",
-                **common
-            })
+            results.append(report_check(
+                check_name, "⏭️ Skip",
+                **{"% Data Completeness": common["% Data Completeness"], "Explanation": "Column missing", **common}
+            ))
             continue
 
         # c) No data present → Skip
-        vals = df[col].fillna("").astype(str).map(trim_val)
-        if vals.eq("").all():
-            results.append({
-                "Check Performed": check_name,
-                "Check Outcome":    "⏭️ Skip",
-                "% Data Completeness": common["% Data Completeness"],
-                "Explanation":       "No data present",
-                **common
-            })
+        total = facts.n
+        empty_count, first_row, empty_rows = facts.blank(col, check_name)
+        if empty_count == total:
+            results.append(report_check(
+                check_name, "⏭️ Skip",
+                **{"% Data Completeness": common["% Data Completeness"], "Explanation": "No data present", **common}
+            ))
             continue
 
         # d) Calculăm % completeness și count empty
-        total       = len(vals)
-        empty_count = int((vals == "").sum())
         pct_value   = int((total - empty_count) / total * 100) if total else 0
 
         common["% Data Completeness"] = f"{pct_value}%"
         common["Check Fail Count"]    = empty_count
 
         if empty_count > 0:
-            # primul index gol
-            first_idx   = vals[vals == ""].index[0]
-            letter      = get_column_letter(df.columns.get_loc(col) + 1)
-            cell_ref    = f"{letter}{first_idx + 2}"
-            example_val = df.at[first_idx, col]
-            # afișăm <blank> dacă valoarea e doar spații sau NaN
-            example_display = (
-                "<blank>"
-                if (_pd.isna(example_val) or str(example_val).strip() == "")
-                else str(example_val)
-            )
-            common["Check Fail Example"]                 = example_display
-            common["Check Fail Example Cell Reference"] = cell_ref
+            # primul rând gol; celula e goală după trim, deci exemplul e <blank>
+            letter      = get_column_letter(_position(df, col) + 1)
+            if failures is not None:
+                failures.add(check_name, col, letter, empty_rows)
+            common["Check Fail Example"]                 = "<blank>"
+            common["Check Fail Example Cell Reference"] = f"{letter}{first_row}"
 
             outcome, explanation = (
                 "❌ Fail",
@@ -1053,20 +1249,17 @@ def group_g(df, mapped_props=None, extra_id_cols=None):
         else:
             outcome, explanation = "✅ Pass", "All cells populated"
 
-        results.append({
-            "Check Performed":     check_name,
-            "Check Outcome":        outcome,
-            "% Data Completeness":  common["% Data Completeness"],
-            "Explanation":          explanation,
-            **common
-        })
+        results.append(report_check(
+            check_name, outcome,
+            **{"% Data Completeness": common["% Data Completeness"], "Explanation": explanation, **common}
+        ))
 
     return results
 
 
 
 
-def group_h(df, mapped_props=None, extra_id_cols=None):
+def group_h(df, mapped_props=None, extra_id_cols=None, columns=None, failures=None, facts=None):
     """
     Optional Data - Uniqueness Checks
     → Verifică duplicatele DOAR pentru coloanele opționale mapate,
@@ -1074,21 +1267,15 @@ def group_h(df, mapped_props=None, extra_id_cols=None):
     """
     mapped_props  = mapped_props or {}
     extra_id_cols = extra_id_cols or []
-    df = df.loc[:, ~df.columns.duplicated()]
-
-    # 1) Proprietăți opționale standard
-    base_props = [
-        "SKU", "EAN", "UPC", "GTIN", "CTIN", "ASIN",
-        "Product Name (Local Language)",
-        "Product Description (English)",
-        "Product Description (Local Language)",
-        "Category", "Sub-Category",
-        "Product URL", "Product Video URL",
-        "MSRP", "MAP", "Product Image URL"
-    ]
+    # statisticile văd df-ul cu duplicate; prima apariție, ca după dedup
+    if facts is None:
+        facts = ColumnFacts(df, columns)
+    if not df.columns.is_unique:
+        df = df.loc[:, ~df.columns.duplicated()]
 
-    # 2) Adăugăm în coadă orice cod suplimentar mapat (ex. coloana pentru “Other”)
-    all_props = base_props + [p for p in extra_id_cols if p not in base_props]
+    # 1) Proprietățile opționale standard (OPTIONAL_UNIQUENESS), apoi în coadă
+    #    orice cod suplimentar mapat (ex. coloana pentru “Other”)
+    all_props = OPTIONAL_UNIQUENESS + [p for p in extra_id_cols if p not in OPTIONAL_UNIQUENESS]
 
     results = []
     for prop in all_props:
@@ -1120,8 +1307,7 @@ def group_h(df, mapped_props=None, extra_id_cols=None):
             continue
 
         # 5) Mapped & present but all values blank → Skip
-        vals = df[col].fillna("").astype(str).map(trim_val)
-        if vals.eq("").all().all():
+        if facts.blank(col, check_name)[0] == facts.n:
             results.append(report_check(
                 check_name, "⏭️ Skip",
                 Explanation="No data present",
@@ -1130,7 +1316,7 @@ def group_h(df, mapped_props=None, extra_id_cols=None):
             continue
 
         # 6) Excepție Category/Sub-Category → întotdeauna Pass
-        if prop in ("Category", "Sub-Category"):
+        if prop in CATEGORY_PROPS:
             results.append(report_check(
                 check_name,
                 "✅ Pass",
@@ -1144,20 +1330,18 @@ def group_h(df, mapped_props=None, extra_id_cols=None):
             ))
             continue
 
-        # 7) Verificare de duplicate non-empty
-        dupes = vals[vals.duplicated(keep=False) & vals.ne("")]
-        pct = int((1 - dupes.nunique() / len(vals)) * 100) if len(vals) else 0
-        
-        # common["% Data Uniqueness"] = f"{100 * (1 - dupes.nunique() / len(vals)):.0f}%"
-        common["Check Fail Count"] = len(dupes)
+        # 7) Verificare de duplicate non-empty (grupurile valoare → rânduri, o trecere)
+        _, fail_count, first, dup_rows = facts.duplicates(col, check_name)
+        common["Check Fail Count"] = fail_count
 
-        if not dupes.empty:
-            # luăm primul exemplar ca exemplu
-            first_idx     = dupes.index[0] + 2  # +2 pt header + zero-based
-            example_value = vals.iloc[dupes.index[0]]
+        if fail_count:
+            # luăm primul exemplar ca exemplu (valoarea trim-uită)
+            first_idx, example_value, _ = first
             letter        = get_column_letter(df.columns.get_loc(col) + 1)
             common["Check Fail Example"]                 = example_value
             common["Check Fail Example Cell Reference"] = f"{letter}{first_idx}"
+            if failures is not None:
+                failures.add(check_name, col, letter, dup_rows)
             outcome, expl = "❌ Fail", "Duplicate values found"
         else:
             outcome, expl = "✅ Pass", ""
@@ -1171,16 +1355,12 @@ def group_h(df, mapped_props=None, extra_id_cols=None):
     return results
 
 
-from urllib.parse import urlparse
 from openpyxl.utils import get_column_letter
-import re
-
-VALID_URL_REGEX = re.compile(r'^(https?://)[A-Za-z0-9\.-]+\.[A-Za-z]{2,}.*$')
 
-def hyperlink_target_check(ws, df, col) -> dict:
+def hyperlink_target_check(catalog, df, col) -> dict:
     """
     Validare suplimentară: pentru fiecare celulă nenulă din df[col],
-    citește cell.hyperlink.target din ws și verifică-l cu același regex.
+    citește target-ul hyperlink-ului din catalog și verifică-l cu același regex.
     Returnează exact aceste câmpuri:
       - "% Hyperlink Pass Rate"
       - "Hyperlink Fail Count"
@@ -1207,10 +1387,9 @@ def hyperlink_target_check(ws, df, col) -> dict:
         total += 1
         excel_row = idx + 2
         cell_ref = f"{col_letter}{excel_row}"
-        cell = ws[cell_ref]
-        link = cell.hyperlink.target if cell.hyperlink else None
+        link = catalog.hyperlink(cell_ref)
 
-        if not link or not VALID_URL_REGEX.match(link):
+        if not link or not URL_VERDICTS.is_valid(link):
             fails += 1
             if first_fail is None:
                 reason = "No hyperlink attached" if not link else f"Invalid hyperlink target ({link})"
@@ -1241,24 +1420,21 @@ def hyperlink_target_check(ws, df, col) -> dict:
     )
 
 
-def hyperlink_check(df: pd.DataFrame, col: str, ws=None, mapped_props=None) -> dict:
+def hyperlink_check(df: pd.DataFrame, col: str, catalog=None, mapped_props=None, failures=None) -> dict:
     """
     1) Text-based URL check
-    2) Dacă text invalid și ws există: verifică cell.hyperlink.target
-    Află litera reală a coloanei din ws folosind mapped_props.
+    2) Dacă text invalid și catalog există: verifică target-ul hyperlink-ului
+    Află litera reală a coloanei din catalog folosind mapped_props.
     Returnează exact aceste câmpuri:
       - "% Pass Rate"
       - "Check Fail Count"
       - "Check Fail Example"
       - "Check Fail Example Cell Reference"
+    failures (failures.GroupFailures) primește toate celulele care pică.
     """
-    if ws is not None and mapped_props:
+    if catalog is not None and mapped_props:
         header_name = mapped_props.get(col, col)
-        col_letter = None
-        for cell in ws[1]:
-            if cell.value == header_name:
-                col_letter = cell.column_letter
-                break
+        col_letter = catalog.header_letters.get(header_name)
         if col_letter is None:
             col_idx = df.columns.get_loc(col) + 1
             col_letter = get_column_letter(col_idx)
@@ -1266,61 +1442,20 @@ def hyperlink_check(df: pd.DataFrame, col: str, ws=None, mapped_props=None) -> d
         col_idx = df.columns.get_loc(col) + 1
         col_letter = get_column_letter(col_idx)
 
-    total = 0
-    fails = 0
-    first_fail = None
-
-    for idx, val in df[col].items():
-        text = str(val).strip()
-        if not text:
-            continue
-        total += 1
-
-        excel_row = idx + 2
-        cell_ref = f"{col_letter}{excel_row}"
-
-        ok = bool(VALID_URL_REGEX.match(text))
-
-        reason = None
-        if not ok and ws is not None:
-            cell = ws[cell_ref]
-            link = getattr(cell.hyperlink, "target", None)
-            ok = bool(link and VALID_URL_REGEX.match(link))
-            if not ok:
-                reason = "Invalid hyperlink target" if link else "No hyperlink attached"
-        elif not ok:
-            reason = "Invalid URL format"
+    link_at = None
+    if catalog is not None:
+        def link_at(row):
+            return catalog.hyperlink(f"{col_letter}{row}")
 
-        if not ok:
-            fails += 1
-            if first_fail is None:
-                first_fail = (text, cell_ref, reason)
-
-    pass_rate = f"{int((total - fails)/total*100)}%" if total else "0%"
-    explanation = ""
-    example = ""
-    fail_cell_ref = ""
-    if first_fail:
-        txt, ref, reason = first_fail
-        explanation    = reason
-        example        = txt
-        fail_cell_ref  = ref
+    tally = UrlTally(f"{col} Hyperlink Check", link_at=link_at, keep_rows=True).add([str(val).strip() for val in df[col].to_numpy(dtype=object)], df.index.to_numpy() + 2)
 
-    return report_check(
-        f"{col} Hyperlink Check",
-        "✅ Pass" if fails == 0 else "❌ Fail",
-        Explanation=explanation,
-        **{
-            "% Pass Rate":                         pass_rate,
-            "Check Fail Count":                    fails,
-            "Check Fail Example":                  example,
-            "Check Fail Example Cell Reference":   fail_cell_ref
-        }
-    )
+    if failures is not None and tally.rows:
+        failures.add(f"{col} Hyperlink Check", col, col_letter, tally.rows)
+    return hyperlink_result(f"{col} Hyperlink Check", col_letter, tally)
 
 
 
-def group_i(df, mapped_props=None):
+def group_i(df, mapped_props=None, failures=None):
     """
     Optional Data - URL Field Checks
     Pentru fiecare din ["Product URL", "Product Video URL"]:
@@ -1330,15 +1465,14 @@ def group_i(df, mapped_props=None):
       D) dacă după filtrare nu rămâne niciun URL → Skip "No data present"
       E) altfel → apel hyperlink_check (text‐based + fallback on cell.hyperlink)
     """
-    from openpyxl import Workbook
     import pandas as pd
+    from catalog_loader import CatalogLoader
 
-    ws = None
-    # Dacă ni se dă Workbook, îl transformăm în DataFrame
-    if isinstance(df, Workbook):
-        ws = df.active
-        data = list(ws.values)
-        df   = pd.DataFrame(data[1:], columns=data[0])
+    catalog = None
+    # Dacă ni se dă catalogul, lucrăm pe DataFrame-ul original (header-e din fișier)
+    if isinstance(df, CatalogLoader):
+        catalog = df
+        df      = catalog.df
 
     # Redenumim header-ele conform mapped_props
     rename_map = {
@@ -1405,7 +1539,8 @@ def group_i(df, mapped_props=None):
 
         # E) Text‑based + fallback hyperlink
         filt = serie.to_frame(name=col)
-        results.append(hyperlink_check(filt, col, ws=ws, mapped_props=mapped_props))
+        results.append(hyperlink_check(filt, col, catalog=catalog, mapped_props=mapped_props,
+                                       failures=failures))
 
     return results
 
@@ -1417,14 +1552,14 @@ from openpyxl.utils import get_column_letter
 from openpyxl import Workbook
 import pandas as pd
 
-def group_j(df, mapped_props=None):
+def group_j(df, mapped_props=None, columns=None, failures=None, facts=None):
     """
     Product Name English - Mandatory Field - Character Limit Check (<=750 chars)
     → Skip dacă nu e mapat sau dacă lipsește coloana; altfel Pass/Fail.
     """
     col = "Product Name (English)"
     check_name = f"{col} Character Limit Check"
-    max_len = 750
+    max_len = NAME_MAX_LEN
     mapped = set(mapped_props or [])
 
     # 1) Dacă există mapped_props dar col nu e în ele → Skip
@@ -1451,30 +1586,26 @@ def group_j(df, mapped_props=None):
         data = list(ws.values)
         df = pd.DataFrame(data[1:], columns=data[0])
 
-    total = len(df)
-    too_long = []
-
-    # 4) Detectăm rândurile care depășesc limita
-    for idx, val in df[col].fillna("").items():
-        text = str(val).strip()
-        length = len(text)
-        if length > max_len:
-            excel_row = idx + 2
-            snippet = text[:25] + "..."
-            too_long.append((excel_row, length, snippet))
-
-    count = len(too_long)
+    if facts is None:
+        facts = ColumnFacts(df, columns)
+
+    total = facts.n
+
+    # 4) Detectăm (vectorizat) toate rândurile care depășesc limita
+    count, first_row, length, text, rows = facts.limit(col, LimitSpec(col, max_len), check_name)
+
     pct = f"{int((total - count) / total * 100)}%" if total else "100%"
     outcome = "✅ Pass" if count == 0 else "❌ Fail"
     details = {"% Pass Rate": pct, "Check Fail Count": count}
 
     # 5) Populăm Example și Explanation
     if count > 0:
-        row_idx, length, snippet = too_long[0]
-        col_letter = get_column_letter(df.columns.get_loc(col) + 1)
-        details["Check Fail Example"] = snippet
-        details["Check Fail Example Cell Reference"] = f"{col_letter}{row_idx}"
+        col_letter = get_column_letter(_position(df, col) + 1)
+        details["Check Fail Example"] = text[:25] + "..."
+        details["Check Fail Example Cell Reference"] = f"{col_letter}{first_row}"
         details["Actual Length"] = length
+        if failures is not None:
+            failures.add(check_name, col, col_letter, rows)
         explanation = f"Over {max_len} chars"
     else:
         details["Check Fail Example"] = ""
@@ -1496,7 +1627,7 @@ from openpyxl import Workbook
 from openpyxl.utils import get_column_letter
 import pandas as pd
 
-def group_k(df, mapped_props=None):
+def group_k(df, mapped_props=None, columns=None, failures=None, facts=None):
     """
     Product Name (Local Language) - Optional Field - Character Limit Check (<=750 chars)
     → Skip dacă nu e mapat, Skip dacă e mapat dar lipsește coloana,
@@ -1504,7 +1635,7 @@ def group_k(df, mapped_props=None):
     """
     prop       = "Product Name (Local Language)"
     check_name = f"{prop} Character Limit Check"
-    max_len    = 750
+    max_len    = NAME_MAX_LEN
 
     # 0) Extragem header‑ul din mapping
     header = (mapped_props or {}).get(prop)
@@ -1533,16 +1664,16 @@ def group_k(df, mapped_props=None):
             **{"Max Length": max_len, "Check Fail Count": 0, "Check Fail Example Cell Reference": ""}
         )]
 
-    # 4) Verificăm lungimea fiecărei celule din coloana mapată
-    fail_count = 0
+    # 4) Verificăm (vectorizat) lungimea fiecărei celule din coloana mapată
+    if facts is None:
+        facts = ColumnFacts(df, columns)
+    fail_count, first_row, _, _, rows = facts.limit(header, LimitSpec(header, max_len), check_name)
     first_ref  = ""
-    for idx, val in df[header].fillna("").astype(str).items():
-        text = val.strip()
-        if len(text) > max_len:
-            fail_count += 1
-            if not first_ref:
-                row_letter = get_column_letter(df.columns.get_loc(header) + 1)
-                first_ref = f"{row_letter}{idx + 2}"
+    if fail_count:
+        row_letter = get_column_letter(_position(df, header) + 1)
+        first_ref = f"{row_letter}{first_row}"
+        if failures is not None:
+            failures.add(check_name, header, row_letter, rows)
 
     # 5) Construim raportul
     outcome    = "✅ Pass" if fail_count == 0 else "❌ Fail"
@@ -1562,18 +1693,39 @@ from openpyxl.utils import get_column_letter
 import pandas as pd
 from openpyxl import Workbook
 
-def group_l(df, mapped_props=None):
+def _description_sources(df, props, mapped_props=None):
+    """
+    Pentru fiecare coloană canonică din props: coloana din df care îi dă valorile
+    (header-ul mapat sau coloana însăși) și poziția din care vine litera Excel.
+    Fără a copia coloana în df: o coloană canonică nouă ar fi fost adăugată la final.
+    """
+    source = {}
+    letter_pos = {}
+    n_cols = len(df.columns)
+    for prop in props:
+        header = (mapped_props or {}).get(prop)
+        if header and (header in df.columns or header in source):
+            # header-ul poate fi chiar coloana canonică precedentă, deja înlocuită
+            source[prop] = source.get(header, header)
+            if prop not in df.columns and prop not in letter_pos:
+                letter_pos[prop] = n_cols
+                n_cols += 1
+        elif prop in df.columns:
+            source[prop] = prop
+        if prop in df.columns and prop in source:
+            letter_pos[prop] = df.columns.get_loc(prop)
+    return source, letter_pos
+
+
+def group_l(df, mapped_props=None, columns=None, failures=None, facts=None):
     """
     Product Descriptions - Optional Fields - Character Limit Check (<=4000 chars)
     → Skip dacă nu e mapat, Skip dacă e mapat dar lipsește coloana,
       altfel Pass/Fail după lungimea textului și raportează Example,
       Cell Reference și Actual Length (numai la Fail).
     """
-    props   = [
-        "Product Description (English)",
-        "Product Description (Local Language)"
-    ]
-    max_len = 4000
+    props   = DESCRIPTION_PROPS
+    max_len = DESCRIPTION_MAX_LEN
     results = []
 
     # 1) Dacă primim Workbook, transformăm în DataFrame
@@ -1582,13 +1734,13 @@ def group_l(df, mapped_props=None):
         data = list(ws.values)
         df   = pd.DataFrame(data[1:], columns=data[0])
 
-    # 2) Copiem valorile din header-urile mapate în cele două coloane canonice
-    for prop in props:
-        header = (mapped_props or {}).get(prop)
-        if header and header in df.columns:
-            df[prop] = df[header]
+    if facts is None:
+        facts = ColumnFacts(df, columns)
 
-    total = len(df)
+    # 2) Valorile din header-urile mapate țin loc de cele două coloane canonice
+    source, letter_pos = _description_sources(df, props, mapped_props)
+
+    total = facts.n
     for prop in props:
         check_name = f"{prop} Character Limit Check"
         # definim common fără Actual Length
@@ -1612,7 +1764,7 @@ def group_l(df, mapped_props=None):
             continue
 
         # b) Mapped but column missing → Skip
-        if prop not in df.columns:
+        if prop not in source:
             common["% Pass Rate"] = "0%"
             results.append(report_check(
                 check_name,
@@ -1622,18 +1774,11 @@ def group_l(df, mapped_props=None):
             ))
             continue
 
-        # c) Strângem toate valorile care depășesc max_len
-        too_long = []
-        for idx, val in df[prop].fillna("").items():
-            text   = str(val).strip()
-            length = len(text)
-            if length > max_len:
-                excel_row  = idx + 2  # rând Excel consideră header
-                snippet    = text[:25] + ("…" if length > 25 else "")
-                col_letter = get_column_letter(df.columns.get_loc(prop) + 1)
-                too_long.append((excel_row, snippet, col_letter, length))
-
-        count   = len(too_long)
+        # c) Toate valorile care depășesc max_len (vectorizat)
+        count, first_row, length, text, rows = facts.limit(
+            source[prop], LimitSpec(source[prop], max_len), check_name
+        )
+
         pct     = f"{int((total - count) / total * 100)}%" if total else "0%"
         outcome = "✅ Pass" if count == 0 else "❌ Fail"
 
@@ -1642,11 +1787,13 @@ def group_l(df, mapped_props=None):
         common["Check Fail Count"] = count
 
         # e) La Fail adaug Actual Length
-        if too_long:
-            row, snippet, letter, length = too_long[0]
-            common["Check Fail Example"]               = snippet
-            common["Check Fail Example Cell Reference"] = f"{letter}{row}"
+        if count:
+            letter = get_column_letter(letter_pos[prop] + 1)
+            common["Check Fail Example"]               = text[:25] + ("…" if length > 25 else "")
+            common["Check Fail Example Cell Reference"] = f"{letter}{first_row}"
             common["Actual Length"]                    = length
+            if failures is not None:
+                failures.add(check_name, source[prop], letter, rows)
 
         # f) Adaug raportul final
         results.append(report_check(
@@ -1660,7 +1807,7 @@ def group_l(df, mapped_props=None):
 
 
 
-def group_m(df, mapped_props=None):
+def group_m(df, mapped_props=None, columns=None, failures=None, facts=None):
     """
     Mandatory Data - Single ProductID Per Cell
     Verifică să nu existe virgule în fiecare celulă din coloana Product ID,
@@ -1688,24 +1835,19 @@ def group_m(df, mapped_props=None):
             **{"Check Fail Count": 0, "Check Fail Example": "", "Check Fail Example Cell Reference": ""}
         )]
 
-    # 3) Altfel, rulăm logica originală
-    total = len(df)
-    fails = []
-    # găsim virgulele
-    for idx, val in df[col].fillna("").astype(str).items():
-        if "," in val:
-            row_num = idx + 2
-            fails.append((row_num, val.strip()))
-
-    count = len(fails)
+    # 3) Altfel, găsim virgulele (vectorizat)
+    if facts is None:
+        facts = ColumnFacts(df, columns)
+    count, r, example, rows = facts.comma(col, check_name)
     outcome = "✅ Pass" if count == 0 else "❌ Fail"
     details = {"Check Fail Count": count}
 
     if count:
-        r, example = fails[0]
-        col_letter = chr(65 + df.columns.get_loc(col))
+        col_letter = chr(65 + _position(df, col))
         details["Check Fail Example"] = example
         details["Check Fail Example Cell Reference"] = f"{col_letter}{r}"
+        if failures is not None:
+            failures.add(check_name, col, col_letter, rows)
         explanation = "Multiple identifiers present"
     else:
         details["Check Fail Example"] = ""
@@ -1790,17 +1932,12 @@ from openpyxl.utils import get_column_letter
 import pandas as pd
 import numpy as np
 
-def group_n(df, extra_id_cols=None, mapped_props=None):
+def _secondary_id_plan(df, extra_id_cols=None, mapped_props=None):
     """
-    Optional Data – Single Secondary Product Identifier Per Cell
-
-    mapped_props poate fi:
-      • { prop: header }    (prop→header)
-      • { header: prop }    (header→prop)
-    Funcția normalizează mapping-ul în {prop:header}, redenumește
-    coloanele, apoi raportează Pass/Fail după prezența virgulelor.
+    Pregătirea din group_n: mapping-ul normalizat {prop: header}, df-ul cu
+    header-ele redenumite în prop-uri și lista finală de proprietăți.
+    Redenumirea nu mută coloanele (pozițiile rămân cele din df-ul primit).
     """
-
     # 0a) Transformăm extra_id_cols într-o listă plată de șiruri
     if extra_id_cols is None:
         extra_list = []
@@ -1850,6 +1987,27 @@ def group_n(df, extra_id_cols=None, mapped_props=None):
     extra_props = [c for c in extra_list if c and c not in base_props]
     all_props   = base_props + extra_props
 
+    return df, raw, all_props
+
+
+def group_n(df, extra_id_cols=None, mapped_props=None, columns=None, failures=None, facts=None):
+    """
+    Optional Data – Single Secondary Product Identifier Per Cell
+
+    mapped_props poate fi:
+      • { prop: header }    (prop→header)
+      • { header: prop }    (header→prop)
+    Funcția normalizează mapping-ul în {prop:header}, redenumește
+    coloanele, apoi raportează Pass/Fail după prezența virgulelor.
+    """
+
+    # redenumirea nu mută coloanele, deci pozițiile din statistici rămân valabile
+    if facts is None:
+        facts = ColumnFacts(df, columns)
+
+    # 0-3) Mapping normalizat, coloane redenumite, lista de proprietăți
+    df, raw, all_props = _secondary_id_plan(df, extra_id_cols, mapped_props)
+
     results = []
     for prop in all_props:
         check_name = f"{prop} Single Secondary Product Identifier Per Cell"
@@ -1871,31 +2029,23 @@ def group_n(df, extra_id_cols=None, mapped_props=None):
                                         Explanation="Column missing", **common))
             continue
 
-        # c) Preiau seria (dacă sunt duplicate, doar prima coloană)
-        series = df[prop]
-        if isinstance(series, pd.DataFrame):
-            series = series.iloc[:, 0]
+        # c) Poziția coloanei (dacă sunt duplicate, doar prima coloană)
+        pos = _position(df, prop)
 
-        # d) Convert la șir și strip()
-        vals = series.fillna("").astype(str).str.strip()
-        if vals.eq("").all():
+        # d) Valorile trim-uite: Skip dacă sunt toate goale
+        if facts.blank(pos, check_name)[0] == facts.n:
             results.append(report_check(check_name, "⏭️ Skip",
                                         Explanation="No data present", **common))
             continue
 
         # e) Detectăm vectorial virgulele
-        mask = vals.str.contains(",", na=False)
-        fail_count = int(mask.sum())
+        fail_count, excel_row, example, rows = facts.comma(pos, check_name)
         common["Check Fail Count"] = fail_count
 
         if fail_count:
-            first_idx  = mask[mask].index[0]
-            excel_row  = first_idx + 2
-            example    = vals.iat[first_idx]
-            loc = df.columns.get_loc(prop)
-            if isinstance(loc, (list, tuple, np.ndarray, pd.Index)):
-                loc = loc[0]
-            col_letter = get_column_letter(loc + 1)
+            col_letter = get_column_letter(pos + 1)
+            if failures is not None:
+                failures.add(check_name, prop, col_letter, rows)
 
             common.update({
                 "Check Fail Example": example,
@@ -1912,7 +2062,84 @@ def group_n(df, extra_id_cols=None, mapped_props=None):
 
 
 
-def group_o(df, mapped_props=None):
+def check_digit_report(prop, letter, rows, reasons, example):
+    """
+    Rezultatul verificării GS1 pentru o coloană, din toate celulele care pică
+    (rânduri Excel crescătoare + motivul per celulă, vezi check_digits.py).
+    Raportul are numărul, motivele, primul exemplu și primele MAX_CELL_RANGES
+    intervale de celule; lista completă vine din failures (FailureRows /
+    all_failures), ca la celelalte verificări.
+    """
+    fail_count = len(rows)
+    common = {
+        "Check Fail Count": fail_count,
+        "Check Fail Example": "",
+        "Check Fail Example Cell Reference": "",
+        "Check Fail Cell References": ""
+    }
+    if not fail_count:
+        return report_check(f"{prop} Check Digit", "✅ Pass", Explanation="", **common)
+
+    # explicația: câte celule pică din fiecare motiv, în ordinea REASONS
+    by_reason = np.bincount(np.asarray(reasons, dtype=np.int64), minlength=len(REASONS))
+    common.update({
+        "Check Fail Example": example,
+        "Check Fail Example Cell Reference": f"{letter}{int(rows[0])}",
+        "Check Fail Cell References": cell_ranges(letter, rows, MAX_CELL_RANGES)
+    })
+    return report_check(
+        f"{prop} Check Digit", "❌ Fail",
+        Explanation="; ".join(f"{REASONS[i]}: {n}" for i, n in enumerate(by_reason.tolist()) if n),
+        **common
+    )
+
+
+def group_p(df, mapped_props=None, columns=None, failures=None, facts=None):
+    """
+    Optional Data - GTIN/EAN/UPC Check Digit Checks
+    Pentru EAN / UPC / GTIN: lungime permisă (check_digits.GTIN_LENGTHS),
+    doar cifre și cifra de control GS1 mod 10 corectă.
+    - ⏭️ Skip dacă nu e mapat, coloana lipsește sau nu are date
+    - ❌ Fail cu numărul de celule care pică, pe motive, primul exemplu și
+      primele MAX_CELL_RANGES intervale de celule (Check Fail Cell References);
+      toate celulele: failures / all_failures
+    - ✅ Pass altfel
+    """
+    mapped = set(mapped_props or [])
+    # statisticile văd df-ul cu duplicate; prima apariție, ca după dedup
+    if facts is None:
+        facts = ColumnFacts(df, columns)
+    if not df.columns.is_unique:
+        df = df.loc[:, ~df.columns.duplicated()]
+
+    results = []
+    for prop, lengths in GTIN_LENGTHS.items():
+        check_name = f"{prop} Check Digit"
+        common = {
+            "Check Fail Count": 0,
+            "Check Fail Example": "",
+            "Check Fail Example Cell Reference": "",
+            "Check Fail Cell References": ""
+        }
+        if mapped and prop not in mapped:
+            results.append(report_check(check_name, "⏭️ Skip", Explanation="Not mapped", **common))
+            continue
+        if prop not in df.columns:
+            results.append(report_check(check_name, "⏭️ Skip", Explanation="Column missing", **common))
+            continue
+        if facts.blank(prop, check_name)[0] == facts.n:
+            results.append(report_check(check_name, "⏭️ Skip", Explanation="No data present", **common))
+            continue
+
+        rows, reasons, example = facts.codes(prop, lengths, check_name)
+        letter = get_column_letter(df.columns.get_loc(prop) + 1)
+        if failures is not None:
+            failures.add(check_name, prop, letter, rows)
+        results.append(check_digit_report(prop, letter, rows, reasons, example))
+    return results
+
+
+def group_o(df, mapped_props=None, columns=None, failures=None, facts=None):
     """
     Optional Data - Category Data Checks
     Pentru 'Category' și 'Sub-Category':
@@ -1922,7 +2149,6 @@ def group_o(df, mapped_props=None):
         • sau conține '<' ori '>'
     - ✅ Pass altfel
     """
-    props = ["Category", "Sub-Category"]
     mapped = set(mapped_props or [])
     results = []
 
@@ -1931,8 +2157,10 @@ def group_o(df, mapped_props=None):
         ws = df.active
         data = list(ws.values)
         df = pd.DataFrame(data[1:], columns=data[0])
+    if facts is None:
+        facts = ColumnFacts(df, columns)
 
-    for prop in props:
+    for prop in CATEGORY_PROPS:
         check_name = f"{prop} Data Checks"
         common = {
             "Check Fail Count": 0,
@@ -1963,13 +2191,7 @@ def group_o(df, mapped_props=None):
             continue
         
         # 4) Column present but completely empty → Skip
-        series = (
-            df[col]
-            .fillna("")         # înlocuiește NaN cu ""
-            .astype(str)        # forțează string
-            .map(trim_val)      # taie spații
-        )
-        if series.eq("").all():
+        if facts.blank(col, check_name)[0] == facts.n:
             results.append(report_check(
                 check_name,
                 "⏭️ Skip",
@@ -1978,12 +2200,14 @@ def group_o(df, mapped_props=None):
             ))
             continue
 
-        # 4) Parcurgem valorile și raportăm prima eroare
+        # 4) Toate rândurile cu >75 caractere sau '<' / '>' (vectorizat);
+        #    raportul păstrează doar prima eroare, ca înainte
+        offending, first_row, _, first_text, rows = facts.limit(
+            col, LimitSpec(col, CATEGORY_MAX_LEN, CATEGORY_FORBIDDEN), check_name
+        )
         fails = []
-        for idx, text in series.items():  # folosim series cu trim
-            if len(text) > 75 or re.search(r"[<>]", text):
-                fails.append((idx + 2, text))
-                break
+        if offending:
+            fails.append((first_row, first_text))
 
         common["Check Fail Count"] = len(fails)
         if fails:
@@ -1996,7 +2220,9 @@ def group_o(df, mapped_props=None):
             else:
                 snippet = example[:25]
 
-            letter = get_column_letter(df.columns.get_loc(col) + 1)
+            letter = get_column_letter(_position(df, col) + 1)
+            if failures is not None:
+                failures.add(check_name, col, letter, rows)
             common["Check Fail Example"] = snippet
             common["Check Fail Example Cell Reference"] = f"{letter}{row}"
             explanation = "Too long (>75)" if len(example) > 75 else "Contains prohibited char"
@@ -0,0 +1,579 @@
+"""
+Citire în flux (streaming) a foilor .xlsx direct din arhiva zip.
+
+Nu construiește obiecte Cell openpyxl: xl/worksheets/sheetN.xml este
+parcurs cu expat în blocuri, iar xl/sharedStrings.xml cu iterparse.
+Fiecare rând este emis imediat după ce a fost convertit, așa că memoria
+folosită de parser este limitată la rândurile dintr-un bloc de 64 KB
+(plus tabela de shared strings).
+
+Valorile sunt convertite la text la fel ca pd.read_excel(dtype=str):
+numerele întregi fără ".0", datele ca "YYYY-MM-DD HH:MM:SS", booleenii
+ca "True"/"False", iar celulele goale / valorile NA ("", "NA", "#N/A"...)
+devin None.
+"""
+import posixpath
+import re
+import zipfile
+from xml.etree.ElementTree import iterparse
+from xml.parsers.expat import ParserCreate
+
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils import column_index_from_string, coordinate_to_tuple, get_column_letter
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# aceleași valori pe care pd.read_excel le tratează implicit ca NaN
+NA_VALUES = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+])
+
+SHEET_NAMESPACES = (
+    "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
+    "http://purl.oclc.org/ooxml/spreadsheetml/main",
+)
+
+_DIGITS = "0123456789"
+_BLOCK_SIZE = 1 << 16
+
+
+def _ns(tag):
+    """Prefixul de namespace '{...}' al unui tag (sau "" dacă nu are)."""
+    return tag[:tag.index("}") + 1] if tag.startswith("{") else ""
+
+
+def _number_to_text(raw):
+    """Număr din XML → text, ca openpyxl + pandas (1.0 → "1", 2.5 → "2.5")."""
+    if "." in raw or "E" in raw or "e" in raw:
+        val = float(raw)
+        if val.is_integer():
+            return str(int(val))
+        return str(val)
+    return str(int(raw))
+
+
+def _cast_number(raw):
+    if "." in raw or "E" in raw or "e" in raw:
+        return float(raw)
+    return int(raw)
+
+
+_HYPERLINK_FORMULA = re.compile(r'^\s*=?\s*HYPERLINK\(\s*"((?:[^"]|"")*)"', re.IGNORECASE)
+
+
+def hyperlink_formula_target(formula):
+    """
+    URL-ul din =HYPERLINK("url", "text") sau None dacă primul argument
+    nu e un șir literal (ex. referință de celulă).
+    """
+    m = _HYPERLINK_FORMULA.match(formula)
+    return m.group(1).replace('""', '"') if m else None
+
+
+def _split_ref(ref):
+    letters = ref.rstrip(_DIGITS)
+    return letters, int(ref[len(letters):])
+
+
+def _expand_range(ref):
+    """'B2' → ['B2']; 'B2:C3' → ['B2', 'B3', 'C2', 'C3']."""
+    ref = ref.replace("$", "")
+    if ":" not in ref:
+        return [ref] if ref else []
+    start, end = ref.split(":", 1)
+    c1, r1 = _split_ref(start)
+    c2, r2 = _split_ref(end)
+    cols = range(column_index_from_string(c1), column_index_from_string(c2) + 1)
+    return [f"{get_column_letter(c)}{r}" for c in cols for r in range(r1, r2 + 1)]
+
+
+class HyperlinkIndex:
+    """
+    Indexul compact al hyperlink-urilor unei foi: {literă coloană: {rând: target}}.
+
+    Înlocuiește accesul ws[cell_ref].hyperlink / ws._hyperlinks: verificările
+    de URL caută după (coloană, rând) fără un workbook openpyxl încărcat.
+    """
+
+    def __init__(self, columns=None):
+        self._columns = columns or {}
+
+    def add(self, col_letter, row, target):
+        self._columns.setdefault(col_letter, {})[row] = target
+
+    def add_ref(self, cell_ref, target):
+        letter, row = _split_ref(cell_ref)
+        self.add(letter, row, target)
+
+    def lookup(self, col_letter, row):
+        return self._columns.get(col_letter, {}).get(row)
+
+    def get(self, cell_ref, default=None):
+        letter, row = _split_ref(cell_ref)
+        target = self.lookup(letter, row)
+        return default if target is None else target
+
+    def column(self, col_letter):
+        """{rând: target} pentru o coloană (dict gol dacă nu are link-uri)."""
+        return self._columns.get(col_letter, {})
+
+    def items(self):
+        for letter, rows in self._columns.items():
+            for row, target in rows.items():
+                yield f"{letter}{row}", target
+
+    def __len__(self):
+        return sum(len(rows) for rows in self._columns.values())
+
+    def to_dict(self):
+        """Forma serializabilă JSON (cheile rândurilor ca text)."""
+        return {letter: {str(r): t for r, t in rows.items()} for letter, rows in self._columns.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls({letter: {int(r): t for r, t in rows.items()} for letter, rows in (data or {}).items()})
+
+
+class XlsxStream:
+    """
+    Deschide arhiva .xlsx și expune foile pentru citire în flux.
+
+    Folosire:
+        with XlsxStream(path) as xs:
+            reader = xs.sheet("Catalog")
+            for row_number, cells in reader.rows():
+                ...
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        self._shared_strings = None
+        self._date_styles = None
+        self._timedelta_styles = set()
+        self.epoch = CALENDAR_WINDOWS_1900
+        self.sheets = self._read_workbook()
+        self.sheetnames = [name for name, _ in self.sheets]
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── workbook.xml + rels ─────────────────────────────────────────────
+    def _read_rels(self, part):
+        """{rId: (target_path, target_mode)} pentru relațiile unei părți."""
+        folder, name = posixpath.split(part)
+        rels_part = posixpath.join(folder, "_rels", name + ".rels")
+        if rels_part not in self._zip.namelist():
+            return {}
+        rels = {}
+        with self._zip.open(rels_part) as fh:
+            for _, el in iterparse(fh):
+                if el.tag.endswith("Relationship"):
+                    target = el.get("Target", "")
+                    mode = el.get("TargetMode")
+                    if mode != "External":
+                        if target.startswith("/"):
+                            target = target.lstrip("/")
+                        else:
+                            target = posixpath.normpath(posixpath.join(folder, target))
+                    rels[el.get("Id")] = (target, mode)
+        return rels
+
+    def _read_workbook(self):
+        """[(nume foaie, cale xml)] în ordinea din workbook.xml."""
+        rels = self._read_rels("xl/workbook.xml")
+        sheets = []
+        with self._zip.open("xl/workbook.xml") as fh:
+            for _, el in iterparse(fh):
+                local = el.tag.rsplit("}", 1)[-1]
+                if local == "workbookPr" and el.get("date1904") in ("1", "true"):
+                    self.epoch = CALENDAR_MAC_1904
+                elif local == "sheet":
+                    rid = el.get(f"{{{REL_NS}}}id") or el.get("id")
+                    target = rels.get(rid, ("", None))[0]
+                    sheets.append((el.get("name"), target))
+        return sheets
+
+    def sheet_part(self, sheet_name):
+        for name, part in self.sheets:
+            if name == sheet_name:
+                return part
+        raise KeyError(f"Worksheet {sheet_name} does not exist.")
+
+    # ── sharedStrings.xml + styles.xml ──────────────────────────────────
+    @property
+    def shared_strings(self):
+        if self._shared_strings is None:
+            self._shared_strings = self._read_shared_strings()
+        return self._shared_strings
+
+    def _read_shared_strings(self):
+        part = "xl/sharedStrings.xml"
+        if part not in self._zip.namelist():
+            return []
+        strings = []
+        with self._zip.open(part) as fh:
+            ns = None
+            for event, el in iterparse(fh, events=("start", "end")):
+                if ns is None:
+                    ns = _ns(el.tag)
+                    si_tag, t_tag, r_tag = ns + "si", ns + "t", ns + "r"
+                if event == "end" and el.tag == si_tag:
+                    # textul simplu <t> + rich text <r><t>, fără <rPh> (fonetic)
+                    parts = []
+                    for child in el:
+                        if child.tag == t_tag:
+                            parts.append(child.text or "")
+                        elif child.tag == r_tag:
+                            for t in child.iter(t_tag):
+                                parts.append(t.text or "")
+                    strings.append("".join(parts).replace("x005F_", ""))
+                    el.clear()
+        return strings
+
+    @property
+    def date_styles(self):
+        if self._date_styles is None:
+            self._read_styles()
+        return self._date_styles
+
+    def _read_styles(self):
+        """Indexul stilurilor (cellXfs) care formatează numerele ca date / durate."""
+        self._date_styles = set()
+        part = "xl/styles.xml"
+        if part not in self._zip.namelist():
+            return
+        custom = {}
+        xf_formats = []
+        in_cell_xfs = False
+        with self._zip.open(part) as fh:
+            for event, el in iterparse(fh, events=("start", "end")):
+                local = el.tag.rsplit("}", 1)[-1]
+                if local == "cellXfs":
+                    in_cell_xfs = event == "start"
+                elif event == "end" and local == "numFmt":
+                    custom[int(el.get("numFmtId"))] = el.get("formatCode", "")
+                elif event == "end" and local == "xf" and in_cell_xfs:
+                    xf_formats.append(int(el.get("numFmtId", 0)))
+        for idx, fmt_id in enumerate(xf_formats):
+            fmt = custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id, "General"))
+            if is_date_format(fmt):
+                self._date_styles.add(idx)
+            if is_timedelta_format(fmt):
+                self._timedelta_styles.add(idx)
+
+    # ── foi ─────────────────────────────────────────────────────────────
+    def sheet_dimension(self, sheet_name):
+        """
+        Ref-ul <dimension> al foii (ex. "A1:N65001"), citit fără a parcurge
+        datele: ne oprim la <dimension> sau, dacă lipsește, la <sheetData>.
+        """
+        with self._zip.open(self.sheet_part(sheet_name)) as fh:
+            for _, el in iterparse(fh, events=("start",)):
+                local = el.tag.rsplit("}", 1)[-1]
+                if local == "dimension":
+                    return el.get("ref", "")
+                if local == "sheetData":
+                    break
+        return ""
+
+    def open_part(self, part):
+        return self._zip.open(part)
+
+    def has_part(self, part):
+        try:
+            self._zip.getinfo(part)
+        except KeyError:
+            return False
+        return True
+
+    def sheet(self, sheet_name):
+        return SheetReader(self, sheet_name)
+
+
+def dimension_size(ref):
+    """
+    (rânduri, coloane) estimate dintr-un ref de tip "A1:N65001" sau "B3".
+    (None, None) dacă ref-ul lipsește.
+    """
+    if not ref:
+        return None, None
+    start, _, end = ref.partition(":")
+    end = end or start
+    try:
+        min_col, min_row = coordinate_to_tuple(start)[::-1]
+        max_col, max_row = coordinate_to_tuple(end)[::-1]
+    except (ValueError, TypeError):
+        return None, None
+    return max_row - min_row + 1, max_col - min_col + 1
+
+
+def probe_sheets(path):
+    """
+    Metadatele foilor fără a încărca workbook-ul: citește doar xl/workbook.xml
+    și ref-ul <dimension> din capul fiecărei foi.
+
+    Returnează [{"name", "dimension", "rows", "cols"}] în ordinea foilor;
+    "rows"/"cols" sunt None dacă foaia nu are <dimension>.
+    """
+    sheets = []
+    with XlsxStream(path) as xs:
+        for name in xs.sheetnames:
+            try:
+                ref = xs.sheet_dimension(name)
+            except KeyError:
+                ref = ""
+            rows, cols = dimension_size(ref)
+            sheets.append({"name": name, "dimension": ref, "rows": rows, "cols": cols})
+    return sheets
+
+
+class SheetReader:
+    """
+    O singură trecere prin xl/worksheets/sheetN.xml.
+
+    În timpul trecerii populează și metadatele foii:
+      - dimension   : ref-ul din <dimension> (ex. "A1:N301") sau ""
+      - hidden_rows : [nr. rând Excel] pentru <row hidden="1">
+      - hidden_cols : [literă coloană] pentru <col hidden="1"> (litera lui min,
+                      ca în openpyxl.column_dimensions)
+    După trecere, hyperlinks() întoarce indexul de hyperlink-uri al foii.
+    """
+
+    def __init__(self, stream, sheet_name):
+        self.stream = stream
+        self.sheet_name = sheet_name
+        self.part = stream.sheet_part(sheet_name)
+        self.dimension = ""
+        self.hidden_rows = []
+        self.hidden_cols = []
+        self._letters = {}
+        self._hyperlink_elements = []   # (ref, r:id) din <hyperlinks>
+        self._formula_links = []        # (col_index, row, url) din =HYPERLINK(...)
+
+    def _column_index(self, ref):
+        letters = ref.rstrip(_DIGITS)
+        idx = self._letters.get(letters)
+        if idx is None:
+            idx = self._letters[letters] = column_index_from_string(letters)
+        return idx
+
+    def _cell_text(self, data_type, style, value):
+        """Valoarea unei celule <c>, convertită la text (None pentru gol/NA/eroare)."""
+        if not value:
+            return None
+        if data_type == "n":
+            if style and int(style) in self.stream.date_styles:
+                try:
+                    return str(from_excel(
+                        _cast_number(value), self.stream.epoch,
+                        timedelta=int(style) in self.stream._timedelta_styles
+                    ))
+                except (OverflowError, ValueError):
+                    return None
+            return _number_to_text(value)
+        if data_type == "s":
+            value = self.stream.shared_strings[int(value)]
+        elif data_type == "b":
+            return "True" if int(value) else "False"
+        elif data_type == "e":
+            return None
+        elif data_type == "d":
+            return str(from_ISO8601(value))
+        return None if value in NA_VALUES else value
+
+    def rows(self):
+        """
+        Generator (row_number, [(col_index, text), ...]) pentru fiecare <row>,
+        în ordinea din fișier. Se emit doar celulele cu valoare (col_index e 1-based).
+
+        XML-ul e parcurs cu expat, în blocuri de 64 KB, fără a construi elemente:
+        în memorie sunt doar rândurile din blocul curent.
+        """
+        kinds = {}
+        for ns in SHEET_NAMESPACES:
+            kinds.update({
+                f"{ns}}}row": "row", f"{ns}}}c": "c", f"{ns}}}v": "v", f"{ns}}}is": "is",
+                f"{ns}}}t": "t", f"{ns}}}col": "col", f"{ns}}}dimension": "dimension",
+                f"{ns}}}f": "f", f"{ns}}}hyperlink": "hyperlink",
+            })
+        rel_id = f"{REL_NS}}}id"
+
+        done = []          # rânduri complete, încă neemise
+        row = [0, None]    # [row_number, cells]
+        cell = [None, "n", None, None, None]   # [ref, t, s, value, formula]
+        formula = [None, None]             # [t, si] pentru <f> curent
+        shared_links = {}                  # si → URL din formula master HYPERLINK()
+        col_counter = [0]
+        text = [None]      # bucăți de text pentru <v>/<t> curent
+        inline = [None]    # bucăți <t> dintr-un <is>
+        cell_text = self._cell_text
+        column_index = self._column_index
+        hidden_rows = self.hidden_rows
+
+        def start(tag, attrs):
+            kind = kinds.get(tag)
+            if kind is None:
+                return
+            if kind == "c":
+                cell[0] = attrs.get("r")
+                cell[1] = attrs.get("t", "n")
+                cell[2] = attrs.get("s")
+                cell[3] = None
+                cell[4] = None
+            elif kind == "v" or kind == "t":
+                text[0] = []
+            elif kind == "f":
+                text[0] = []
+                formula[0] = attrs.get("t")
+                formula[1] = attrs.get("si")
+            elif kind == "is":
+                inline[0] = []
+            elif kind == "row":
+                r = attrs.get("r")
+                row[0] = int(r) if r else row[0] + 1
+                row[1] = []
+                col_counter[0] = 0
+                if attrs.get("hidden") in ("1", "true"):
+                    hidden_rows.append(row[0])
+            elif kind == "col":
+                if attrs.get("hidden") in ("1", "true"):
+                    self.hidden_cols.append(get_column_letter(int(attrs["min"])))
+            elif kind == "dimension":
+                self.dimension = attrs.get("ref", "")
+            elif kind == "hyperlink":
+                self._hyperlink_elements.append((attrs.get("ref", ""), attrs.get(rel_id)))
+
+        def data(chunk):
+            if text[0] is not None:
+                text[0].append(chunk)
+
+        def end(tag):
+            kind = kinds.get(tag)
+            if kind is None:
+                return
+            if kind == "v":
+                cell[3] = "".join(text[0])
+                text[0] = None
+            elif kind == "t":
+                if inline[0] is not None:
+                    inline[0].append("".join(text[0]))
+                text[0] = None
+            elif kind == "is":
+                cell[3] = "".join(inline[0])
+                inline[0] = None
+            elif kind == "f":
+                cell[4] = "".join(text[0])
+                text[0] = None
+            elif kind == "c":
+                ref = cell[0]
+                col = column_index(ref) if ref else col_counter[0] + 1
+                col_counter[0] = col
+                if cell[4] is not None:
+                    url = None
+                    if cell[4]:
+                        url = hyperlink_formula_target(cell[4])
+                        if formula[0] == "shared":
+                            shared_links[formula[1]] = url
+                    elif formula[0] == "shared":
+                        url = shared_links.get(formula[1])
+                    if url is not None:
+                        self._formula_links.append((col, row[0], url))
+                if cell[1] == "inlineStr":
+                    value = cell[3]
+                    value = None if value is None or value in NA_VALUES else value
+                else:
+                    value = cell_text(cell[1], cell[2], cell[3])
+                if value is not None:
+                    row[1].append((col, value))
+            elif kind == "row":
+                done.append((row[0], row[1]))
+                row[1] = None
+
+        parser = ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = data
+
+        with self.stream.open_part(self.part) as fh:
+            while True:
+                block = fh.read(_BLOCK_SIZE)
+                parser.Parse(block, not block)
+                if done:
+                    yield from done
+                    done.clear()
+                if not block:
+                    break
+
+    def hyperlinks(self):
+        """
+        HyperlinkIndex pentru foaie, disponibil după ce rows() a fost parcurs:
+          1) <hyperlink ref=".." r:id=".."> rezolvate prin sheetN.xml.rels
+             (link-urile interne, doar cu location, nu au target – ca în openpyxl)
+          2) formulele =HYPERLINK("url", ...) pe celulele fără <hyperlink>
+        """
+        index = HyperlinkIndex()
+        rels = self.stream._read_rels(self.part) if self._hyperlink_elements else {}
+        for ref, rid in self._hyperlink_elements:
+            if not rid or rid not in rels:
+                continue
+            target = rels[rid][0]
+            for cell_ref in _expand_range(ref):
+                index.add_ref(cell_ref, target)
+        for col, row, url in self._formula_links:
+            letter = get_column_letter(col)
+            if index.lookup(letter, row) is None:
+                index.add(letter, row, url)
+        return index
+
+    def iter_column_chunks(self, chunk_rows=10000, min_row=2):
+        """
+        Generator de blocuri pe coloane: (row_numbers, {col_index: [text|None, ...]}),
+        fiecare bloc având cel mult chunk_rows rânduri consecutive. Listele de
+        coloane sunt aliniate cu row_numbers (None unde celula lipsește).
+
+        Rândurile sunt cele din CatalogLoader.load_sheet: de la min_row până la
+        ultimul rând cu date, inclusiv rândurile goale sau lipsă dintre ele.
+        Rândul 1 (header-ul) e păstrat în self.header {col_index: text}.
+        """
+        self.header = {}
+        row_numbers = []
+        columns = {}
+        last = min_row - 1      # ultimul rând emis (sau de dinaintea primului)
+
+        def add_row(row_number, cells):
+            pos = len(row_numbers)
+            row_numbers.append(row_number)
+            for col, text in cells:
+                col_values = columns.get(col)
+                if col_values is None:
+                    col_values = columns[col] = [None] * pos
+                col_values.append(text)
+            for col_values in columns.values():
+                if len(col_values) == pos:
+                    col_values.append(None)
+
+        for row_number, cells in self.rows():
+            if row_number == 1:
+                self.header = dict(cells)
+            if row_number < min_row or not cells:
+                continue
+            # rândurile goale dintre două rânduri cu date rămân în bloc
+            for gap in range(last + 1, row_number + 1):
+                add_row(gap, cells if gap == row_number else ())
+                if len(row_numbers) >= chunk_rows:
+                    yield row_numbers, columns
+                    row_numbers, columns = [], {}
+            last = row_number
+        if row_numbers:
+            yield row_numbers, columns